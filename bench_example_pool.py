@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for process-pool example generation.
+
+Usage: python3 bench_example_pool.py [--scale N] [--jobs 1 2 4 8]
+
+Replicates the real corpus N times (one distinct word per copy) and times
+generate_examples() at each worker count, checking every parallel run
+against the serial output.
+"""
+import argparse
+import os
+import time
+
+from example_pool import generate_examples
+from example_rules import COMPREHENSIVE_RULES
+from word_content import load_word_content
+
+
+def build_records(scale):
+    entries = [e for e in load_word_content('data/wordContent.ts') if e.categories]
+    return [
+        (f"{entry.word}{copy}" if copy else entry.word, entry.definition, entry.categories, entry.examples)
+        for copy in range(scale)
+        for entry in entries
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=200, help='corpus copies (default: 200)')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, 8], help='worker counts to time')
+    args = parser.parse_args()
+
+    records = build_records(args.scale)
+    print(f"{len(records)} words on {os.cpu_count()} CPUs\n")
+    print(f"{'jobs':>4}{'seconds':>10}{'words/s':>12}{'speedup':>10}")
+
+    baseline = baseline_time = None
+    for jobs in args.jobs:
+        start = time.perf_counter()
+        result = generate_examples(records, COMPREHENSIVE_RULES, jobs=jobs)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, baseline_time = result, elapsed
+        elif list(result.items()) != list(baseline.items()):
+            raise SystemExit(f"✗ --jobs {jobs} output differs from --jobs {args.jobs[0]}")
+        print(f"{jobs:>4}{elapsed:>10.3f}{len(records) / elapsed:>12,.0f}{baseline_time / elapsed:>9.1f}x")
+
+    print("\n✓ Every worker count produced identical, identically ordered output")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark the per-pair rule cascade against the compiled rule engine.
+
+Usage: python3 bench_example_rules.py [--scale N]
+
+The real corpus is replicated N times (words get a numeric suffix, so every
+copy is a distinct word with the same definition text and categories) and
+every (word, category) pair is run through both engines. Outputs are
+compared pair by pair before any timing is reported.
+"""
+import argparse
+import time
+
+from example_rules import ALL_EXAMPLES_RULES, COMPREHENSIVE_RULES, V2_RULES
+from word_content import load_word_content
+
+
+def build_pairs(scale):
+    entries = [e for e in load_word_content('data/wordContent.ts') if e.categories]
+    pairs = []
+    for copy in range(scale):
+        for entry in entries:
+            word = f"{entry.word}{copy}" if copy else entry.word
+            for category in entry.categories:
+                pairs.append((word, entry.definition, category))
+    return pairs
+
+
+def run(generate, pairs):
+    start = time.perf_counter()
+    results = [generate(word, definition, category) for word, definition, category in pairs]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=100, help='corpus copies (default: 100)')
+    args = parser.parse_args()
+
+    pairs = build_pairs(args.scale)
+    print(f"{len(pairs)} (word, category) pairs, {len({p[2] for p in pairs})} distinct categories\n")
+    print(f"{'rule set':<16}{'cascade pairs/s':>18}{'compiled pairs/s':>18}{'speedup':>10}")
+
+    for rules in (ALL_EXAMPLES_RULES, V2_RULES, COMPREHENSIVE_RULES):
+        before, before_time = run(rules.cascade, pairs)
+        # Compile time is counted against the compiled engine.
+        start = time.perf_counter()
+        compiled = rules.compile()
+        compile_time = time.perf_counter() - start
+        after, after_time = run(compiled.generate, pairs)
+        after_time += compile_time
+
+        if before != after:
+            mismatch = next(i for i, (a, b) in enumerate(zip(before, after)) if a != b)
+            raise SystemExit(f"✗ {rules.name}: outputs differ at pair {pairs[mismatch]}")
+
+        print(f"{rules.name:<16}{len(pairs) / before_time:>18,.0f}"
+              f"{len(pairs) / after_time:>18,.0f}{before_time / after_time:>9.1f}x")
+
+    print("\n✓ Compiled output identical to the cascade for every pair")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Benchmark harness for the content pipeline on synthetic corpora.
+
+Usage: python3 bench_pipeline.py [--sizes 1000 10000 100000] [--stages ...]
+                                 [--timeout SECONDS] [--output results.json]
+
+For every corpus size a valid wordContent.ts is synthesized from the real
+entries (same clusters and categories, escaped quotes, about half the
+anchors carrying an `examples` block) and cached under .content-cache/bench.
+Each stage then runs in its own subprocess so peak RSS is per stage:
+
+  parse          word_content.iter_word_content over the whole file
+  generate       compiled generate_context_aware_example for every pair
+  template_fill  generate_examples.fill_templates
+  emit           ts_emitter.write_word_anchor_examples
+  inject         inject_examples.inject_examples (one-pass splice injector)
+
+Results are printed (or written) as JSON: items and items/s, wall and CPU
+seconds, RSS before and at peak, and a second tracemalloc pass for the
+peak traced bytes and the net number of allocated blocks.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from build_manifest import CACHE_DIR
+from word_content import encode_string, load_word_content
+
+BENCH_DIR = os.path.join(CACHE_DIR, 'bench')
+STAGES = ('parse', 'generate', 'template_fill', 'emit', 'inject')
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def _entry_source(entry, word, categories, definition, examples):
+    exercise = entry.exercise or {}
+    lines = [
+        "  {",
+        f"    word: {encode_string(word)},",
+        f"    cluster: {encode_string(entry.cluster)},",
+        f"    definition: {encode_string(definition)},",
+        "    exercise: {",
+        f"      question: {encode_string(exercise.get('question', ''))},",
+        "      options: [",
+        ",\n".join(
+            f"        {{ id: {encode_string(option['id'])}, text: {encode_string(option['text'])} }}"
+            for option in exercise.get('options', [])),
+        "      ],",
+        f"      correctAnswer: {encode_string(exercise.get('correctAnswer', 'A'))},",
+        f"      explanation: {encode_string(exercise.get('explanation', ''))}",
+        "    },",
+        "    anchor: {",
+        f"      prompt: {encode_string(entry.anchor.prompt)},",
+        f"      categories: [{', '.join(encode_string(c) for c in categories)}]" + (',' if examples else ''),
+    ]
+    if examples:
+        lines.append("      examples: {")
+        lines.append(",\n".join(f"        {encode_string(c)}: {encode_string(e)}" for c, e in examples.items()))
+        lines.append("      }")
+    lines.append("    }")
+    lines.append("  }")
+    return "\n".join(lines)
+
+
+def synthesize_corpus(path, size, seed=0):
+    """Write a `size`-entry wordContent.ts modelled on the real corpus."""
+    rng = random.Random(seed)
+    prototypes = [e for e in load_word_content('data/wordContent.ts') if e.anchor and e.exercise]
+    category_pool = sorted({c for e in prototypes for c in e.categories})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("export interface WordContent {\n  word: string;\n  cluster: string;\n  definition: string;\n}\n\n")
+        f.write("export const wordDatabase: WordContent[] = [\n")
+        for i in range(size):
+            entry = prototypes[i % len(prototypes)]
+            word = entry.word if i < len(prototypes) else f"{entry.word}{i}"
+            categories = list(entry.categories)
+            if rng.random() < 0.3:
+                categories[rng.randrange(len(categories))] = rng.choice(category_pool)
+                categories = list(dict.fromkeys(categories))
+            definition = entry.definition
+            if rng.random() < 0.1:
+                definition += " It's what people mean when they say it's \"right\"."
+            examples = None
+            if rng.random() < 0.5:
+                examples = {c: f"When {word} comes up in {c.lower()}, it's memorable" for c in categories}
+            f.write(_entry_source(entry, word, categories, definition, examples))
+            f.write(",\n\n" if i + 1 < size else "\n")
+        f.write("];\n")
+
+
+def corpus_path(size, seed=0):
+    path = os.path.join(BENCH_DIR, f"wordContent-{size}-{seed}.ts")
+    if not os.path.exists(path):
+        synthesize_corpus(path, size, seed)
+    return path
+
+
+def _prepare(stage, path):
+    """Return (callable, item count) for a stage, doing all setup up front."""
+    from word_content import iter_word_content, read_source
+
+    data = read_source(path)
+    if stage == 'parse':
+        return (lambda: list(iter_word_content(data))), data.count(b"\n    word: ")
+
+    entries = list(iter_word_content(data))
+    pairs = [(e.word, e.definition, c) for e in entries for c in e.categories]
+
+    if stage == 'generate':
+        from example_rules import COMPREHENSIVE_RULES
+
+        def generate():
+            compiled = COMPREHENSIVE_RULES.compile()
+            return [compiled.generate(w, d, c) for w, d, c in pairs]
+        return generate, len(pairs)
+
+    from generate_examples import extract_word_categories, fill_templates
+    if stage == 'template_fill':
+        return (lambda: fill_templates(extract_word_categories(entries))), len(pairs)
+
+    word_examples = fill_templates(extract_word_categories(entries))
+    if stage == 'emit':
+        from ts_emitter import write_word_anchor_examples
+        target = os.path.join(BENCH_DIR, 'emit-output')
+        flat = {word: data['examples'] for word, data in word_examples.items()}
+        clusters = {entry.word: entry.cluster for entry in entries}
+        return (lambda: write_word_anchor_examples(flat, clusters, target, publish=False)), len(flat)
+    if stage == 'inject':
+        from inject_examples import inject_examples
+        return (lambda: inject_examples(data, word_examples)), len(word_examples)
+    raise ValueError(f"unknown stage {stage!r}")
+
+
+def measure_stage(stage, path, allocations=True):
+    """Run one stage in this process and return its measurements."""
+    run, items = _prepare(stage, path)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+    result = {
+        'items': items,
+        'seconds': round(seconds, 6),
+        'cpu_seconds': round(cpu_seconds, 6),
+        'items_per_sec': round(items / seconds, 1) if seconds else None,
+        'rss_before_kb': rss_before,
+        'rss_peak_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    if allocations:
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        output = run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['traced_peak_bytes'] = peak
+        result['allocated_blocks'] = sys.getallocatedblocks() - blocks_before
+        del output
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='corpus sizes in entries (1000000 works but writes a ~1.5 GB corpus)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=300, help='per-stage limit in seconds (default: 300)')
+    parser.add_argument('--no-allocations', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--run-stage', nargs=2, metavar=('STAGE', 'CORPUS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        stage, path = args.run_stage
+        print(json.dumps(measure_stage(stage, path, allocations=not args.no_allocations)))
+        return
+
+    results = []
+    for size in args.sizes:
+        path = corpus_path(size, args.seed)
+        for stage in args.stages:
+            command = [sys.executable, os.path.abspath(__file__), '--run-stage', stage, path]
+            if args.no_allocations:
+                command.append('--no-allocations')
+            record = {'size': size, 'stage': stage, 'corpus_bytes': os.path.getsize(path)}
+            try:
+                proc = subprocess.run(command, capture_output=True, text=True, timeout=args.timeout)
+            except subprocess.TimeoutExpired:
+                record['status'] = 'timeout'
+            else:
+                if proc.returncode == 0:
+                    record.update(json.loads(proc.stdout.splitlines()[-1]), status='ok')
+                else:
+                    record.update(status='error', error=proc.stderr.strip().splitlines()[-1:])
+            print(f"{size:>9} {stage:<14} {record['status']:<8} {record.get('items_per_sec') or '-':>14} items/s",
+                  file=sys.stderr)
+            results.append(record)
+
+    report = json.dumps({'python': sys.version.split()[0], 'seed': args.seed, 'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
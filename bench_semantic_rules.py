@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark the compiled rule cascade against semantic branch selection.
+
+Usage: python3 bench_semantic_rules.py [--scale N] [--source PATH] [--threshold 0.5]
+
+Pairs come from the real corpus replicated N times (as in
+bench_example_rules.py) or from --source, e.g. a generated benchmark corpus
+under .content-cache/bench/. For each rule set the compiled cascade runs
+pair by pair, and SemanticRules is fit and scores every pair at once; the
+semantic time includes fitting and formatting every example. Every pair
+the cascade settles with a keyword branch must come out identical from
+the semantic engine before any timing is reported; the semantic-only
+column shows how often free scoring agrees with those literal hits.
+"""
+import argparse
+import time
+
+from example_rules import ALL_EXAMPLES_RULES, COMPREHENSIVE_RULES, V2_RULES
+from semantic_rules import DEFAULT_THRESHOLD, SemanticRules, np
+from word_content import load_word_content
+
+
+def build_records(source, scale):
+    entries = [e for e in load_word_content(source) if e.categories]
+    records = []
+    for copy in range(scale):
+        for entry in entries:
+            word = f"{entry.word}{copy}" if copy else entry.word
+            records.append((word, entry.definition, list(dict.fromkeys(entry.categories))))
+    # A word's last record wins, as in generation.
+    return list({word: (word, definition, categories) for word, definition, categories in records}.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=100, help='corpus copies (default: 100)')
+    parser.add_argument('--source', default='data/wordContent.ts')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+    if np is None:
+        parser.error('numpy is required (pip install numpy)')
+
+    records = build_records(args.source, args.scale if args.source == 'data/wordContent.ts' else 1)
+    pairs = sum(len(categories) for _, _, categories in records)
+    print(f"{pairs} (word, category) pairs, {len({c for _, _, cs in records for c in cs})} distinct categories\n")
+    print(f"{'rule set':<16}{'cascade pairs/s':>18}{'semantic pairs/s':>18}"
+          f"{'default':>10}{'→':>3}{'semantic':>10}{'semantic-only agrees':>22}")
+
+    for rules in (ALL_EXAMPLES_RULES, V2_RULES, COMPREHENSIVE_RULES):
+        compiled = rules.compile()
+        start = time.perf_counter()
+        cascade = {word: {category: compiled.generate(word, definition, category) for category in categories}
+                   for word, definition, categories in records}
+        cascade_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine = SemanticRules(rules, records, threshold=args.threshold)
+        semantic = engine.generate_all()
+        semantic_time = time.perf_counter() - start
+
+        words, categories = engine.pairs()
+        chosen, _, literal = engine.choose(words, categories)
+        hits = literal >= 0
+        names = list(engine.category_ids)
+        for i in np.flatnonzero(hits):
+            word, category = engine.words[words[i]], names[categories[i]]
+            if semantic[word][category] != cascade[word][category]:
+                raise SystemExit(f"✗ {rules.name}: literal hit changed for {word} / {category}")
+        free, _, _ = engine.choose(words, categories, literal=False)
+        agree = (free[hits] == literal[hits]).mean() if hits.any() else 1.0
+
+        print(f"{rules.name:<16}{pairs / cascade_time:>18,.0f}{pairs / semantic_time:>18,.0f}"
+              f"{(~hits).mean():>10.1%}{'':>3}{(chosen < 0).mean():>10.1%}{agree:>22.1%}")
+
+    print("\n✓ Every literal cascade hit kept by the semantic engine")
+
+
+if __name__ == '__main__':
+    main()
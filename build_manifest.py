@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Content-hashed build manifest for incremental example generation.
+
+The manifest remembers, per word, a digest of every source block that
+contributed to it and the examples generated from those blocks, together
+with the rule-set version they were generated under and a digest of the
+output file that was last written. A rerun only regenerates words whose
+digest changed, and skips the write when the output would be identical.
+"""
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+CACHE_DIR = '.content-cache'
+FORMAT_VERSION = 1
+
+
+def file_digest(path):
+    """sha1 of a file's contents, or None when it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def combine_digests(digests):
+    """One digest over a {file name: sha1} mapping."""
+    combined = hashlib.sha1()
+    for name in sorted(digests):
+        combined.update(f"{name}\0{digests[name]}\n".encode('utf-8'))
+    return combined.hexdigest()
+
+
+def tree_digest(directory):
+    """combine_digests() over the .ts modules in `directory`, or None."""
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith('.ts')]
+    except FileNotFoundError:
+        return None
+    return combine_digests({name: file_digest(os.path.join(directory, name)) for name in names})
+
+
+def word_digests(entries, source, spans=None):
+    """Digest of the source blocks of every word, in source order.
+
+    A word that appears in several blocks gets one digest over all of them,
+    since later blocks override earlier ones during generation. `spans`
+    gives each entry's current (start, end) when its own offsets are stale.
+    """
+    hashers = defaultdict(hashlib.sha1)
+    view = memoryview(source)
+    if spans is None:
+        spans = ((entry.start, entry.end) for entry in entries)
+    for entry, (start, end) in zip(entries, spans):
+        hashers[entry.word].update(view[start:end])
+    return {word: hasher.hexdigest() for word, hasher in hashers.items()}
+
+
+class BuildManifest:
+    """Per-word digests and generated examples from the previous build."""
+
+    def __init__(self, path, rules_version):
+        self.path = path
+        self.rules_version = rules_version
+        self.entries = {}
+        self.output_digest = None
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path, rules_version):
+        manifest = cls(path, rules_version)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return manifest
+        # A different rule set or manifest format invalidates every entry.
+        if data.get('format') == FORMAT_VERSION and data.get('rules') == rules_version:
+            manifest.entries = data.get('entries', {})
+            manifest.output_digest = data.get('output')
+        return manifest
+
+    def cached(self, word, digest):
+        """Examples generated for `word` last time, if its source is unchanged."""
+        entry = self.entries.get(word)
+        if entry is not None and entry['digest'] == digest:
+            return entry['examples']
+        return None
+
+    def update(self, word, digest, examples):
+        self.entries[word] = {'digest': digest, 'examples': examples}
+        self.dirty = True
+
+    def retain(self, words):
+        """Drop words that no longer exist in the source."""
+        stale = self.entries.keys() - set(words)
+        for word in stale:
+            del self.entries[word]
+        self.dirty = self.dirty or bool(stale)
+
+    def output_current(self, output_path):
+        """True when the output on disk (a file or a directory of modules)
+        is the one this manifest describes."""
+        if self.output_digest is None:
+            return False
+        if os.path.isdir(output_path):
+            return tree_digest(output_path) == self.output_digest
+        return file_digest(output_path) == self.output_digest
+
+    def save(self, output_digest):
+        self.output_digest = output_digest
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'format': FORMAT_VERSION,
+                'rules': self.rules_version,
+                'output': output_digest,
+                'entries': self.entries,
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
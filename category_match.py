@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Fuzzy category names through a character-trigram index.
+
+Usage: python3 category_match.py CATEGORY [...] [--threshold 0.7]
+       (resolves against generate_examples.py's templates and scenarios)
+
+Every known name is cut into padded character trigrams ('  t', ' te',
+'tea', ...) of its normalized form, and each trigram keeps a posting list
+of the names that contain it. A query only visits the postings of its own
+trigrams, counting shared trigrams per candidate, so its cost depends on
+how many names share trigrams with it rather than on how many names there
+are. Similarity is the Dice coefficient of the two trigram sets, and the
+best candidate at or above the threshold wins, ties going to the name
+registered first.
+
+CategoryResolver caches the answer per distinct category, so resolving
+every word × category pair costs one index query per unique category.
+"""
+import argparse
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+from corpus_index import normalize
+
+DEFAULT_THRESHOLD = 0.7
+
+
+def trigrams(name: str) -> set:
+    """Padded character trigrams of a normalized name."""
+    padded = f"  {normalize(name)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Trigram postings over a fixed list of names."""
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(dict.fromkeys(names))
+        self.sizes = array('I')
+        self.postings: Dict[str, array] = {}
+        self._exact: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            grams = trigrams(name)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, array('I')).append(i)
+            self._exact.setdefault(normalize(name), i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def nearest(self, name: str, threshold: float = DEFAULT_THRESHOLD) -> Tuple[Optional[str], float]:
+        """(closest name, similarity), or (None, best similarity) below `threshold`."""
+        exact = self._exact.get(normalize(name))
+        if exact is not None:
+            return self.names[exact], 1.0
+        grams = trigrams(name)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for i in self.postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        best, best_score = None, 0.0
+        size = len(grams)
+        sizes = self.sizes
+        for i, count in shared.items():
+            score = 2 * count / (size + sizes[i])
+            if score > best_score or (score == best_score and i < best):
+                best, best_score = i, score
+        if best is None or best_score < threshold:
+            return None, best_score
+        return self.names[best], best_score
+
+
+class CategoryResolver:
+    """Maps categories to the nearest known name, once per distinct category."""
+
+    def __init__(self, names: Iterable[str], threshold: float = DEFAULT_THRESHOLD):
+        self.index = TrigramIndex(names)
+        self.threshold = threshold
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def resolve(self, category: str) -> Optional[str]:
+        try:
+            return self._cache[category]
+        except KeyError:
+            match = self._cache[category] = self.index.nearest(category, self.threshold)[0]
+            return match
+
+    def __len__(self) -> int:
+        """Distinct categories resolved so far."""
+        return len(self._cache)
+
+
+def main():
+    from generate_examples import template_resolver
+
+    parser = argparse.ArgumentParser(description='Resolve categories to the nearest example template')
+    parser.add_argument('categories', nargs='+')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    index = template_resolver().index
+    for category in args.categories:
+        match, score = index.nearest(category, 0.0)
+        verdict = '✓' if match is not None and score >= args.threshold else '✗'
+        print(f"{verdict} {category} → {match} ({score:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@ import { useState, useEffect, useMemo } from 'react';
 import { motion } from 'framer-motion';
 import { wordDatabase, WordContent } from '@/data/wordContent';
 import { SessionProgressBar } from '@/components/SessionProgressBar';
-import wordAnchorExamples from '@/lib/wordAnchorExamples';
+import { loadAnchorExamples, type AnchorExamples } from '@/lib/wordAnchorExamples';
 
 interface SessionFlowProps {
   selectedWordNames: string[];
@@ -442,6 +442,23 @@ export function SessionFlow({ selectedWordNames, onComplete }: SessionFlowProps)
     return shuffleOptions(currentWord.exercise.options, currentWord.exercise.correctAnswer);
   }, [currentWord]);
 
+  // Load this word's generated anchor examples (only its cluster's shard is fetched)
+  const [generatedExamples, setGeneratedExamples] = useState<AnchorExamples | undefined>(undefined);
+  useEffect(() => {
+    if (!currentWord) return;
+    let cancelled = false;
+    setGeneratedExamples(undefined);
+    loadAnchorExamples(currentWord.word).then((examples) => {
+      if (!cancelled) setGeneratedExamples(examples);
+    }).catch(() => {
+      // Shard chunk failed to load: fall back to the category examples
+      if (!cancelled) setGeneratedExamples(undefined);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [currentWord]);
+
   // Auto-retry after wrong answer (Step 2)
   useEffect(() => {
     if (step === 2 && selectedAnswer !== null) {
@@ -704,8 +721,8 @@ export function SessionFlow({ selectedWordNames, onComplete }: SessionFlowProps)
                     <p className="text-base text-stone-700 italic">&quot;{
                       // First try word-specific examples
                       currentWord.anchor?.examples?.[anchorCategory] ||
-                      // Then try from the mapping file
-                      wordAnchorExamples[currentWord.word]?.[anchorCategory] ||
+                      // Then try the generated examples for this word's cluster
+                      generatedExamples?.[anchorCategory] ||
                       // Finally fall back to category metadata
                       selectedCategoryData.example
                     }&quot;</p>
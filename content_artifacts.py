@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Content-addressed JSON artifacts in public/ with precompressed variants.
+
+Each anchor example shard is written as public/content/<name>.<hash>.json
+next to .json.gz and .json.br variants, and public/content/manifest.json
+maps every name to its current path, ETag, sizes and encodings. File names
+change whenever the content does, so the files themselves are served with
+long-lived immutable caching (next.config.ts) and only the small manifest
+needs revalidating; lib/wordAnchorExamples/index.ts looks shards up in the
+manifest and fetches them from there.
+
+Publishing needs the `brotli` module (pip install brotli) and fails
+without it, so the published variants never depend on what happens to be
+installed; writing the default tree with --no-publish withdraws the anchor
+artifacts instead, and the app falls back to its bundled chunks. An artifact whose hash is already on disk is not rewritten or
+recompressed. The artifacts ship with the build that references them, so
+the files of a replaced version are removed.
+"""
+import gzip
+import hashlib
+import json
+import os
+
+from ts_emitter import ANCHOR_ARTIFACT_PREFIX, CONTENT_URL_PREFIX, atomic_write
+
+try:
+    import brotli
+except ImportError:  # required for publishing; ArtifactWriter reports it
+    brotli = None
+
+ARTIFACT_DIR = 'public/content'
+URL_PREFIX = CONTENT_URL_PREFIX
+MANIFEST_NAME = 'manifest.json'
+ANCHOR_PREFIX = ANCHOR_ARTIFACT_PREFIX
+HASH_LENGTH = 12
+
+
+class ArtifactError(RuntimeError):
+    """Artifacts cannot be published in this environment."""
+
+
+def _compressors():
+    return {
+        'gzip': ('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0)),
+        'br': ('.br', lambda data: brotli.compress(data, quality=11)),
+    }
+
+
+def _write_bytes(path, data):
+    with atomic_write(path) as out:
+        out.write_bytes(data)
+
+
+class ArtifactWriter:
+    """Publishes named JSON artifacts and keeps manifest.json in step."""
+
+    def __init__(self, directory=ARTIFACT_DIR, url_prefix=URL_PREFIX):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.manifest = {}
+        self._original = json.dumps(self.manifest, sort_keys=True)
+        self.stats = {'written': 0, 'unchanged': 0, 'compressed': 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.save()
+
+    def add(self, name, data):
+        """Publish `data` as JSON under `name`; returns its manifest entry."""
+        if brotli is None:
+            raise ArtifactError("publishing content artifacts needs brotli (pip install brotli); "
+                                "pass --no-publish to skip them")
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha1(payload).hexdigest()
+        filename = f"{name}.{digest[:HASH_LENGTH]}.json"
+        path = os.path.join(self.directory, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if os.path.exists(path):
+            self.stats['unchanged'] += 1
+        else:
+            _write_bytes(path, payload)
+            self.stats['written'] += 1
+        encodings = {}
+        for encoding, (suffix, compress) in _compressors().items():
+            variant = path + suffix
+            if not os.path.exists(variant):
+                _write_bytes(variant, compress(payload))
+                self.stats['compressed'] += 1
+            encodings[encoding] = {'path': self._url(filename + suffix), 'bytes': os.path.getsize(variant)}
+
+        self.manifest[name] = {
+            'path': self._url(filename),
+            'etag': f'"{digest}"',
+            'bytes': len(payload),
+            'encodings': encodings,
+        }
+        self._prune(name, keep={os.path.basename(filename)})
+        return self.manifest[name]
+
+    def retain(self, prefix, names):
+        """Drop manifest entries under `prefix` that are not in `names`."""
+        for name in [n for n in self.manifest if n.startswith(prefix) and n not in names]:
+            del self.manifest[name]
+            self._prune(name, keep=set())
+
+    def _url(self, filename):
+        return f"{self.url_prefix}/{filename}"
+
+    def _prune(self, name, keep):
+        directory, base = os.path.split(os.path.join(self.directory, name))
+        if not os.path.isdir(directory):
+            return
+        for filename in os.listdir(directory):
+            stem = filename.split('.json')[0]
+            if stem.rsplit('.', 1)[0] == base and stem + '.json' not in keep:
+                os.unlink(os.path.join(directory, filename))
+
+    def save(self):
+        """Write manifest.json if anything in it changed."""
+        if json.dumps(self.manifest, sort_keys=True) == self._original:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        with atomic_write(self.manifest_path) as out:
+            out.write(json.dumps(self.manifest, indent=2, sort_keys=True) + "\n")
+        self._original = json.dumps(self.manifest, sort_keys=True)
+        return True
+
+
+def publish_anchor_examples(shards, directory=ARTIFACT_DIR, names=None):
+    """Publish {shard: {word: {category: example}}} as one artifact per shard.
+
+    `names` is every shard that still exists when `shards` only holds the
+    changed ones; other anchor artifacts are dropped.
+    """
+    with ArtifactWriter(directory) as writer:
+        for shard, examples in shards.items():
+            writer.add(ANCHOR_PREFIX + shard, examples)
+        writer.retain(ANCHOR_PREFIX, {ANCHOR_PREFIX + shard for shard in (shards if names is None else names)})
+    return writer.stats
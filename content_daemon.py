@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""Warm content daemon: generate, lookup and inject over a local socket.
+
+Usage: python3 content_daemon.py [--port 3998 | --unix PATH] [--source PATH]
+                                 [--scenarios PATH ... | --no-scenarios]
+
+Keeps the parsed corpus, the compiled rule sets and the corpus index in
+memory and answers JSON requests over HTTP on localhost, or over a Unix
+socket with --unix, so editor tooling and the Next.js dev server get an
+example for one word/category pair in milliseconds instead of paying
+Python startup, a file read, a parse and rule compilation per call.
+
+  GET  /health                       entries, words, source sha1, reloads
+  GET  /lookup?word=W                a word's cluster, definition, categories
+                                     and authored examples
+  GET  /lookup?category=C&cluster=K&token=T...   words matching a query
+  POST /generate {"word", "category" | "categories", "definition"?, "rules"?}
+  POST /inject   {"word", "examples", "overwrite"?, "write"?}
+
+/generate prefers an authored example unless "authored": false, then a
+scenario from update_examples.txt unless "scenarios": false, then the
+rules; `definition` is only needed for words not in the corpus. /inject returns the splice it
+would make to data/wordContent.ts and applies it only with "write": true.
+
+Before each request the source is stat()ed; when its size or mtime moved,
+it is re-read and only the changed blocks are re-parsed (content_watch's
+IncrementalCorpus), and the index is rebuilt on the next query that
+needs it. The scenario files are re-read the same way.
+
+  curl -s localhost:3998/generate -d '{"word": "candor", "category": "Work"}'
+  curl -s --unix-socket /tmp/content.sock 'http://x/lookup?word=candor'
+"""
+import argparse
+import hashlib
+import json
+import os
+import socketserver
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from content_watch import IncrementalCorpus
+from corpus_index import CorpusIndex
+from example_rules import COMPREHENSIVE_RULES, RULE_SETS
+from inject_examples import iter_spliced, plan_splices
+from scenarios import ScenarioMap, default_scenario_paths
+from ts_emitter import atomic_write
+from word_content import WORD_CONTENT_PATH, ParseError
+
+DEFAULT_PORT = 3998
+
+
+class RequestError(ValueError):
+    """A bad request; answered with its message and a 4xx status."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+_KINDS = {str: 'a string', bool: 'true or false', list: 'a list', dict: 'an object'}
+
+
+def _field(body, name, kind, default=None):
+    """body[name] checked to be a `kind`; `default` when absent or null."""
+    value = body.get(name)
+    if value is None:
+        return default
+    if not isinstance(value, kind):
+        raise RequestError(f"'{name}' must be {_KINDS[kind]}")
+    return value
+
+
+def _stat(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class _Scenarios:
+    """Scenario files, re-read when one of their stat fingerprints moves."""
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.fingerprint = None
+        self.map = None
+
+    def refresh(self):
+        if not self.paths:
+            return
+        fingerprint = [_stat(path) for path in self.paths]
+        if fingerprint != self.fingerprint:
+            self.map = ScenarioMap.load(self.paths)
+            self.fingerprint = fingerprint
+
+
+class ContentState:
+    """The warm corpus, rules and index, reloaded when the source changes."""
+
+    def __init__(self, path=WORD_CONTENT_PATH, scenario_paths=()):
+        self.path = path
+        self.scenarios = _Scenarios(scenario_paths)
+        self.scenarios.refresh()
+        self.lock = threading.RLock()
+        self.corpus = IncrementalCorpus(path)
+        self.fingerprint = _stat(path)
+        self.sha1 = hashlib.sha1(self.corpus.source).hexdigest()
+        self.compiled = {}
+        self._index = None
+        self._entries = None
+        self.reloads = 0
+        self.last_error = None
+
+    def rules(self, name):
+        compiled = self.compiled.get(name)
+        if compiled is None:
+            if name not in RULE_SETS:
+                raise RequestError(f"unknown rules {name!r}; expected one of {', '.join(RULE_SETS)}")
+            compiled = self.compiled[name] = RULE_SETS[name].compile()
+        return compiled
+
+    def refresh(self):
+        """Re-parse the changed blocks if the source's stat fingerprint moved."""
+        try:
+            self.scenarios.refresh()
+        except OSError as err:
+            self.last_error = str(err)
+        try:
+            fingerprint = _stat(self.path)
+            if fingerprint == self.fingerprint:
+                return set()
+            changed = self.corpus.reload()
+        except (OSError, ParseError) as err:
+            # Mid-edit or mid-rename; keep serving the last good parse.
+            self.last_error = str(err)
+            return set()
+        self.fingerprint = fingerprint
+        self.sha1 = hashlib.sha1(self.corpus.source).hexdigest()
+        self.last_error = None
+        self.reloads += 1
+        # Entries without categories and spans can change with no record
+        # changing, so any successful reload invalidates the index.
+        self._index = self._entries = None
+        return changed
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = CorpusIndex.from_entries(self.corpus.entries)
+            self._index.freeze()
+        return self._index
+
+    @property
+    def entries(self):
+        """{word: its last entry}, including words without categories."""
+        if self._entries is None:
+            self._entries = {entry.word: entry for entry in self.corpus.entries}
+        return self._entries
+
+    def health(self):
+        return {
+            'source': self.path,
+            'sha1': self.sha1,
+            'entries': len(self.corpus.entries),
+            'words': len(self.corpus.records),
+            'reloads': self.reloads,
+            'last_parse': self.corpus.last_parse,
+            'scenarios': len(self.scenarios.map) if self.scenarios.map is not None else 0,
+            'error': self.last_error,
+        }
+
+    def lookup(self, params):
+        word = params.get('word')
+        if word:
+            record = self.corpus.records.get(word[0])
+            if record is None:
+                entry = self.entries.get(word[0])
+                if entry is None:
+                    raise RequestError(f"unknown word {word[0]!r}", 404)
+                record = entry.cluster, entry.definition, entry.categories, entry.examples or {}
+            cluster, definition, categories, authored = record
+            return {'word': word[0], 'cluster': cluster, 'definition': definition,
+                    'categories': list(categories), 'examples': authored}
+        category = params.get('category', [None])[0]
+        cluster = params.get('cluster', [None])[0]
+        tokens = params.get('token', [])
+        index = self.index
+        words = list(dict.fromkeys(index.words[i] for i in index.query(category, cluster, tokens)))
+        return {'count': len(words), 'words': words}
+
+    def generate(self, body):
+        word = _field(body, 'word', str)
+        if not word:
+            raise RequestError("'word' is required")
+        category = _field(body, 'category', str)
+        categories = _field(body, 'categories', list)
+        if categories is not None and not all(isinstance(c, str) and c for c in categories):
+            raise RequestError("'categories' must be a list of non-empty strings")
+        categories = categories or ([category] if category else None)
+        if not categories:
+            raise RequestError("'category' or 'categories' is required")
+        compiled = self.rules(_field(body, 'rules', str, COMPREHENSIVE_RULES.name))
+        record = self.corpus.records.get(word)
+        definition = _field(body, 'definition', str)
+        if definition is None:
+            if record is None:
+                raise RequestError(f"unknown word {word!r}; pass its 'definition'", 404)
+            definition = record[1]
+        authored = record[3] if record is not None and _field(body, 'authored', bool, True) else {}
+        scenarios = self.scenarios.map if _field(body, 'scenarios', bool, True) else None
+        examples = {}
+        sources = {}
+        for category in categories:
+            scenario = scenarios.get(category) if scenarios is not None else None
+            if category in authored:
+                examples[category], sources[category] = authored[category], 'authored'
+            elif scenario is not None:
+                examples[category], sources[category] = scenario, 'scenario'
+            else:
+                examples[category], sources[category] = compiled.generate(word, definition, category), 'rules'
+        if 'category' in body and 'categories' not in body:
+            category = categories[0]
+            return {'word': word, 'category': category, 'example': examples[category], 'source': sources[category]}
+        return {'word': word, 'examples': examples, 'sources': sources}
+
+    def inject(self, body):
+        word = _field(body, 'word', str)
+        examples = _field(body, 'examples', dict)
+        if not word or not examples:
+            raise RequestError("'word' and a non-empty 'examples' object are required")
+        if not all(isinstance(example, str) for example in examples.values()):
+            raise RequestError("'examples' values must be strings")
+        overwrite = _field(body, 'overwrite', bool, False)
+        write = _field(body, 'write', bool, False)
+        if word not in self.corpus.records:
+            raise RequestError(f"unknown word {word!r}", 404)
+        source = self.corpus.source
+        splices = list(plan_splices(source, {word: {'examples': examples}}, overwrite))
+        result = {'word': word, 'changed': bool(splices),
+                  'splices': [{'start': start, 'end': end, 'text': text} for start, end, text in splices]}
+        if splices and write:
+            with atomic_write(self.path) as out:
+                for chunk in iter_spliced(source, splices):
+                    out.write_bytes(chunk)
+            self.refresh()
+            result['written'] = True
+        return result
+
+
+def _json_body(raw):
+    try:
+        body = json.loads(raw) if raw else {}
+    except ValueError as err:
+        raise RequestError(f"bad JSON body: {err}")
+    if not isinstance(body, dict):
+        raise RequestError("the body must be a JSON object")
+    return body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def address_string(self):
+        # Unix socket peers have no (host, port).
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method, raw=b''):
+        url = urlparse(self.path)
+        routes = {
+            ('GET', '/health'): lambda: state.health(),
+            ('GET', '/lookup'): lambda: state.lookup(parse_qs(url.query)),
+            ('POST', '/generate'): lambda: state.generate(_json_body(raw)),
+            ('POST', '/inject'): lambda: state.inject(_json_body(raw)),
+        }
+        state = self.server.state
+        route = routes.get((method, url.path))
+        try:
+            if route is None:
+                raise RequestError(f"no route {method} {url.path}", 404)
+            start = time.perf_counter()
+            with state.lock:
+                state.refresh()
+                payload = route()
+            payload['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            self._reply(200, payload)
+        except RequestError as err:
+            self._reply(err.status, {'error': str(err)})
+        except Exception:
+            # A bug rather than a bad request: log it and still answer.
+            traceback.print_exc()
+            self._reply(500, {'error': 'internal error'})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        # Read the body up front, even for unknown routes, so the next
+        # request on a kept-alive connection starts where it should.
+        self._handle('POST', self.rfile.read(int(self.headers.get('Content-Length', 0))))
+
+
+class ContentDaemon(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, state, address=('127.0.0.1', DEFAULT_PORT), verbose=False):
+        super().__init__(address, _Handler)
+        self.state = state
+        self.verbose = verbose
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class UnixContentDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, state, path, verbose=False):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _Handler)
+        self.state = state
+        self.verbose = verbose
+
+    @property
+    def url(self):
+        return f"unix:{self.server_address}"
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve generate/lookup/inject from a warm corpus')
+    parser.add_argument('--source', default=WORD_CONTENT_PATH)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', metavar='PATH', help='listen on a Unix socket instead of TCP')
+    parser.add_argument('--scenarios', action='append', metavar='PATH',
+                        help='"Category → scenario" file to serve from (repeatable; default: update_examples.txt)')
+    parser.add_argument('--no-scenarios', action='store_true')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    state = ContentState(args.source, [] if args.no_scenarios else args.scenarios or default_scenario_paths())
+    state.rules(COMPREHENSIVE_RULES.name)
+    if args.unix:
+        server = UnixContentDaemon(state, args.unix, args.verbose)
+    else:
+        server = ContentDaemon(state, (args.host, args.port), args.verbose)
+    print(f"✓ {len(state.corpus.records)} words warm in {time.perf_counter() - start:.2f}s; "
+          f"listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
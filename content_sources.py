@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Load every word source in data/ at once and join them by word.
+
+Usage: python3 content_sources.py [--jobs N] [--json PATH] [--limit 20]
+
+data/ holds overlapping word lists in two layouts: wordContent.ts (and the
+drifted wordContent.ts.new) with one top-level object per word, and
+vocabulary.ts / vocabulary-enhanced.ts with words nested under cluster
+objects and extra fields such as cognitiveWeight and contextTags. All of
+them go through word_content's parser; the largest file is parsed in this
+process while a process pool parses the rest.
+
+Each source becomes a hash index keyed by the normalized word (a later
+block for the same word replaces an earlier one, as in generation), and
+the indexes are joined in one pass over their keys into a MergedWord per
+word, whose fields come from the first source in SOURCES order that has
+them. The drift report lists words missing from some sources, clusters
+that disagree, definitions that differ and words repeated within a source.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from corpus_index import normalize
+from ts_emitter import atomic_write
+from word_content import WORD_CONTENT_PATH, TsObject, iter_cluster_words, read_source
+
+# Earlier sources win when merged fields disagree.
+SOURCES = (
+    ('wordContent', WORD_CONTENT_PATH),
+    ('vocabulary', 'data/vocabulary.ts'),
+    ('vocabulary-enhanced', 'data/vocabulary-enhanced.ts'),
+    ('wordContent.new', 'data/wordContent.ts.new'),
+)
+
+DEFAULT_LIMIT = 20
+
+
+def _plain(value):
+    """Parsed TS values as plain dicts and lists (TsObject carries spans)."""
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+@dataclass
+class SourceWord:
+    source: str
+    word: str
+    cluster: str
+    definition: str
+    start: int
+    end: int
+    fields: Dict[str, object] = field(default_factory=dict, repr=False)
+
+
+def parse_source(name, data):
+    """SourceWord records for one source's bytes, in source order."""
+    records = []
+    for cluster, obj in iter_cluster_words(data):
+        cluster_name = obj.get('cluster')
+        if not cluster_name and isinstance(cluster, TsObject):
+            cluster_name = cluster.get('name') or cluster.get('id')
+        records.append(SourceWord(
+            source=name,
+            word=obj['word'],
+            cluster=cluster_name or '',
+            definition=obj.get('definition', ''),
+            start=obj.start,
+            end=obj.end,
+            fields={key: _plain(value) for key, value in obj.items()
+                    if key not in ('word', 'cluster', 'definition')},
+        ))
+    return records
+
+
+def _parse_path(item):
+    name, path = item
+    return parse_source(name, read_source(path))
+
+
+def load_sources(sources=SOURCES, jobs=None):
+    """{source name: [SourceWord]} for every source file that exists."""
+    present = [(name, path) for name, path in sources if os.path.exists(path)]
+    if jobs is None:
+        jobs = min(len(present), os.cpu_count() or 1)
+    if jobs <= 1 or len(present) < 2:
+        return {name: _parse_path((name, path)) for name, path in present}
+
+    # The largest file is parsed here, so its records are never pickled;
+    # the pool parses the others meanwhile.
+    largest = max(present, key=lambda item: os.path.getsize(item[1]))
+    rest = [item for item in present if item is not largest]
+    with multiprocessing.Pool(min(jobs - 1, len(rest)) or 1) as pool:
+        pending = pool.map_async(_parse_path, rest)
+        parsed = {largest[0]: _parse_path(largest)}
+        parsed.update(zip((name for name, _ in rest), pending.get()))
+    return {name: parsed[name] for name, _ in present}
+
+
+@dataclass
+class MergedWord:
+    """One word across sources; `sources` is in SOURCES order."""
+    key: str
+    sources: Dict[str, SourceWord]
+
+    def _first(self, attribute):
+        for record in self.sources.values():
+            value = getattr(record, attribute)
+            if value:
+                return value
+        return ''
+
+    @property
+    def word(self) -> str:
+        return self._first('word')
+
+    @property
+    def cluster(self) -> str:
+        return self._first('cluster')
+
+    @property
+    def definition(self) -> str:
+        return self._first('definition')
+
+    def get(self, name, default=None):
+        """A source-specific field (cognitiveWeight, contextTags, difficulty, anchor, ...)."""
+        for record in self.sources.values():
+            value = record.fields.get(name)
+            if value is not None:
+                return value
+        return default
+
+    @property
+    def categories(self) -> List[str]:
+        anchor = self.get('anchor') or {}
+        return list(anchor.get('categories') or [])
+
+
+def index_source(records):
+    """({normalized word: last SourceWord}, {normalized word: block count})."""
+    index, counts = {}, {}
+    for record in records:
+        key = normalize(record.word)
+        index[key] = record
+        counts[key] = counts.get(key, 0) + 1
+    return index, counts
+
+
+@dataclass
+class DriftReport:
+    sources: List[str]
+    words: int
+    missing: Dict[str, List[str]]
+    cluster_conflicts: List[dict]
+    definition_conflicts: List[dict]
+    duplicates: Dict[str, Dict[str, int]]
+
+    def to_json(self):
+        return {
+            'sources': self.sources,
+            'words': self.words,
+            'missing': self.missing,
+            'cluster_conflicts': self.cluster_conflicts,
+            'definition_conflicts': self.definition_conflicts,
+            'duplicates': self.duplicates,
+        }
+
+
+def _text_key(text):
+    return ' '.join(text.split())
+
+
+def join_sources(parsed):
+    """Hash-join parsed sources into ({normalized word: MergedWord}, DriftReport)."""
+    names = list(parsed)
+    indexes, duplicates = {}, {}
+    for name in names:
+        indexes[name], counts = index_source(parsed[name])
+        repeated = {key: count for key, count in counts.items() if count > 1}
+        if repeated:
+            duplicates[name] = dict(sorted(repeated.items()))
+
+    merged = {}
+    missing = {name: [] for name in names}
+    cluster_conflicts, definition_conflicts = [], []
+    for key in dict.fromkeys(key for name in names for key in indexes[name]):
+        records = {}
+        for name in names:
+            record = indexes[name].get(key)
+            if record is None:
+                missing[name].append(key)
+            else:
+                records[name] = record
+        merged[key] = MergedWord(key, records)
+
+        if len(records) > 1:
+            clusters = {name: record.cluster for name, record in records.items() if record.cluster}
+            if len({normalize(cluster) for cluster in clusters.values()}) > 1:
+                cluster_conflicts.append({'word': key, 'clusters': clusters})
+            definitions = {name: record.definition for name, record in records.items() if record.definition}
+            if len({_text_key(definition) for definition in definitions.values()}) > 1:
+                definition_conflicts.append({'word': key, 'definitions': definitions})
+
+    report = DriftReport(
+        sources=names,
+        words=len(merged),
+        missing={name: sorted(keys) for name, keys in missing.items()},
+        cluster_conflicts=cluster_conflicts,
+        definition_conflicts=definition_conflicts,
+        duplicates=duplicates,
+    )
+    return merged, report
+
+
+def load_merged(sources=SOURCES, jobs=None):
+    """({normalized word: MergedWord}, DriftReport) over every source."""
+    return join_sources(load_sources(sources, jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Join every word source in data/ and report drift between them')
+    parser.add_argument('--jobs', type=int, default=None, metavar='N',
+                        help='parse sources in N processes (default: one per source, 1 = serial)')
+    parser.add_argument('--json', metavar='PATH', help='write the full drift report as JSON')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='words listed per section (0 = all)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    parsed = load_sources(jobs=args.jobs)
+    loaded = time.perf_counter()
+    merged, report = join_sources(parsed)
+    joined = time.perf_counter()
+
+    for name, records in parsed.items():
+        print(f"✓ {name}: {len(records)} entries")
+    print(f"Joined {report.words} words in {(joined - loaded) * 1000:.1f} ms "
+          f"(parse {(loaded - start) * 1000:.0f} ms)")
+
+    def listed(items):
+        return items if args.limit <= 0 else items[:args.limit]
+
+    print("\nMissing words:")
+    for name, keys in report.missing.items():
+        print(f"  {name}: {len(keys)} of {report.words}")
+    print(f"\nCluster conflicts: {len(report.cluster_conflicts)}")
+    for conflict in listed(report.cluster_conflicts):
+        print(f"  {conflict['word']}: " + ', '.join(f"{name}={cluster}" for name, cluster in conflict['clusters'].items()))
+    print(f"\nDefinitions that differ: {len(report.definition_conflicts)}")
+    for conflict in listed(report.definition_conflicts):
+        groups = {}
+        for name, definition in conflict['definitions'].items():
+            groups.setdefault(_text_key(definition), []).append(name)
+        print(f"  {conflict['word']}: " + ' ≠ '.join(', '.join(names) for names in groups.values()))
+    if report.duplicates:
+        print("\nRepeated within a source:")
+        for name, repeated in report.duplicates.items():
+            print(f"  {name}: " + ', '.join(f"{key} ×{count}" for key, count in listed(list(repeated.items()))))
+
+    if args.json:
+        with atomic_write(args.json) as out:
+            out.write(json.dumps(report.to_json(), indent=2, ensure_ascii=False) + "\n")
+        print(f"\n✓ Wrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
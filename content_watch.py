@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Watch content sources and rebuild only the anchor shards an edit touches.
+
+Usage: python3 content_watch.py [--interval 0.1] [--debounce 0.15] [--no-publish]
+                                [--scenarios PATH ... | --no-scenarios]
+
+Polls data/wordContent.ts with os.stat() and waits for a burst of saves to
+settle before acting. The new file is diffed against the last one: only
+the bytes between the nearest unchanged word blocks on either side of the
+edit are re-parsed, the blocks after it are only re-positioned, and only
+words whose record actually changed are regenerated with the comprehensive
+rules. Their shard modules under lib/wordAnchorExamples/ are rewritten,
+and index.ts only when a word is added, removed or changes cluster, so the
+Next.js dev server hot-reloads one small module instead of all content.
+
+The scenario files (update_examples.txt by default) are watched too; an
+edit there regenerates only the words with a category whose scenario was
+added, changed or removed.
+
+Watching the default lib/wordAnchorExamples/ also keeps the rest of the
+build in step: rewritten shards are republished under public/content/ (see
+content_artifacts.py) and the build manifest records the words and tree
+just written, so a later generate_comprehensive_examples.py run only
+redoes what changed since.
+
+A file that does not parse mid-edit is reported and the last good state
+is kept until the next save.
+"""
+import argparse
+import bisect
+import gc
+import os
+import time
+from collections import defaultdict
+
+from build_manifest import BuildManifest, tree_digest, word_digests
+from content_artifacts import publish_anchor_examples
+from example_pool import generate_word_examples
+from example_rules import COMPREHENSIVE_RULES
+from generate_comprehensive_examples import MANIFEST_PATH
+from scenarios import ScenarioMap, default_scenario_paths
+from ts_emitter import (ANCHOR_EXAMPLES_DIR, publishes, shard_name, write_anchor_index, write_anchor_shard,
+                        write_word_anchor_examples)
+from word_content import (WORD_CONTENT_PATH, ParseError, WordContent, iter_word_content, iter_word_objects_between,
+                          read_source)
+
+DEFAULT_INTERVAL = 0.1
+DEFAULT_DEBOUNCE = 0.15
+
+
+# Bytes compared per step when diffing old and new source. Slices of
+# `bytes` compare with memcmp, while memoryview comparison goes item by item.
+_CHUNK = 1 << 16
+
+
+def _common_prefix(a, b):
+    """Length of the longest common prefix of two byte strings."""
+    n = min(len(a), len(b))
+    for pos in range(0, n, _CHUNK):
+        lo, hi = pos, min(pos + _CHUNK, n)
+        if a[lo:hi] != b[lo:hi]:
+            # a[pos:lo] matches and a[lo:hi] does not; narrow to one byte.
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if a[lo:mid] == b[lo:mid]:
+                    lo = mid
+                else:
+                    hi = mid
+            return lo
+    return n
+
+
+def _common_suffix(a, b, limit):
+    """Length of the longest common suffix, at most `limit` bytes."""
+    la, lb = len(a), len(b)
+    for length in range(0, limit, _CHUNK):
+        lo, hi = length, min(length + _CHUNK, limit)
+        if a[la - hi:la - length] != b[lb - hi:lb - length]:
+            # The last `lo` bytes match and the last `hi` do not.
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if a[la - mid:la - lo] == b[lb - mid:lb - lo]:
+                    lo = mid
+                else:
+                    hi = mid
+            return lo
+    return limit
+
+
+def word_records(entries, words=None):
+    """{word: (cluster, definition, categories, authored)}, resolved the way
+    generate_comprehensive_examples.py resolves repeated words; only for
+    `words` when given."""
+    clusters, authored, latest = {}, {}, {}
+    for entry in entries:
+        word = entry.word
+        if words is not None and word not in words:
+            continue
+        clusters[word] = entry.cluster
+        if entry.examples:
+            authored[word] = entry.examples
+        if entry.categories:
+            latest[word] = entry
+    return {
+        word: (clusters[word], entry.definition, tuple(entry.categories), authored.get(word, {}))
+        for word, entry in latest.items()
+    }
+
+
+class IncrementalCorpus:
+    """wordContent.ts records kept in step with the file by partial re-parses.
+
+    `entries` keep the offsets of the parse that produced them; blocks that
+    only moved are not touched, and `starts`/`ends` hold every block's
+    current position instead.
+    """
+
+    def __init__(self, path=WORD_CONTENT_PATH):
+        self.path = path
+        self.source = read_source(path)
+        self.entries = list(iter_word_content(self.source))
+        self.starts = [entry.start for entry in self.entries]
+        self.ends = [entry.end for entry in self.entries]
+        self.records = word_records(self.entries)
+        self.last_parse = 'full'
+
+    def _splice(self, source):
+        """(entries, starts, ends, candidate words) re-parsing only the edited blocks, or None."""
+        old, entries, starts, ends = self.source, self.entries, self.starts, self.ends
+        prefix = _common_prefix(old, source)
+        suffix = _common_suffix(old, source, min(len(old), len(source)) - prefix)
+        delta = len(source) - len(old)
+        # The unchanged blocks just before and just after the edit bound the
+        # slice to re-parse, so an inserted or deleted block is caught too.
+        # An edit inside the first or last block has no neighbour on that
+        # side; the block itself is the bound then.
+        changed_end = len(old) - suffix
+        before = max(bisect.bisect_right(ends, prefix) - 1, 0)
+        after = min(bisect.bisect_left(starts, changed_end), len(entries) - 1)
+        if prefix < starts[before] or changed_end > ends[after]:
+            return None
+        start, end = starts[before], ends[after] + delta
+        try:
+            parsed = [WordContent.from_object(obj) for obj in iter_word_objects_between(source, start, end)]
+        except ParseError:
+            return None
+        if not parsed or parsed[0].start != start or parsed[-1].end != end:
+            return None
+        candidates = {entry.word for entry in entries[before:after + 1]} | {entry.word for entry in parsed}
+        return (
+            entries[:before] + parsed + entries[after + 1:],
+            starts[:before] + [entry.start for entry in parsed] + [x + delta for x in starts[after + 1:]],
+            ends[:before] + [entry.end for entry in parsed] + [x + delta for x in ends[after + 1:]],
+            candidates,
+        )
+
+    def reload(self):
+        """Re-read the file and return the words whose records changed.
+
+        Raises ParseError (keeping the previous state) if the file does not
+        parse.
+        """
+        source = read_source(self.path)
+        if source == self.source:
+            return set()
+        spliced = self._splice(source) if self.entries else None
+        if spliced is None:
+            entries = list(iter_word_content(source))
+            starts = [entry.start for entry in entries]
+            ends = [entry.end for entry in entries]
+            candidates = self.records.keys() | {entry.word for entry in entries}
+            self.last_parse = 'full'
+        else:
+            entries, starts, ends, candidates = spliced
+            self.last_parse = 'partial'
+        records = word_records(entries, candidates)
+        changed = {word for word in candidates if self.records.get(word) != records.get(word)}
+        for word in changed:
+            if word in records:
+                self.records[word] = records[word]
+            else:
+                del self.records[word]
+        self.source, self.entries, self.starts, self.ends = source, entries, starts, ends
+        return changed
+
+
+def _scenario(scenarios, category):
+    return scenarios.get(category) if scenarios is not None else None
+
+
+class LiveShards:
+    """Generated anchor examples for the current records, written shard by shard."""
+
+    def __init__(self, rules=COMPREHENSIVE_RULES, directory=ANCHOR_EXAMPLES_DIR, publish=None, scenarios=None,
+                 manifest=None):
+        self.compiled = rules.compile()
+        self.directory = directory
+        self.publish = publishes(directory) if publish is None else publish
+        self.scenarios = scenarios
+        self.manifest = manifest
+        self.examples = {}
+        self.word_shards = {}
+        self.shard_words = defaultdict(set)
+
+    def _generate(self, word, record):
+        cluster, definition, categories, authored = record
+        self.examples[word] = generate_word_examples(self.compiled, word, definition, categories, authored,
+                                                     self.scenarios)
+        shard = self.word_shards[word] = shard_name(cluster)
+        self.shard_words[shard].add(word)
+
+    def rebuild(self, records):
+        """Generate every word and write the whole tree (unchanged modules are kept)."""
+        self.examples.clear()
+        self.word_shards.clear()
+        self.shard_words.clear()
+        for word in sorted(records):
+            self._generate(word, records[word])
+        write_word_anchor_examples(self.examples, {word: records[word][0] for word in records}, self.directory,
+                                   publish=self.publish)
+
+    def set_scenarios(self, records, scenarios):
+        """Switch scenario maps; returns the words whose examples may change."""
+        old, self.scenarios = self.scenarios, scenarios
+        differs = {}
+        words = set()
+        for word, (_, _, categories, authored) in records.items():
+            for category in categories:
+                if category in authored:
+                    continue
+                if category not in differs:
+                    differs[category] = _scenario(old, category) != _scenario(scenarios, category)
+                if differs[category]:
+                    words.add(word)
+                    break
+        return words
+
+    def update(self, records, words):
+        """Regenerate `words` and rewrite only their shards; returns the shards written."""
+        touched = set()
+        moved = False
+        for word in words:
+            old_shard = self.word_shards.pop(word, None)
+            self.examples.pop(word, None)
+            if old_shard is not None:
+                self.shard_words[old_shard].discard(word)
+                touched.add(old_shard)
+            if word in records:
+                self._generate(word, records[word])
+                touched.add(self.word_shards[word])
+            moved = moved or old_shard != self.word_shards.get(word)
+
+        for shard in sorted(touched):
+            words_in_shard = sorted(self.shard_words[shard])
+            if words_in_shard:
+                write_anchor_shard(self.directory, shard, ((word, self.examples[word]) for word in words_in_shard))
+            else:
+                del self.shard_words[shard]
+                try:
+                    os.unlink(os.path.join(self.directory, f"{shard}.ts"))
+                except FileNotFoundError:
+                    pass
+        if moved:
+            write_anchor_index(self.directory, self.word_shards)
+        if self.publish and touched:
+            publish_anchor_examples(
+                {shard: {word: self.examples[word] for word in sorted(self.shard_words[shard])}
+                 for shard in touched if shard in self.shard_words},
+                names=self.shard_words.keys())
+        return sorted(touched)
+
+    def record_build(self, corpus):
+        """Bring the build manifest in line with the tree on disk, so the next
+        generate_comprehensive_examples.py run only redoes what changed since."""
+        if self.manifest is None:
+            return
+        digests = word_digests(corpus.entries, corpus.source, zip(corpus.starts, corpus.ends))
+        for word, (_, _, categories, authored) in corpus.records.items():
+            digest = digests[word]
+            if self.scenarios is not None:
+                digest = self.scenarios.digest(digest, categories, authored)
+            if self.manifest.cached(word, digest) != self.examples[word]:
+                self.manifest.update(word, digest, self.examples[word])
+        self.manifest.retain(self.examples)
+        if self.manifest.dirty or not self.manifest.output_current(self.directory):
+            self.manifest.save(tree_digest(self.directory))
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def watch_changes(paths, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE):
+    """Yield the set of `paths` that changed, once each burst of saves settles."""
+    seen = {path: _stat(path) for path in paths}
+    while True:
+        time.sleep(interval)
+        if all(_stat(path) == seen[path] for path in paths):
+            continue
+        # Editors often save in several writes (truncate, write, rename);
+        # wait until the files stop changing for a whole debounce window.
+        snapshot = {path: _stat(path) for path in paths}
+        while True:
+            time.sleep(debounce)
+            current = {path: _stat(path) for path in paths}
+            if current == snapshot:
+                break
+            snapshot = current
+        changed = {path for path in paths if snapshot[path] != seen[path]}
+        seen = snapshot
+        if changed:
+            yield changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild anchor example shards as data/wordContent.ts changes')
+    parser.add_argument('--source', default=WORD_CONTENT_PATH)
+    parser.add_argument('--output', default=ANCHOR_EXAMPLES_DIR)
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help='seconds between polls')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help='quiet period before a burst of saves is processed')
+    parser.add_argument('--no-publish', action='store_true', help='skip the public/content JSON artifacts (only published for the default --output)')
+    parser.add_argument('--scenarios', action='append', metavar='PATH',
+                        help='"Category → scenario" file to merge (repeatable; default: update_examples.txt)')
+    parser.add_argument('--no-scenarios', action='store_true')
+    args = parser.parse_args()
+    scenario_paths = [] if args.no_scenarios else args.scenarios or default_scenario_paths()
+
+    start = time.perf_counter()
+    corpus = IncrementalCorpus(args.source)
+    scenarios = ScenarioMap.load(scenario_paths) if scenario_paths else None
+    # Only the default tree is the one generate_comprehensive_examples.py builds.
+    manifest = BuildManifest.load(MANIFEST_PATH, COMPREHENSIVE_RULES.version) if publishes(args.output) else None
+    shards = LiveShards(directory=args.output, publish=False if args.no_publish else None, scenarios=scenarios,
+                        manifest=manifest)
+    shards.rebuild(corpus.records)
+    shards.record_build(corpus)
+    # The parsed corpus lives for the whole session; keep the collector from
+    # rescanning it on every burst of allocations during an update.
+    gc.freeze()
+    print(f"✓ {len(shards.examples)} words in {len(shards.shard_words)} shards "
+          f"({time.perf_counter() - start:.2f}s); watching {', '.join([args.source, *scenario_paths])}")
+
+    try:
+        for changed in watch_changes([args.source, *scenario_paths], args.interval, args.debounce):
+            start = time.perf_counter()
+            words = set()
+            reasons = []
+            if args.source in changed:
+                try:
+                    words = corpus.reload()
+                    reasons.append(f"{corpus.last_parse} parse")
+                except ParseError as err:
+                    print(f"✗ {args.source}: {err}; keeping the last good parse")
+            if changed & set(scenario_paths):
+                try:
+                    scenarios = ScenarioMap.load(scenario_paths)
+                except OSError as err:
+                    print(f"✗ {err}; keeping the last scenarios")
+                else:
+                    words |= shards.set_scenarios(corpus.records, scenarios)
+                    reasons.append(f"{len(scenarios)} scenarios")
+            if not reasons:
+                continue
+            written = shards.update(corpus.records, words)
+            shards.record_build(corpus)
+            elapsed = (time.perf_counter() - start) * 1000
+            if written:
+                print(f"✓ Regenerated {len(words)} of {len(shards.examples)} words ({', '.join(reasons)}), "
+                      f"rewrote {', '.join(written)} in {elapsed:.0f} ms")
+            else:
+                print(f"  no example changes ({', '.join(reasons)}, {elapsed:.0f} ms)")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Persistent binary cache of a parsed wordContent.ts corpus.
+
+The cache is a single file under .content-cache/ holding the parsed corpus
+as flat columns that are mmap()ed and read in place:
+
+  header       magic, format, source size / mtime_ns / sha1, parser sha1,
+               counts
+  strings      one interned pool: uint64 offsets + a UTF-8 blob; every
+               cluster and category name is stored once however many
+               words use it
+  entries      uint32 string ids for word, cluster, definition, prompt and
+               the JSON-encoded exercise; uint64 source start/end; flags
+  categories   uint32 offsets per entry into a uint32 id column
+  examples     uint32 offsets per entry into (category id, text id) columns
+
+Freshness is checked against the source's size and mtime first; if only
+the mtime moved, the content hash decides, and a stale or unreadable cache
+is rebuilt automatically. The header also records a digest of
+word_content.py, so a cache written by a different parser is rebuilt even
+when the source did not change. Columns use native byte order, so the cache is
+machine-local like the rest of .content-cache/.
+
+Records read from the cache carry no member spans; code that splices the
+source (inject_examples.py, the incremental build) parses it directly.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import word_content
+from build_manifest import CACHE_DIR
+from word_content import WORD_CONTENT_PATH, Anchor, WordContent, iter_word_content, read_source
+
+MAGIC = b'AUCC'
+FORMAT_VERSION = 2
+NONE = 0xFFFFFFFF
+
+# magic, format, source size, source mtime_ns, source sha1, parser sha1,
+# entries, strings, string bytes, category refs, example refs
+_HEADER = struct.Struct('<4sIQq20s20sQQQQQ')
+_MTIME_OFFSET = struct.calcsize('<4sIQ')
+
+_HAS_ANCHOR = 1
+_HAS_EXAMPLES = 2
+
+
+def _parser_digest():
+    with open(word_content.__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+# What the parser produces can change without the source changing.
+PARSER_SHA1 = _parser_digest()
+
+
+def cache_path_for(source_path):
+    name = source_path.replace(os.sep, '_').replace('.', '_')
+    return os.path.join(CACHE_DIR, f"corpus-{name}.bin")
+
+
+def _pad(out, written):
+    padding = -written % 8
+    out.write(b'\0' * padding)
+    return written + padding
+
+
+def build_cache(source_path, cache_path, source=None):
+    """Parse `source_path` and write its cache file; returns the source bytes."""
+    if source is None:
+        # Stat the descriptor the bytes come from, so an edit in between
+        # can never record the new size and mtime against the old content.
+        with open(source_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            source = f.read()
+        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+    else:
+        # Bytes read elsewhere: no mtime to trust, so is_fresh() compares content.
+        size, mtime_ns = len(source), -1
+
+    strings = {}
+    pool = []
+
+    def intern(value):
+        if value is None:
+            return NONE
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(pool)
+            pool.append(value.encode('utf-8'))
+        return index
+
+    columns = {name: array('I') for name in ('word', 'cluster', 'definition', 'prompt', 'exercise')}
+    starts, ends = array('Q'), array('Q')
+    flags = bytearray()
+    cat_offsets, cat_ids = array('I', [0]), array('I')
+    ex_offsets, ex_cats, ex_texts = array('I', [0]), array('I'), array('I')
+
+    for entry in iter_word_content(source):
+        columns['word'].append(intern(entry.word))
+        columns['cluster'].append(intern(entry.cluster))
+        columns['definition'].append(intern(entry.definition))
+        columns['prompt'].append(intern(entry.anchor.prompt if entry.anchor else None))
+        columns['exercise'].append(intern(
+            json.dumps(entry.exercise, separators=(',', ':')) if entry.exercise is not None else None))
+        starts.append(entry.start)
+        ends.append(entry.end)
+        flag = 0
+        if entry.anchor:
+            flag |= _HAS_ANCHOR
+            cat_ids.extend(intern(c) for c in entry.anchor.categories)
+            if entry.anchor.examples is not None:
+                flag |= _HAS_EXAMPLES
+                for category, example in entry.anchor.examples.items():
+                    ex_cats.append(intern(category))
+                    ex_texts.append(intern(example))
+        flags.append(flag)
+        cat_offsets.append(len(cat_ids))
+        ex_offsets.append(len(ex_cats))
+
+    string_offsets = array('Q', [0])
+    for data in pool:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'wb') as out:
+        out.write(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, size, mtime_ns, hashlib.sha1(source).digest(), PARSER_SHA1,
+            len(starts), len(pool), string_offsets[-1], len(cat_ids), len(ex_cats)))
+        written = _pad(out, _HEADER.size)
+        out.write(string_offsets)
+        for data in pool:
+            out.write(data)
+        written = _pad(out, written + string_offsets.itemsize * len(string_offsets) + string_offsets[-1])
+        for column in (*columns.values(), starts, ends, cat_offsets, cat_ids, ex_offsets, ex_cats, ex_texts):
+            out.write(column)
+            written = _pad(out, written + column.itemsize * len(column))
+        out.write(flags)
+    os.replace(tmp_path, cache_path)
+    return source
+
+
+class CorpusCache:
+    """Read-only view over an mmap()ed cache file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path}: truncated corpus cache")
+        (magic, version, self.source_size, self.source_mtime_ns, self.source_sha1, self.parser_sha1,
+         entries, strings, string_bytes, cat_refs, ex_refs) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path}: not a format-{FORMAT_VERSION} corpus cache")
+
+        view = memoryview(self._mmap)
+        position = -_HEADER.size % 8 + _HEADER.size
+
+        def take(length, fmt, itemsize):
+            nonlocal position
+            column = view[position:position + length * itemsize].cast(fmt)
+            position += length * itemsize
+            position += -position % 8
+            return column
+
+        self._string_offsets = take(strings + 1, 'Q', 8)
+        self._blob_start = position
+        position += string_bytes + (-(position + string_bytes) % 8)
+        self.words = take(entries, 'I', 4)
+        self.clusters = take(entries, 'I', 4)
+        self.definitions = take(entries, 'I', 4)
+        self._prompts = take(entries, 'I', 4)
+        self._exercises = take(entries, 'I', 4)
+        self._starts = take(entries, 'Q', 8)
+        self._ends = take(entries, 'Q', 8)
+        self._cat_offsets = take(entries + 1, 'I', 4)
+        self._cat_ids = take(cat_refs, 'I', 4)
+        self._ex_offsets = take(entries + 1, 'I', 4)
+        self._ex_cats = take(ex_refs, 'I', 4)
+        self._ex_texts = take(ex_refs, 'I', 4)
+        self._flags = view[position:position + entries]
+        self._strings = {}
+
+    def __len__(self):
+        return len(self.words)
+
+    def string(self, index):
+        """Decoded pool string; interned strings decode once per process."""
+        if index == NONE:
+            return None
+        value = self._strings.get(index)
+        if value is None:
+            start = self._blob_start + self._string_offsets[index]
+            end = self._blob_start + self._string_offsets[index + 1]
+            value = self._strings[index] = self._mmap[start:end].decode('utf-8')
+        return value
+
+    def is_fresh(self, source_path):
+        """True when the cache still describes `source_path` as this parser reads it."""
+        if self.parser_sha1 != PARSER_SHA1:
+            return False
+        try:
+            stat = os.stat(source_path)
+        except FileNotFoundError:
+            return False
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime_ns == self.source_mtime_ns:
+            return True
+        # Touched but maybe not changed: let the content decide, and record
+        # the new mtime so the next start takes the fast path again.
+        if hashlib.sha1(read_source(source_path)).digest() != self.source_sha1:
+            return False
+        with open(self.path, 'r+b') as f:
+            f.seek(_MTIME_OFFSET)
+            f.write(struct.pack('<q', stat.st_mtime_ns))
+        self.source_mtime_ns = stat.st_mtime_ns
+        return True
+
+    def category_ids(self, i):
+        return self._cat_ids[self._cat_offsets[i]:self._cat_offsets[i + 1]]
+
+    def categories(self, i):
+        return [self.string(c) for c in self.category_ids(i)]
+
+    def examples(self, i):
+        if not self._flags[i] & _HAS_EXAMPLES:
+            return None
+        lo, hi = self._ex_offsets[i], self._ex_offsets[i + 1]
+        return {self.string(c): self.string(t) for c, t in zip(self._ex_cats[lo:hi], self._ex_texts[lo:hi])}
+
+    def entry(self, i):
+        """Materialize entry `i` as a WordContent record (without spans)."""
+        anchor = None
+        if self._flags[i] & _HAS_ANCHOR:
+            anchor = Anchor(prompt=self.string(self._prompts[i]) or '', categories=self.categories(i),
+                            examples=self.examples(i), start=0, end=0)
+        exercise = self.string(self._exercises[i])
+        return WordContent(
+            word=self.string(self.words[i]),
+            cluster=self.string(self.clusters[i]),
+            definition=self.string(self.definitions[i]),
+            exercise=json.loads(exercise) if exercise is not None else None,
+            anchor=anchor,
+            start=self._starts[i],
+            end=self._ends[i],
+        )
+
+    def __iter__(self):
+        return (self.entry(i) for i in range(len(self)))
+
+
+def load_corpus(source_path=WORD_CONTENT_PATH, cache_path=None):
+    """Open the cache for `source_path`, rebuilding it first if stale."""
+    cache_path = cache_path or cache_path_for(source_path)
+    try:
+        cache = CorpusCache(cache_path)
+        if cache.is_fresh(source_path):
+            return cache
+    except (FileNotFoundError, ValueError):
+        pass
+    build_cache(source_path, cache_path)
+    return CorpusCache(cache_path)
+
+
+def load_word_content_cached(source_path=WORD_CONTENT_PATH):
+    """Drop-in for word_content.load_word_content() backed by the cache."""
+    return list(load_corpus(source_path))
+
+
+if __name__ == '__main__':
+    import time
+    path = sys.argv[1] if len(sys.argv) > 1 else WORD_CONTENT_PATH
+    start = time.perf_counter()
+    corpus = load_corpus(path)
+    opened = time.perf_counter() - start
+    distinct = len({c for i in range(len(corpus)) for c in corpus.category_ids(i)})
+    print(f"{len(corpus)} entries from {path} ({distinct} distinct categories)")
+    print(f"  opened {corpus.path} in {opened * 1000:.2f} ms")
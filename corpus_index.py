@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Inverted indexes over the word corpus.
+
+Usage: python3 corpus_index.py [--category NAME] [--cluster NAME]
+                               [--token WORD|PREFIX* ...] [--source PATH]
+
+Posting lists map a normalized category, a cluster and every definition
+token to the sorted ids of the entries that use them, so questions like
+"which words use Leadership" or "which definitions mention emotion" are a
+dict lookup plus a sorted-list intersection instead of a rescan of
+wordContent.ts. The index is built in the same pass that reads the corpus
+cache and is pickled next to it, keyed by the source's content hash.
+
+The rule-based generators walk `category_postings()` through
+CompiledRules.generate_grouped(), resolving each category's rule branches
+once and filling its whole posting list in one loop.
+"""
+import argparse
+import os
+import pickle
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from corpus_cache import cache_path_for, load_corpus
+from word_content import WORD_CONTENT_PATH
+
+INDEX_FORMAT = 1
+
+# Postings covering at least 1/DENSE_FRACTION of the corpus also get a
+# bitset, so intersecting common terms is one big-int AND instead of a
+# bisection per id.
+DENSE_FRACTION = 32
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def normalize(name: str) -> str:
+    """Case- and whitespace-insensitive key for categories and clusters."""
+    return ' '.join(name.casefold().split())
+
+
+def definition_tokens(definition: str) -> List[str]:
+    """Distinct lowercase tokens of a definition, in first-seen order."""
+    return list(dict.fromkeys(_TOKEN.findall(definition.casefold())))
+
+
+def _intersect(postings: List[array]) -> List[int]:
+    """Intersect sorted postings, probing the longer ones by bisection."""
+    postings = sorted(postings, key=len)
+    result = list(postings[0])
+    for posting in postings[1:]:
+        kept = []
+        lo = 0
+        for entry_id in result:
+            lo = bisect_left(posting, entry_id, lo)
+            if lo == len(posting):
+                break
+            if posting[lo] == entry_id:
+                kept.append(entry_id)
+        result = kept
+        if not result:
+            break
+    return result
+
+
+def _bitset(posting: array, size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for entry_id in posting:
+        bits[entry_id >> 3] |= 1 << (entry_id & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _bitset_ids(bits: int) -> List[int]:
+    # Reversed binary string: character i is bit i. str.find skips zero
+    # runs in C, which beats any per-byte loop in Python.
+    digits = bin(bits)[:1:-1]
+    ids = []
+    position = digits.find('1')
+    while position != -1:
+        ids.append(position)
+        position = digits.find('1', position + 1)
+    return ids
+
+
+class CorpusIndex:
+    """Entries by id plus category, cluster and definition-token postings.
+
+    Entry ids follow source order; a word defined twice gets two ids.
+    Category postings are keyed by the exact category name (so generators
+    can look templates up verbatim) and queried through `normalize()`.
+    """
+
+    def __init__(self):
+        self.words: List[str] = []
+        self.definitions: List[str] = []
+        self.categories: List[List[str]] = []
+        self.by_category: Dict[str, array] = {}
+        self.by_cluster: Dict[str, array] = {}
+        self.by_token: Dict[str, array] = {}
+        self._category_names: Dict[str, List[str]] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._bitsets: Dict[Tuple[str, str], int] = {}
+
+    def add(self, word: str, categories: Iterable[str] = (), cluster: Optional[str] = None,
+            definition: str = '', tokens: bool = True) -> int:
+        entry_id = len(self.words)
+        categories = list(categories)
+        self.words.append(word)
+        self.definitions.append(definition)
+        self.categories.append(categories)
+        for category in dict.fromkeys(categories):
+            posting = self.by_category.get(category)
+            if posting is None:
+                posting = self.by_category[category] = array('I')
+                self._category_names.setdefault(normalize(category), []).append(category)
+            posting.append(entry_id)
+        if cluster is not None:
+            self.by_cluster.setdefault(normalize(cluster), array('I')).append(entry_id)
+        for token in definition_tokens(definition) if tokens else ():
+            self.by_token.setdefault(token, array('I')).append(entry_id)
+        self._vocabulary = None
+        self._bitsets.clear()
+        return entry_id
+
+    @classmethod
+    def from_entries(cls, entries, tokens: bool = True) -> 'CorpusIndex':
+        """Index WordContent records (parsed or read from the corpus cache).
+
+        Generators that only walk category postings pass tokens=False to
+        skip tokenizing definitions.
+        """
+        index = cls()
+        for entry in entries:
+            index.add(entry.word, entry.categories, entry.cluster, entry.definition, tokens)
+        return index
+
+    @classmethod
+    def from_corpus(cls, corpus) -> 'CorpusIndex':
+        """Index a CorpusCache straight from its columns."""
+        index = cls()
+        for i in range(len(corpus)):
+            index.add(corpus.string(corpus.words[i]), corpus.categories(i),
+                      corpus.string(corpus.clusters[i]), corpus.string(corpus.definitions[i]))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def category_postings(self) -> Iterator[Tuple[str, array]]:
+        """(exact category name, entry ids) in first-seen order."""
+        return iter(self.by_category.items())
+
+    def freeze(self) -> None:
+        """Precompute the token vocabulary and dense bitsets once building is done."""
+        self._vocabulary = sorted(self.by_token)
+        threshold = max(1, len(self.words) // DENSE_FRACTION)
+        for kind, postings in (('category', self.by_category), ('cluster', self.by_cluster),
+                               ('token', self.by_token)):
+            for key, posting in postings.items():
+                if len(posting) >= threshold:
+                    self._bitsets[kind, key] = _bitset(posting, len(self.words))
+
+    def _term(self, kind: str, key: str, posting: array) -> Tuple[array, Optional[int]]:
+        return posting, self._bitsets.get((kind, key))
+
+    def _category_term(self, name: str) -> Tuple[array, Optional[int]]:
+        names = self._category_names.get(normalize(name), ())
+        if len(names) == 1:
+            return self._term('category', names[0], self.by_category[names[0]])
+        return array('I', sorted({i for n in names for i in self.by_category[n]})), None
+
+    def _token_term(self, token: str) -> Tuple[array, Optional[int]]:
+        if not token.endswith('*'):
+            key = token.casefold()
+            return self._term('token', key, self.by_token.get(key, array('I')))
+        prefix = token[:-1].casefold()
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.by_token)
+        matched = []
+        for i in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+            if not self._vocabulary[i].startswith(prefix):
+                break
+            matched.append(self._vocabulary[i])
+        if len(matched) == 1:
+            return self._term('token', matched[0], self.by_token[matched[0]])
+        return array('I', sorted({i for key in matched for i in self.by_token[key]})), None
+
+    def with_category(self, name: str) -> array:
+        return self._category_term(name)[0]
+
+    def with_token(self, token: str) -> array:
+        """Posting for a definition token; a trailing `*` matches a prefix."""
+        return self._token_term(token)[0]
+
+    def query(self, category: Optional[str] = None, cluster: Optional[str] = None,
+              tokens: Iterable[str] = ()) -> List[int]:
+        """Ids of entries matching every given criterion (all entries if none)."""
+        terms = []
+        if category is not None:
+            terms.append(self._category_term(category))
+        if cluster is not None:
+            key = normalize(cluster)
+            terms.append(self._term('cluster', key, self.by_cluster.get(key, array('I'))))
+        for token in tokens:
+            terms.append(self._token_term(token))
+        if not terms:
+            return list(range(len(self.words)))
+        if len(terms) == 1:
+            return list(terms[0][0])
+
+        size = len(self.words)
+        sparse = [posting for posting, bits in terms if bits is None]
+        dense = [bits for _, bits in terms if bits is not None]
+        mask = None
+        if dense:
+            mask = dense[0]
+            for bits in dense[1:]:
+                mask &= bits
+            if not sparse:
+                return _bitset_ids(mask)
+        result = _intersect(sparse) if len(sparse) > 1 else list(sparse[0])
+        if mask is not None:
+            mask = mask.to_bytes((size + 7) // 8, 'little')
+            result = [i for i in result if mask[i >> 3] >> (i & 7) & 1]
+        return result
+
+
+def index_path_for(source_path: str) -> str:
+    return cache_path_for(source_path)[:-len('.bin')] + '.index.pickle'
+
+
+def load_index(source_path: str = WORD_CONTENT_PATH) -> CorpusIndex:
+    """Index for `source_path`, rebuilt when the corpus cache's source changed."""
+    corpus = load_corpus(source_path)
+    path = index_path_for(source_path)
+    try:
+        with open(path, 'rb') as f:
+            version, sha1, state = pickle.load(f)
+        if version == INDEX_FORMAT and sha1 == corpus.source_sha1:
+            index = CorpusIndex()
+            index.__dict__.update(state)
+            return index
+    except (FileNotFoundError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+    index = CorpusIndex.from_corpus(corpus)
+    index.freeze()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        # Plain state, not the instance: the class may live in __main__.
+        pickle.dump((INDEX_FORMAT, corpus.source_sha1, index.__dict__), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the word corpus by category, cluster or definition token')
+    parser.add_argument('--category', help='anchor category (case-insensitive)')
+    parser.add_argument('--cluster', help='word cluster (case-insensitive)')
+    parser.add_argument('--token', nargs='+', default=[], help="definition must contain every token ('emotion*' matches a prefix)")
+    parser.add_argument('--source', default=WORD_CONTENT_PATH)
+    parser.add_argument('--count', action='store_true', help='print only the number of matches')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = load_index(args.source)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ids = index.query(args.category, args.cluster, args.token)
+    elapsed = time.perf_counter() - start
+
+    if not args.count:
+        for i in ids:
+            print(index.words[i])
+    print(f"{len(ids)} of {len(index)} words (index loaded in {loaded * 1000:.1f} ms, "
+          f"query {elapsed * 1000:.3f} ms)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""Aggregate exported tracking events per word and cluster and calibrate difficulty.
+
+Usage: python3 event_analytics.py EVENTS.jsonl [MORE.jsonl.gz ...] [--json report.json]
+                                  [--min-interactions 5] [--output lib/wordDifficulty.ts]
+
+Reads JSON lines of the UserEvent records lib/trackingEvents.ts produces
+('-' is stdin, .gz is decompressed on the fly):
+
+  word_selection          selectedWords[] with word, cluster, position and
+                          selectionOrder; totalAvailable; selectionSpeed
+  interaction             word, timeSpent, completed
+  mini_session_completed  completionRate
+
+Lines are read BATCH_LINES at a time; each batch is flattened into
+columns (word ids, positions, times, ...) and folded into per-word
+accumulators with np.bincount, so memory depends on the number of
+distinct words and the batch size, never on the length of the export.
+
+Per word: selection rate (picks per selection screen), position-debiased
+selection rate, mean list position when picked, time to select (a
+screen's selectionSpeed spread over its picks in selection order),
+completion rate and time spent per interaction. Clusters (the word's
+cluster in data/, else the one in the events) are summed from the words.
+Position bias is the pick rate of each list position over the screens
+long enough to show it; debiased selection weighs each pick by the
+inverse of that rate.
+
+Difficulty: completion is smoothed towards the word's cluster (PRIOR
+pseudo-interactions), combined with time spent and time to select as
+percentile ranks, and the combined rank is spread over the 1-10 scale the
+app already uses (personalizationEngine treats 4-7 as medium). Words with
+fewer than --min-interactions interactions keep their hand-set value.
+The result is written to lib/wordDifficulty.ts, which personalizationEngine
+prefers over the hand-set `difficulty`.
+
+Needs numpy; uses orjson for parsing when it is installed.
+"""
+import argparse
+import gzip
+import json
+import math
+import sys
+import time
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # optional: the script reports it and exits without it
+    np = None
+
+try:
+    import orjson
+except ImportError:  # optional: the json module parses the same lines, slower
+    orjson = None
+
+from build_manifest import file_digest
+from content_sources import load_merged
+from corpus_index import normalize
+from ts_emitter import atomic_write
+from word_content import encode_string
+
+OUTPUT_PATH = 'lib/wordDifficulty.ts'
+BATCH_LINES = 1 << 16
+# List positions tracked one by one; later positions share the last slot.
+POSITIONS = 32
+# Pseudo-interactions at the cluster's completion rate added to every word.
+PRIOR = 10
+DEFAULT_MIN_INTERACTIONS = 5
+DIFFICULTY_RANGE = (1.0, 10.0)
+# Weights of the percentile ranks combined into difficulty.
+WEIGHTS = {'incompletion': 0.6, 'time_spent': 0.25, 'time_to_select': 0.15}
+
+# Per-word accumulator rows.
+SELECTIONS, POSITIONED, POSITION_SUM, TIMED, SELECT_TIME_SUM, INTERACTIONS, COMPLETED, TIME_SPENT_SUM = range(8)
+COLUMNS = 8
+
+
+def open_export(path):
+    if path == '-':
+        return sys.stdin.buffer
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+# Larger magnitudes are no count or duration, and would overflow the int64 columns.
+MAX_NUMBER = 2 ** 53
+
+
+def _number(value, default=0.0):
+    """`value` if it is a finite number of sane size, else `default`."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    if not math.isfinite(value) or abs(value) > MAX_NUMBER:
+        return default
+    return value
+
+
+def _reject_constant(name):
+    raise ValueError(f"{name} is not JSON")
+
+
+def _finite_float(text):
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f"{text} is out of range")
+    return value
+
+
+def _json_loads(line):
+    # Reject NaN, Infinity and overflowing floats like orjson does, so both
+    # parsers count the same lines as malformed.
+    return json.loads(line, parse_constant=_reject_constant, parse_float=_finite_float)
+
+
+_loads = orjson.loads if orjson is not None else _json_loads
+
+
+class EventAggregates:
+    """Per-word sums over a stream of UserEvent records, grown batch by batch."""
+
+    def __init__(self):
+        self.word_ids = {}
+        self.words = []
+        self.event_clusters = []
+        self.sums = np.zeros((COLUMNS, 1024))
+        self.position_picks = np.zeros((1024, POSITIONS))
+        self.screen_lengths = np.zeros(POSITIONS + 1)
+        self.screens = 0
+        self.sessions = 0
+        self.session_completion = 0.0
+        self.events = {}
+        self.malformed = 0
+        self.lines = 0
+
+    def _word_id(self, word, cluster):
+        key = normalize(word)
+        word_id = self.word_ids.get(key)
+        if word_id is None:
+            word_id = self.word_ids[key] = len(self.words)
+            self.words.append(word)
+            self.event_clusters.append(cluster or '')
+        elif cluster:
+            self.event_clusters[word_id] = cluster
+        return word_id
+
+    def _grow(self):
+        capacity = self.sums.shape[1]
+        if len(self.words) > capacity:
+            capacity = max(len(self.words), capacity * 2)
+            self.sums = np.pad(self.sums, ((0, 0), (0, capacity - self.sums.shape[1])))
+            self.position_picks = np.pad(self.position_picks, ((0, capacity - self.position_picks.shape[0]), (0, 0)))
+
+    def add_lines(self, lines):
+        """Fold one batch of JSON lines into the sums."""
+        pick_word, pick_position, pick_time = [], [], []
+        act_word, act_completed, act_time = [], [], []
+        lengths = []
+        events = self.events
+        word_id = self._word_id
+        for line in lines:
+            self.lines += 1
+            try:
+                event = _loads(line)
+                kind = event['type']
+                data = event['data']
+            except (ValueError, KeyError, TypeError):
+                if line.strip():
+                    self.malformed += 1
+                continue
+            picked = (data.get('selectedWords') or []) if isinstance(data, dict) else None
+            if not isinstance(kind, str) or not isinstance(data, dict) or not isinstance(picked, list):
+                # Valid JSON, but not a UserEvent: count it rather than stop the run.
+                self.malformed += 1
+                continue
+            events[kind] = events.get(kind, 0) + 1
+            if kind == 'word_selection':
+                count = len(picked)
+                speed = _number(data.get('selectionSpeed'))
+                lengths.append(int(_number(data.get('totalAvailable'), count)))
+                for order, item in enumerate(picked):
+                    if not isinstance(item, dict) or not isinstance(item.get('word'), str):
+                        continue
+                    pick_word.append(word_id(item['word'], item.get('cluster')))
+                    pick_position.append(int(_number(item.get('position'), -1)))
+                    # selectionSpeed covers the whole screen; the n-th pick took n shares of it.
+                    slot = _number(item.get('selectionOrder'), order)
+                    pick_time.append(speed * (slot + 1) / count if speed > 0 else -1.0)
+            elif kind == 'interaction':
+                if isinstance(data.get('word'), str):
+                    act_word.append(word_id(data['word'], None))
+                    act_completed.append(1.0 if data.get('completed') else 0.0)
+                    act_time.append(_number(data.get('timeSpent'), -1.0))
+            elif kind == 'mini_session_completed':
+                self.sessions += 1
+                self.session_completion += _number(data.get('completionRate'))
+        self._grow()
+        self._fold(pick_word, pick_position, pick_time, act_word, act_completed, act_time, lengths)
+
+    def _fold(self, pick_word, pick_position, pick_time, act_word, act_completed, act_time, lengths):
+        n = self.sums.shape[1]
+        sums = self.sums
+        if pick_word:
+            words = np.array(pick_word, dtype=np.int64)
+            positions = np.array(pick_position, dtype=np.int64)
+            times = np.array(pick_time)
+            known = positions >= 0
+            timed = times >= 0
+            sums[SELECTIONS] += np.bincount(words, minlength=n)
+            sums[POSITIONED] += np.bincount(words, weights=known, minlength=n)
+            sums[POSITION_SUM] += np.bincount(words, weights=np.where(known, positions, 0), minlength=n)
+            sums[TIMED] += np.bincount(words, weights=timed, minlength=n)
+            sums[SELECT_TIME_SUM] += np.bincount(words, weights=np.where(timed, times, 0), minlength=n)
+            slots = words[known] * POSITIONS + np.minimum(positions[known], POSITIONS - 1)
+            self.position_picks += np.bincount(slots, minlength=n * POSITIONS).reshape(n, POSITIONS)
+        if act_word:
+            words = np.array(act_word, dtype=np.int64)
+            times = np.array(act_time)
+            sums[INTERACTIONS] += np.bincount(words, minlength=n)
+            sums[COMPLETED] += np.bincount(words, weights=np.array(act_completed), minlength=n)
+            sums[TIME_SPENT_SUM] += np.bincount(words, weights=np.maximum(times, 0), minlength=n)
+        if lengths:
+            self.screens += len(lengths)
+            self.screen_lengths += np.bincount(np.clip(lengths, 0, POSITIONS), minlength=POSITIONS + 1)
+
+    def _shown(self):
+        # Screens of length L show positions 0..L-1; the last slot pools the rest.
+        return self.screen_lengths[::-1].cumsum()[::-1][1:]
+
+    def position_bias(self):
+        """Pick rate per list position: picks there over screens that showed it."""
+        shown = self._shown()
+        return np.where(shown > 0, self.position_picks.sum(axis=0) / np.maximum(shown, 1), 0.0)
+
+    def position_weights(self):
+        """Inverse of each position's pick rate, relative to the overall rate."""
+        bias = self.position_bias()
+        overall = self.position_picks.sum() / max(self._shown().sum(), 1)
+        return np.where(bias > 0, overall / np.where(bias > 0, bias, 1), 0.0)
+
+
+def aggregate(paths, batch_lines=BATCH_LINES):
+    aggregates = EventAggregates()
+    for path in paths:
+        source = open_export(path)
+        try:
+            while True:
+                lines = list(islice(source, batch_lines))
+                if not lines:
+                    break
+                aggregates.add_lines(lines)
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+    return aggregates
+
+
+def _ratio(numerator, denominator):
+    return np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), np.nan)
+
+
+def percentile_ranks(values):
+    """Percentile rank in [0, 1] of each value (ties share their mean rank)."""
+    order = np.argsort(values, kind='stable')
+    ranks = np.empty(len(values))
+    ranks[order] = np.arange(len(values))
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    tied = np.bincount(inverse, weights=ranks) / counts
+    return tied[inverse] / max(len(values) - 1, 1)
+
+
+def word_statistics(aggregates, content):
+    """Columns of per-word metrics plus the cluster id of every word."""
+    n = len(aggregates.words)
+    sums = aggregates.sums[:, :n]
+    clusters = []
+    for word_id, key in enumerate(aggregates.word_ids):
+        merged = content.get(key)
+        clusters.append((merged.cluster if merged else '') or aggregates.event_clusters[word_id] or 'unknown')
+    cluster_names = list(dict.fromkeys(clusters))
+    cluster_index = {name: i for i, name in enumerate(cluster_names)}
+    cluster_of = np.array([cluster_index[name] for name in clusters], dtype=np.int64)
+
+    screens = max(aggregates.screens, 1)
+    debiased = aggregates.position_picks[:n] @ aggregates.position_weights()
+    # Picks without a known position count once.
+    debiased += sums[SELECTIONS] - sums[POSITIONED]
+
+    stats = {
+        'selections': sums[SELECTIONS],
+        'selection_rate': sums[SELECTIONS] / screens,
+        'debiased_selection_rate': debiased / screens,
+        'mean_position': _ratio(sums[POSITION_SUM], sums[POSITIONED]),
+        'time_to_select': _ratio(sums[SELECT_TIME_SUM], sums[TIMED]),
+        'interactions': sums[INTERACTIONS],
+        'completion_rate': _ratio(sums[COMPLETED], sums[INTERACTIONS]),
+        'time_spent': _ratio(sums[TIME_SPENT_SUM], sums[INTERACTIONS]),
+    }
+    return stats, cluster_names, cluster_of
+
+
+def cluster_statistics(aggregates, stats, cluster_names, cluster_of):
+    n = len(aggregates.words)
+    sums = aggregates.sums[:, :n]
+    k = len(cluster_names)
+
+    def total(row):
+        return np.bincount(cluster_of, weights=row, minlength=k)
+
+    return {
+        'words': np.bincount(cluster_of, minlength=k),
+        'selections': total(sums[SELECTIONS]),
+        'selection_rate': total(sums[SELECTIONS]) / max(aggregates.screens, 1),
+        'debiased_selection_rate': total(stats['debiased_selection_rate']),
+        'time_to_select': _ratio(total(sums[SELECT_TIME_SUM]), total(sums[TIMED])),
+        'interactions': total(sums[INTERACTIONS]),
+        'completion_rate': _ratio(total(sums[COMPLETED]), total(sums[INTERACTIONS])),
+        'time_spent': _ratio(total(sums[TIME_SPENT_SUM]), total(sums[INTERACTIONS])),
+    }
+
+
+def calibrate_difficulty(aggregates, stats, clusters, cluster_of, min_interactions=DEFAULT_MIN_INTERACTIONS):
+    """{word id: difficulty} for the words with enough interactions."""
+    n = len(aggregates.words)
+    sums = aggregates.sums[:, :n]
+    eligible = np.flatnonzero(sums[INTERACTIONS] >= max(min_interactions, 1))
+    if not len(eligible):
+        return {}
+    overall = sums[COMPLETED].sum() / max(sums[INTERACTIONS].sum(), 1)
+    cluster_rate = np.nan_to_num(clusters['completion_rate'], nan=overall)[cluster_of]
+    completion = (sums[COMPLETED] + PRIOR * cluster_rate) / (sums[INTERACTIONS] + PRIOR)
+
+    # Words never timed sit at the median rather than at either end.
+    def ranked(values):
+        values = values[eligible]
+        return percentile_ranks(np.where(np.isnan(values), np.nanmedian(values) if np.isfinite(values).any() else 0, values))
+
+    hardness = (WEIGHTS['incompletion'] * ranked(1 - completion)
+                + WEIGHTS['time_spent'] * ranked(stats['time_spent'])
+                + WEIGHTS['time_to_select'] * ranked(stats['time_to_select']))
+    low, high = DIFFICULTY_RANGE
+    difficulty = low + (high - low) * percentile_ranks(hardness)
+    return dict(zip(eligible.tolist(), np.round(difficulty, 1).tolist()))
+
+
+def write_difficulty_module(path, difficulties):
+    """Emit `calibratedDifficulty: Record<string, number>` plus a default export."""
+    with atomic_write(path) as out:
+        out.write("const calibratedDifficulty: Record<string, number> = {\n")
+        for word, difficulty in difficulties:
+            out.write(f"  {encode_string(word)}: {difficulty},\n")
+        out.write("};\n\nexport default calibratedDifficulty;\n")
+        if out.hexdigest() == file_digest(path):
+            out.discard()
+    return out.hexdigest()
+
+
+def _json_value(value):
+    value = float(value)
+    return None if np.isnan(value) else round(value, 4)
+
+
+def report_json(aggregates, stats, cluster_names, cluster_of, clusters, difficulties):
+    return {
+        'lines': aggregates.lines,
+        'malformed': aggregates.malformed,
+        'events': aggregates.events,
+        'screens': aggregates.screens,
+        'session_completion_rate': aggregates.session_completion / aggregates.sessions if aggregates.sessions else None,
+        'position_bias': [_json_value(rate) for rate in aggregates.position_bias()],
+        'words': [
+            dict({'word': word, 'cluster': cluster_names[cluster_of[i]], 'difficulty': difficulties.get(i)},
+                 **{name: _json_value(column[i]) for name, column in stats.items()})
+            for i, word in enumerate(aggregates.words)
+        ],
+        'clusters': [
+            dict({'cluster': name}, **{metric: _json_value(column[k]) for metric, column in clusters.items()})
+            for k, name in enumerate(cluster_names)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate tracking events and calibrate word difficulty')
+    parser.add_argument('exports', nargs='+', help="JSONL exports of UserEvent records ('-' = stdin, .gz ok)")
+    parser.add_argument('--json', metavar='PATH', help='write per-word and per-cluster metrics as JSON')
+    parser.add_argument('--min-interactions', type=int, default=DEFAULT_MIN_INTERACTIONS,
+                        help='interactions a word needs before it is calibrated (default: 5)')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='calibrated difficulty module (default: %(default)s)')
+    parser.add_argument('--dry-run', action='store_true', help='report only, do not write the module')
+    args = parser.parse_args()
+    if np is None:
+        parser.error('numpy is required (pip install numpy)')
+
+    start = time.perf_counter()
+    aggregates = aggregate(args.exports)
+    read = time.perf_counter() - start
+    content, _ = load_merged()
+    stats, cluster_names, cluster_of = word_statistics(aggregates, content)
+    clusters = cluster_statistics(aggregates, stats, cluster_names, cluster_of)
+    difficulties = calibrate_difficulty(aggregates, stats, clusters, cluster_of, args.min_interactions)
+
+    events = sum(aggregates.events.values())
+    print(f"✓ {events} events from {aggregates.lines} lines in {read:.2f}s "
+          f"({events / max(read, 1e-9) * 60:,.0f} events/min), {aggregates.malformed} malformed")
+    for kind, count in sorted(aggregates.events.items(), key=lambda item: -item[1]):
+        print(f"  {kind}: {count}")
+    bias = aggregates.position_bias()
+    if aggregates.screens:
+        print(f"\nPosition bias (pick rate by list position): "
+              + ', '.join(f"{p}: {rate:.2f}" for p, rate in enumerate(bias[:8])))
+    print(f"\n{'cluster':<24}{'words':>7}{'picks':>9}{'debiased/screen':>17}{'completion':>12}{'time':>9}")
+    for k in np.argsort(-clusters['selections'], kind='stable'):
+        completion = clusters['completion_rate'][k]
+        spent = clusters['time_spent'][k]
+        print(f"{cluster_names[k][:23]:<24}{clusters['words'][k]:>7}{clusters['selections'][k]:>9.0f}"
+              f"{clusters['debiased_selection_rate'][k]:>17.3f}"
+              f"{'' if np.isnan(completion) else f'{completion:.1%}':>12}"
+              f"{'' if np.isnan(spent) else f'{spent:.1f}':>9}")
+
+    # Only words the content defines get a difficulty in the app.
+    keys = list(aggregates.word_ids)
+    calibrated = sorted((content[keys[i]].word, difficulty) for i, difficulty in difficulties.items()
+                        if keys[i] in content)
+    unknown = len(difficulties) - len(calibrated)
+    print(f"\n✓ Calibrated difficulty for {len(calibrated)} words"
+          + (f" ({unknown} not in data/ skipped)" if unknown else ''))
+    if not args.dry_run:
+        write_difficulty_module(args.output, calibrated)
+        print(f"✓ Wrote {args.output}")
+    if args.json:
+        with atomic_write(args.json) as out:
+            out.write(json.dumps(report_json(aggregates, stats, cluster_names, cluster_of, clusters, difficulties),
+                                 indent=2, ensure_ascii=False) + "\n")
+        print(f"✓ Wrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Persistent LRU + TTL cache of generated examples.
+
+Usage: python3 example_cache.py [--path PATH]   (prints cache statistics)
+
+Examples are stored in SQLite under .content-cache/ keyed by a fingerprint
+of everything that determines them (see `fingerprint()`), so identical
+inputs are never generated twice. A bounded in-memory LRU sits in front of
+the database. Entries expire `ttl` seconds after they were written, and
+when the table grows past `max_entries` the least recently used rows go
+first. Eviction runs on close(); access times are written back in batches.
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+
+from build_manifest import CACHE_DIR
+
+CACHE_PATH = os.path.join(CACHE_DIR, 'examples.sqlite')
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_TTL = 90 * 24 * 3600
+DEFAULT_MEMORY_SIZE = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS examples (
+    key TEXT PRIMARY KEY,
+    word TEXT NOT NULL,
+    category TEXT NOT NULL,
+    example TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS examples_accessed ON examples (accessed);
+"""
+
+# SQLite's default limit on host parameters per statement is 999.
+_BATCH = 500
+
+
+def fingerprint(*parts):
+    """Stable cache key for a tuple of strings."""
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class ExampleCache:
+    """SQLite-backed example store with an in-memory LRU front tier."""
+
+    def __init__(self, path=CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL,
+                 memory_size=DEFAULT_MEMORY_SIZE):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._db = sqlite3.connect(path)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(_SCHEMA)
+        self._memory = OrderedDict()
+        self._touched = set()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'expired': 0, 'writes': 0, 'evicted': 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _remember(self, key, example, created):
+        self._memory[key] = (example, created)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """{key: example} for the keys present and unexpired."""
+        found = {}
+        missing = []
+        cutoff = time.time() - self.ttl
+        expired = []
+        for key in keys:
+            cached = self._memory.get(key)
+            if cached is None:
+                missing.append(key)
+            elif cached[1] < cutoff:
+                del self._memory[key]
+                expired.append(key)
+            else:
+                self._memory.move_to_end(key)
+                self._touched.add(key)
+                found[key] = cached[0]
+        self.stats['memory_hits'] += len(found)
+
+        for i in range(0, len(missing), _BATCH):
+            batch = missing[i:i + _BATCH]
+            rows = self._db.execute(
+                f"SELECT key, example, created FROM examples WHERE key IN ({','.join('?' * len(batch))})", batch)
+            for key, example, created in rows:
+                if created < cutoff:
+                    expired.append(key)
+                    continue
+                found[key] = example
+                self._touched.add(key)
+                self._remember(key, example, created)
+                self.stats['disk_hits'] += 1
+        if expired:
+            self._db.executemany('DELETE FROM examples WHERE key = ?', ((key,) for key in expired))
+            self.stats['expired'] += len(expired)
+        self.stats['misses'] += len(keys) - len(found)
+        return found
+
+    def put(self, key, word, category, example):
+        self.put_many([(key, word, category, example)])
+
+    def put_many(self, rows):
+        """Store (key, word, category, example) rows and commit."""
+        now = time.time()
+        rows = list(rows)
+        self._db.executemany(
+            'INSERT OR REPLACE INTO examples (key, word, category, example, created, accessed) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            ((key, word, category, example, now, now) for key, word, category, example in rows))
+        self._db.commit()
+        for key, _, _, example in rows:
+            self._remember(key, example, now)
+        self.stats['writes'] += len(rows)
+
+    def evict(self):
+        """Drop expired rows, then least recently used rows over the size cap."""
+        cutoff = time.time() - self.ttl
+        evicted = self._db.execute('DELETE FROM examples WHERE created < ?', (cutoff,)).rowcount
+        overflow = self._db.execute('SELECT COUNT(*) FROM examples').fetchone()[0] - self.max_entries
+        if overflow > 0:
+            evicted += self._db.execute(
+                'DELETE FROM examples WHERE key IN (SELECT key FROM examples ORDER BY accessed LIMIT ?)',
+                (overflow,)).rowcount
+        self.stats['evicted'] += evicted
+        self._memory.clear()
+        return evicted
+
+    def close(self, evict=True):
+        """Record accesses and commit; evict=False leaves every row in place."""
+        if self._touched:
+            now = time.time()
+            self._db.executemany('UPDATE examples SET accessed = ? WHERE key = ?',
+                                 ((now, key) for key in self._touched))
+            self._touched.clear()
+        if evict:
+            self.evict()
+        self._db.commit()
+        self._db.close()
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM examples').fetchone()[0]
+
+    def overview(self):
+        """(examples, words, oldest write, last access) of the rows on disk."""
+        return self._db.execute(
+            'SELECT COUNT(*), COUNT(DISTINCT word), MIN(created), MAX(accessed) FROM examples').fetchone()
+
+    def summary(self):
+        s = self.stats
+        lookups = s['memory_hits'] + s['disk_hits'] + s['misses']
+        rate = (s['memory_hits'] + s['disk_hits']) / lookups if lookups else 0.0
+        return (f"{lookups} lookups, {rate:.1%} hit ({s['memory_hits']} memory, {s['disk_hits']} disk), "
+                f"{s['misses']} misses, {s['writes']} writes, {s['expired'] + s['evicted']} evicted")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show example cache statistics')
+    parser.add_argument('--path', default=CACHE_PATH)
+    args = parser.parse_args()
+    if not os.path.exists(args.path):
+        raise SystemExit(f"No example cache at {args.path}")
+    # Inspecting the cache must not change it: close without evicting.
+    cache = ExampleCache(args.path)
+    try:
+        count, words, oldest, newest = cache.overview()
+    finally:
+        cache.close(evict=False)
+    print(f"{args.path}: {count} examples for {words} words")
+    if count:
+        print(f"  oldest write {time.ctime(oldest)}, last access {time.ctime(newest)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Serial or process-pool generation of per-word anchor examples.
+
+Work is described by compact records, `(word, definition, categories,
+authored)`, where `authored` maps category -> hand-written example. An optional scenario
+map (scenarios.ScenarioMap, or any mapping with .get) fills categories
+the word has no authored example for, before the rules do. With
+`jobs > 1` the records are sorted by word, cut into contiguous chunks and
+handed to a process pool; each worker compiles the rule set once and
+results come back in chunk order, so the merged output is in sorted-word
+order and identical to a serial run.
+"""
+import multiprocessing
+
+from example_rules import RULE_SETS
+
+# Chunks per worker: enough to balance uneven chunks, few enough that
+# per-task pickling stays small next to the work itself.
+CHUNKS_PER_JOB = 4
+
+_worker_rules = None
+_worker_scenarios = None
+
+
+def generate_word_examples(compiled, word, definition, categories, authored, scenarios=None):
+    """Examples for one word: authored ones win, then scenarios, the rules fill the rest."""
+    examples = {}
+    for category in categories:
+        example = authored.get(category)
+        if example is None and scenarios is not None:
+            example = scenarios.get(category)
+        if example is None:
+            example = compiled.generate(word, definition, category)
+        examples[category] = example
+    return examples
+
+
+def _init_worker(rules_name, scenarios):
+    global _worker_rules, _worker_scenarios
+    _worker_rules = RULE_SETS[rules_name].compile()
+    _worker_scenarios = scenarios
+
+
+def _generate_chunk(chunk):
+    return [(record[0], generate_word_examples(_worker_rules, *record, _worker_scenarios)) for record in chunk]
+
+
+def _chunks(records, size):
+    for i in range(0, len(records), size):
+        yield records[i:i + size]
+
+
+def generate_examples(records, rules, jobs=1, scenarios=None):
+    """Return {word: {category: example}} for `records`, in sorted-word order.
+
+    When a word appears in several records the last one wins, matching the
+    serial generator where a later block replaces an earlier one.
+    """
+    latest = {record[0]: record for record in records}
+    ordered = [latest[word] for word in sorted(latest)]
+    if jobs <= 1 or len(ordered) < 2:
+        compiled = rules.compile()
+        return {record[0]: generate_word_examples(compiled, *record, scenarios) for record in ordered}
+
+    size = max(1, -(-len(ordered) // (jobs * CHUNKS_PER_JOB)))
+    with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(rules.name, scenarios)) as pool:
+        word_examples = {}
+        for results in pool.imap(_generate_chunk, _chunks(ordered, size)):
+            word_examples.update(results)
+    return word_examples
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""Rule tables behind generate_context_aware_example and their compiled form.
+
+Each generator script used to carry its own if/elif cascade of substring
+checks (`'team' in cat_lower`, `any(x in def_lower for x in [...])`). The
+cascades live here as data instead: a RuleSet is an ordered list of
+definition groups, each with an ordered list of category branches, and the
+first matching group/branch wins exactly as in the original code.
+
+RuleSet.cascade() evaluates the table the old way, one pair at a time.
+RuleSet.compile() builds keyword automata for the definition and category
+keywords so a definition is scanned once per word, a category once per
+distinct category, and the winning branch is picked from match bitsets.
+"""
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex for a keyword trie that prefers the longest keyword at a position."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node: dict) -> str:
+        terminal = '' in node
+        children = [re.escape(char) + emit(child) for char, child in node.items() if char != '']
+        if not children:
+            return ''
+        body = children[0] if len(children) == 1 else '(?:' + '|'.join(children) + ')'
+        # A terminal node makes the continuation optional; greedy `?` still
+        # tries the longer keyword first and backtracks to this one.
+        if terminal:
+            return f'(?:{body})?'
+        return body
+
+    return emit(trie)
+
+
+class KeywordAutomaton:
+    """Multi-pattern matcher that reports every keyword occurring in a text.
+
+    The keywords are folded into a trie and compiled into one regular
+    expression that matches the longest keyword starting at each position
+    (inside a lookahead, so matches may overlap). Every keyword that is a
+    substring of a longer one inherits its bit, which plays the role of the
+    Aho-Corasick output links: a single scan yields the full set of matched
+    keywords as an int bitset.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.bits = {keyword: 1 << i for i, keyword in enumerate(self.keywords)}
+        self._closure = {
+            keyword: sum(bit for other, bit in self.bits.items() if other in keyword)
+            for keyword in self.keywords
+        }
+        self._pattern = re.compile(f'(?=({_trie_pattern(self.keywords)}))') if self.keywords else None
+
+    def mask(self, keywords: Iterable[str]) -> int:
+        mask = 0
+        for keyword in keywords:
+            mask |= self.bits[keyword]
+        return mask
+
+    def scan(self, text: str) -> int:
+        if self._pattern is None:
+            return 0
+        bits = 0
+        closure = self._closure
+        for keyword in self._pattern.findall(text):
+            bits |= closure[keyword]
+        return bits
+
+
+Branch = Tuple[List[str], str]
+Group = Tuple[str, List[str], List[Branch]]
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """An ordered cascade: (label, definition keywords, category branches).
+
+    Templates use `{word}` and `{category}`, the latter lowercased.
+    """
+    name: str
+    default: str
+    groups: List[Group]
+
+    def cascade(self, word: str, definition: str, category: str) -> str:
+        """Evaluate the rules one pair at a time, like the original if/elif chain."""
+        def_lower = definition.lower()
+        cat_lower = category.lower()
+        for _, def_keywords, branches in self.groups:
+            if any(x in def_lower for x in def_keywords):
+                for cat_keywords, template in branches:
+                    if any(x in cat_lower for x in cat_keywords):
+                        return template.format(word=word, category=cat_lower)
+                break
+        return self.default.format(word=word, category=cat_lower)
+
+    def compile(self) -> 'CompiledRules':
+        return CompiledRules(self)
+
+    @property
+    def version(self) -> str:
+        """Fingerprint of the table; changes whenever any rule changes."""
+        return hashlib.sha1(repr((self.name, self.default, self.groups)).encode()).hexdigest()[:16]
+
+
+class CompiledRules:
+    """A RuleSet resolved through keyword automata and bitsets.
+
+    Output is identical to RuleSet.cascade(); only the amount of scanning
+    changes. Consecutive calls for the same definition reuse its scan, and
+    the winning template per group is computed once per distinct category.
+    """
+
+    def __init__(self, rules: RuleSet):
+        self.rules = rules
+        self.definitions = KeywordAutomaton(k for _, keywords, _ in rules.groups for k in keywords)
+        self.categories = KeywordAutomaton(
+            k for _, _, branches in rules.groups for keywords, _ in branches for k in keywords)
+        self._group_masks = [self.definitions.mask(keywords) for _, keywords, _ in rules.groups]
+        self._branch_masks = [
+            [(self.categories.mask(keywords), template) for keywords, template in branches]
+            for _, _, branches in rules.groups
+        ]
+        self._categories: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        self._last_definition = None
+        self._last_group = -1
+
+    def group_for(self, definition: str) -> int:
+        """Index of the winning definition group, or -1 for the default."""
+        bits = self.definitions.scan(definition.lower())
+        for i, mask in enumerate(self._group_masks):
+            if bits & mask:
+                return i
+        return -1
+
+    def branch_for(self, definition: str, category: str) -> Tuple[int, int]:
+        """(group, branch) indices of the rule generate() applies.
+
+        -1 marks the default: (-1, -1) when no definition group matched,
+        (group, -1) when the group matched but none of its branches did.
+        """
+        group = self.group_for(definition)
+        if group < 0:
+            return -1, -1
+        bits = self.categories.scan(category.lower())
+        for branch, (mask, _) in enumerate(self._branch_masks[group]):
+            if bits & mask:
+                return group, branch
+        return group, -1
+
+    def resolve_category(self, category: str) -> Tuple[str, Tuple[str, ...]]:
+        """Lowercased category plus its winning template for every group.
+
+        The tuple has one extra trailing slot holding the default, so group
+        index -1 picks it up without a branch.
+        """
+        resolved = self._categories.get(category)
+        if resolved is None:
+            cat_lower = category.lower()
+            bits = self.categories.scan(cat_lower)
+            default = self.rules.default
+            templates = tuple(
+                next((template for mask, template in branches if bits & mask), default)
+                for branches in self._branch_masks
+            ) + (default,)
+            resolved = self._categories[category] = (cat_lower, templates)
+        return resolved
+
+    def template_for(self, definition: str, category: str) -> str:
+        """The template generate() would fill for this definition/category."""
+        if definition != self._last_definition:
+            self._last_group = self.group_for(definition)
+            self._last_definition = definition
+        return self.resolve_category(category)[1][self._last_group]
+
+    def generate(self, word: str, definition: str, category: str) -> str:
+        if definition != self._last_definition:
+            self._last_group = self.group_for(definition)
+            self._last_definition = definition
+        cat_lower, templates = self.resolve_category(category)
+        return templates[self._last_group].format(word=word, category=cat_lower)
+
+    def generate_grouped(self, index) -> Dict[str, Dict[str, str]]:
+        """{word: {category: example}} for a CorpusIndex, one category at a time.
+
+        Each definition is scanned once and each category resolved once, then
+        its posting list is filled in a tight loop. Output matches calling
+        generate() per pair in source order, so a word indexed twice keeps
+        the examples of its last entry.
+        """
+        groups = [self.group_for(definition) for definition in index.definitions]
+        slots = [dict.fromkeys(categories) for categories in index.categories]
+        for category, ids in index.category_postings():
+            cat_lower, templates = self.resolve_category(category)
+            for i in ids:
+                slots[i][category] = templates[groups[i]].format(word=index.words[i], category=cat_lower)
+        return dict(zip(index.words, slots))
+
+
+class CompiledRuleSets:
+    """Several RuleSets evaluated side by side over shared keyword scans.
+
+    One automaton holds the definition keywords of every rule set and one
+    the category keywords, so a definition is lowercased and scanned once
+    for all of them, and a category once per distinct category. Per rule
+    set the result is the same (group, branch) and template as its own
+    CompiledRules.
+    """
+
+    def __init__(self, rule_sets: Iterable[RuleSet]):
+        self.rule_sets = list(rule_sets)
+        self.definitions = KeywordAutomaton(
+            k for rules in self.rule_sets for _, keywords, _ in rules.groups for k in keywords)
+        self.categories = KeywordAutomaton(
+            k for rules in self.rule_sets for _, _, branches in rules.groups
+            for keywords, _ in branches for k in keywords)
+        self._group_masks = [[self.definitions.mask(keywords) for _, keywords, _ in rules.groups]
+                             for rules in self.rule_sets]
+        self._branch_masks = [[[self.categories.mask(keywords) for keywords, _ in branches]
+                               for _, _, branches in rules.groups]
+                              for rules in self.rule_sets]
+        self._categories: Dict[str, tuple] = {}
+        self._last_definition = None
+        self._last_groups: Tuple[int, ...] = ()
+
+    def groups_for(self, definition: str) -> Tuple[int, ...]:
+        """Winning group index per rule set (-1 for the default)."""
+        if definition != self._last_definition:
+            bits = self.definitions.scan(definition.lower())
+            self._last_groups = tuple(
+                next((i for i, mask in enumerate(masks) if bits & mask), -1) for masks in self._group_masks)
+            self._last_definition = definition
+        return self._last_groups
+
+    def group_hits(self, definition: str) -> Tuple[Tuple[int, ...], ...]:
+        """Per rule set, every group whose keywords occur in `definition` (not just the winner)."""
+        bits = self.definitions.scan(definition.lower())
+        return tuple(tuple(g for g, mask in enumerate(masks) if bits & mask) for masks in self._group_masks)
+
+    def branch_hits(self, category: str) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        """Per rule set and group, every branch whose keywords occur in `category`."""
+        bits = self.categories.scan(category.lower())
+        return tuple(tuple(tuple(b for b, mask in enumerate(masks) if bits & mask) for masks in groups)
+                     for groups in self._branch_masks)
+
+    def resolve_category(self, category: str) -> tuple:
+        """(lowercased category, branches, templates), each per rule set.
+
+        branches[s][g] is the winning branch of group g of rule set s (-1 for
+        the group default) and templates[s][g] its template; both carry a
+        trailing slot for the rule set's default, so group -1 picks it up.
+        """
+        resolved = self._categories.get(category)
+        if resolved is None:
+            cat_lower = category.lower()
+            bits = self.categories.scan(cat_lower)
+            branches, templates = [], []
+            for rules, groups in zip(self.rule_sets, self._branch_masks):
+                picked = tuple(next((b for b, mask in enumerate(masks) if bits & mask), -1) for masks in groups)
+                branches.append(picked + (-1,))
+                templates.append(tuple(
+                    rules.default if b < 0 else rules.groups[g][2][b][1] for g, b in enumerate(picked)
+                ) + (rules.default,))
+            resolved = self._categories[category] = (cat_lower, tuple(branches), tuple(templates))
+        return resolved
+
+
+# generate_all_examples.py
+ALL_EXAMPLES_RULES = RuleSet(
+    name='all_examples',
+    # The original cascade defaulted to 'matters in' and then rewrote that
+    # exact string to 'influences'; no branch can produce it, so fold it in.
+    default='When {word} influences {category}',
+    groups=[
+        ('work/professional', ['work', 'job', 'professional'], [
+            (['teamwork', 'team', 'collaboration'], 'When your {word} makes a difference in team success'),
+            (['project'], 'When {word} determines project outcome'),
+            (['leadership'], 'When {word} defines your leadership style'),
+            (['communication'], 'When {word} shapes workplace communication'),
+            (['manage', 'delegation'], 'When {word} enables better delegation'),
+            (['conflict', 'dispute'], 'When {word} resolves workplace conflict'),
+        ]),
+        ('growth/learning', ['learn', 'skill', 'ability', 'develop'], [
+            (['growth', 'development', 'learning'], 'When {word} accelerates your growth'),
+            (['mastery'], 'When {word} signals mastery'),
+            (['challenge'], 'When {word} becomes a learning challenge'),
+            (['practice'], 'When {word} emerges through deliberate practice'),
+            (['resilience'], 'When {word} builds resilience in learning'),
+        ]),
+        ('relationship/emotional', ['feel', 'emotion', 'connection', 'relationship'], [
+            (['relationship', 'connection'], 'When {word} deepens your relationships'),
+            (['empathy', 'emotional'], 'When {word} opens emotional understanding'),
+            (['love', 'affection'], 'When {word} deepens affection'),
+            (['support'], 'When {word} provides emotional support'),
+            (['grief', 'loss'], 'When {word} helps you through loss'),
+            (['belonging'], 'When {word} creates belonging'),
+            (['alone', 'solitude'], 'When {word} deepens solitude'),
+        ]),
+        ('decision/judgment', ['choice', 'decision', 'judge', 'evaluate'], [
+            (['decision', 'choose'], 'When {word} guides an important decision'),
+            (['judgment'], 'When {word} informs your judgment'),
+            (['value', 'priority'], 'When {word} clarifies what matters'),
+            (['risk'], 'When {word} shapes risk assessment'),
+        ]),
+        ('problem/solution', ['problem', 'solution', 'challenge', 'solve'], [
+            (['problem', 'solving', 'trouble'], 'When {word} becomes key to solving the problem'),
+            (['struggle', 'difficulty'], 'When {word} marks real struggle'),
+            (['obstacle'], 'When {word} presents an obstacle'),
+            (['resilience'], 'When {word} tests your resilience'),
+            (['courage'], 'When {word} requires courage'),
+        ]),
+        ('change/transformation', ['change', 'transform', 'shift', 'evolve'], [
+            (['change', 'transform', 'evolution'], 'When {word} signals transformative change'),
+            (['time', 'history'], 'When {word} marks a turning point'),
+            (['adapt', 'flexibility'], 'When {word} demands flexibility'),
+            (['progress'], 'When {word} proves your progress'),
+        ]),
+        ('understanding/knowledge', ['understand', 'know', 'aware', 'insight'], [
+            (['understand', 'insight', 'aware'], 'When {word} brings true understanding'),
+            (['reflection', 'self'], 'When {word} enables self-reflection'),
+            (['bias', 'assumption'], 'When {word} reveals hidden bias'),
+            (['truth', 'reality'], 'When {word} shows reality'),
+        ]),
+        ('quality/value', ['quality', 'value', 'worth', 'excellence'], [
+            (['excellence', 'quality', 'standard'], 'When {word} elevates quality'),
+            (['craft', 'skill'], 'When {word} shows true craftsmanship'),
+            (['appreciation'], 'When {word} deepens appreciation'),
+        ]),
+        ('creative/artistic', ['creative', 'art', 'imagine', 'express'], [
+            (['creative', 'art', 'express'], 'When {word} fuels creative expression'),
+            (['beauty', 'aesthetic'], 'When {word} reveals beauty'),
+            (['story', 'narrative'], 'When {word} shapes a story'),
+        ]),
+        ('social/cultural', ['social', 'culture', 'group', 'community'], [
+            (['culture', 'society', 'community'], 'When {word} shapes cultural moment'),
+            (['norm', 'convention'], 'When {word} challenges convention'),
+            (['identity'], 'When {word} shapes identity'),
+        ]),
+        ('language/communication', ['word', 'language', 'speak', 'communicate', 'express'], [
+            (['language', 'communicate', 'speak'], 'When {word} transforms how you speak'),
+            (['meaning', 'nuance'], 'When {word} adds crucial nuance'),
+            (['misunderstand', 'clarity'], 'When {word} prevents misunderstanding'),
+        ]),
+        ('moral/ethical', ['good', 'bad', 'right', 'wrong', 'ethical', 'moral'], [
+            (['ethical', 'moral', 'right', 'good'], 'When {word} guides ethical choice'),
+            (['integrity', 'honest'], 'When {word} tests your integrity'),
+            (['justice', 'fair'], 'When {word} demands fairness'),
+        ]),
+        ('boundary/limit', ['boundary', 'limit', 'edge', 'border'], [
+            (['boundary', 'limit'], 'When {word} establishes healthy boundaries'),
+            (['self', 'respect'], 'When {word} protects your self-respect'),
+        ]),
+        ('peace/calm', ['peace', 'calm', 'quiet', 'rest'], [
+            (['peace', 'calm', 'quiet'], 'When {word} brings inner peace'),
+            (['sanctuary', 'refuge'], 'When {word} offers sanctuary'),
+            (['mindfulness'], 'When {word} enables presence'),
+        ]),
+        ('failure/success', ['fail', 'success', 'win', 'lose', 'achievement'], [
+            (['failure', 'fail', 'mistake'], 'When {word} emerges from failure'),
+            (['success', 'win', 'achieve'], 'When {word} leads to success'),
+            (['setback', 'obstacle'], 'When {word} overcomes setback'),
+        ]),
+        ('time', ['time', 'moment', 'period', 'age', 'era'], [
+            (['time', 'moment', 'history'], 'When {word} marks a defining moment'),
+            (['nostalgia', 'memory'], 'When {word} awakens memory'),
+        ]),
+        ('nature/environment', ['nature', 'environment', 'natural', 'earth'], [
+            (['nature', 'environment', 'world'], 'When {word} reflects in nature'),
+            (['sustain', 'responsibility'], 'When {word} shapes environmental choice'),
+        ]),
+    ],
+)
+
+
+# generate_all_examples_v2.py
+V2_RULES = RuleSet(
+    name='v2',
+    default='When {word} influences {category}',
+    groups=[
+        ('work/professional', ['work', 'job', 'professional', 'business'], [
+            (['team', 'collaboration'], 'When your {word} strengthens your team'),
+            (['project'], 'When {word} determines project success'),
+            (['leadership'], 'When {word} defines strong leadership'),
+            (['communication'], 'When {word} shapes workplace communication'),
+            (['manage', 'delegation'], 'When {word} enables better delegation'),
+            (['conflict'], 'When {word} resolves workplace conflict'),
+            (['efficiency', 'productivity'], 'When {word} boosts your efficiency'),
+        ]),
+        ('growth/learning', ['learn', 'skill', 'ability', 'develop', 'improve'], [
+            (['growth', 'development', 'learning'], 'When {word} accelerates your growth'),
+            (['mastery'], 'When {word} marks real mastery'),
+            (['practice'], 'When {word} emerges through deliberate practice'),
+            (['challenge'], 'When {word} presents a worthy challenge'),
+        ]),
+        ('relationship/emotional', ['feel', 'emotion', 'connection', 'relationship', 'human'], [
+            (['relationship', 'connection'], 'When {word} deepens your relationships'),
+            (['empathy', 'emotional'], 'When {word} opens emotional understanding'),
+            (['support'], 'When {word} provides genuine support'),
+            (['belonging'], 'When {word} creates a sense of belonging'),
+        ]),
+        ('decision/judgment', ['choice', 'decision', 'judge', 'evaluate'], [
+            (['decision', 'choose'], 'When {word} guides your important decisions'),
+            (['judgment'], 'When {word} informs good judgment'),
+            (['value', 'priority'], 'When {word} clarifies what truly matters'),
+        ]),
+        ('problem/solution', ['problem', 'solution', 'solve', 'trouble'], [
+            (['problem', 'solving'], 'When {word} becomes key to solving the problem'),
+            (['challenge'], 'When {word} presents a real challenge'),
+            (['obstacle'], 'When {word} presents an obstacle'),
+        ]),
+        ('change/transformation', ['change', 'transform', 'shift', 'evolve'], [
+            (['change', 'transform'], 'When {word} signals transformative change'),
+            (['progress'], 'When {word} marks real progress'),
+            (['adapt', 'flexibility'], 'When {word} demands flexibility'),
+        ]),
+        ('understanding/knowledge', ['understand', 'know', 'aware', 'insight', 'realize'], [
+            (['insight', 'aware', 'understand'], 'When {word} brings genuine understanding'),
+            (['reflection', 'self'], 'When {word} enables self-reflection'),
+        ]),
+        ('quality/value', ['quality', 'value', 'worth', 'excellence', 'standard'], [
+            (['quality', 'excellence'], 'When {word} elevates quality'),
+            (['craft'], 'When {word} shows true craftsmanship'),
+            (['worth', 'value'], 'When {word} demonstrates real value'),
+        ]),
+        ('creative/artistic', ['creative', 'art', 'imagine', 'express'], [
+            (['creative', 'art'], 'When {word} fuels creative expression'),
+            (['beauty'], 'When {word} reveals beauty'),
+        ]),
+        ('social/cultural', ['social', 'culture', 'group', 'community'], [
+            (['culture', 'society'], 'When {word} shapes cultural moments'),
+            (['identity'], 'When {word} shapes identity'),
+        ]),
+        ('language/communication', ['word', 'language', 'speak', 'communicate'], [
+            (['language', 'communicate'], 'When {word} transforms how you speak'),
+            (['meaning', 'nuance'], 'When {word} adds crucial nuance'),
+        ]),
+        ('moral/ethical', ['good', 'bad', 'right', 'wrong', 'ethical', 'moral'], [
+            (['ethical', 'moral'], 'When {word} guides ethical choices'),
+            (['integrity'], 'When {word} tests your integrity'),
+        ]),
+        ('peace/calm', ['peace', 'calm', 'quiet', 'rest', 'balance'], [
+            (['peace', 'calm'], 'When {word} brings inner peace'),
+            (['sanctuary'], 'When {word} offers sanctuary'),
+        ]),
+        ('failure/success', ['fail', 'success', 'achieve', 'accomplish'], [
+            (['failure', 'fail'], 'When {word} emerges from failure'),
+            (['success', 'achieve'], 'When {word} leads to real success'),
+        ]),
+        ('time', ['time', 'moment', 'period', 'history'], [
+            (['time', 'moment'], 'When {word} marks a defining moment'),
+            (['history'], 'When {word} shapes history'),
+        ]),
+        ('nature/environment', ['nature', 'environment', 'natural'], [
+            (['nature', 'environment'], 'When {word} reflects in nature'),
+        ]),
+        ('efficiency/scale', ['efficient', 'scale', 'grow', 'system'], [
+            (['efficiency', 'productivity'], 'When {word} multiplies your efficiency'),
+            (['growth', 'scale'], 'When {word} enables sustainable growth'),
+        ]),
+    ],
+)
+
+
+# generate_comprehensive_examples.py
+COMPREHENSIVE_RULES = RuleSet(
+    name='comprehensive',
+    default='When {word} shapes {category}',
+    groups=[
+        ('work/professional', ['work', 'job', 'professional', 'business', 'team', 'collaborate', 'project'], [
+            (['team', 'collaboration', 'teamwork'], 'When {word} strengthens your team'),
+            (['project', 'projects'], 'When {word} determines project success'),
+            (['leadership'], 'When {word} defines strong leadership'),
+            (['communication', 'communicate'], 'When {word} transforms workplace communication'),
+            (['manage', 'delegation'], 'When {word} enables better delegation'),
+            (['conflict', 'dispute'], 'When {word} resolves workplace conflict'),
+            (['efficiency', 'productivity'], 'When {word} multiplies your efficiency'),
+            (['management'], 'When {word} improves team management'),
+        ]),
+        ('growth/learning', ['learn', 'skill', 'ability', 'develop', 'improve', 'progress', 'growth'], [
+            (['growth', 'development', 'learning', 'learn'], 'When {word} accelerates your growth'),
+            (['mastery'], 'When {word} marks real mastery'),
+            (['practice'], 'When {word} emerges through deliberate practice'),
+            (['challenge', 'challenges'], 'When {word} presents a worthy challenge'),
+            (['skill', 'skills'], 'When {word} sharpens your skills'),
+        ]),
+        ('relationship/emotional', ['feel', 'emotion', 'connect', 'relation', 'human', 'care', 'support', 'empathy'], [
+            (['relationship', 'connection', 'relate', 'connections'], 'When {word} deepens your relationships'),
+            (['empathy'], 'When {word} opens emotional understanding'),
+            (['support', 'emotional', 'help'], 'When {word} provides genuine support'),
+            (['belonging'], 'When {word} creates a sense of belonging'),
+            (['family'], 'When {word} matters in family'),
+        ]),
+        ('decision/judgment', ['choose', 'choice', 'decision', 'decide', 'judge', 'evaluate', 'assess'], [
+            (['decision', 'choose', 'choosing', 'choices'], 'When {word} guides your important decisions'),
+            (['judgment', 'judge'], 'When {word} informs good judgment'),
+            (['value', 'priority', 'priorities'], 'When {word} clarifies what truly matters'),
+            (['risk'], 'When {word} shapes risk assessment'),
+        ]),
+        ('problem/solution', ['problem', 'solution', 'solve', 'trouble', 'challenge', 'obstacle'], [
+            (['problem', 'solving', 'solve', 'trouble'], 'When {word} becomes key to solving the problem'),
+            (['challenge', 'obstacle', 'difficulty'], 'When {word} presents a real challenge'),
+            (['resilience'], 'When {word} tests your resilience'),
+            (['courage'], 'When {word} requires courage'),
+        ]),
+        ('change/transformation', ['change', 'transform', 'shift', 'evolve', 'evolving', 'transition'], [
+            (['change', 'transform', 'evolution'], 'When {word} signals transformative change'),
+            (['progress'], 'When {word} marks real progress'),
+            (['adapt', 'flexibility', 'flexible'], 'When {word} demands flexibility'),
+            (['time', 'history'], 'When {word} marks a turning point'),
+        ]),
+        ('understanding/knowledge', ['understand', 'know', 'aware', 'insight', 'realize', 'knowledge'], [
+            (['insight', 'aware', 'understand', 'awareness'], 'When {word} brings genuine understanding'),
+            (['reflection', 'reflect'], 'When {word} enables self-reflection'),
+            (['truth', 'reality'], 'When {word} shows reality'),
+        ]),
+        ('quality/value', ['quality', 'value', 'worth', 'excellence', 'standard'], [
+            (['quality', 'excellence', 'standard'], 'When {word} elevates quality'),
+            (['craft'], 'When {word} shows true craftsmanship'),
+            (['worth', 'value'], 'When {word} demonstrates real value'),
+        ]),
+        ('creative/artistic', ['creative', 'art', 'imagine', 'express', 'create'], [
+            (['creative', 'art', 'express', 'creativity'], 'When {word} fuels creative expression'),
+            (['beauty', 'aesthetic'], 'When {word} reveals beauty'),
+            (['story', 'narrative'], 'When {word} shapes a story'),
+        ]),
+        ('social/cultural', ['social', 'culture', 'group', 'community', 'society'], [
+            (['culture', 'society', 'community'], 'When {word} shapes cultural moments'),
+            (['norm', 'convention'], 'When {word} challenges convention'),
+            (['identity'], 'When {word} shapes identity'),
+        ]),
+        ('language/communication', ['word', 'language', 'speak', 'communicate', 'express', 'meaning'], [
+            (['language', 'communicate', 'speak', 'communication'], 'When {word} transforms how you speak'),
+            (['meaning', 'nuance'], 'When {word} adds crucial nuance'),
+            (['clarity'], 'When {word} brings clarity'),
+        ]),
+        ('moral/ethical', ['good', 'bad', 'right', 'wrong', 'ethical', 'moral', 'principle'], [
+            (['ethical', 'moral', 'right', 'good'], 'When {word} guides ethical choices'),
+            (['integrity', 'honest'], 'When {word} tests your integrity'),
+            (['justice', 'fair', 'fairness'], 'When {word} demands fairness'),
+        ]),
+        ('peace/calm', ['peace', 'calm', 'quiet', 'rest', 'balance', 'tranquil'], [
+            (['peace', 'calm', 'quiet'], 'When {word} brings inner peace'),
+            (['sanctuary', 'refuge'], 'When {word} offers sanctuary'),
+            (['mindfulness'], 'When {word} enables presence'),
+        ]),
+        ('failure/success', ['fail', 'success', 'achieve', 'accomplish', 'win', 'lose'], [
+            (['failure', 'fail', 'mistake'], 'When {word} emerges from failure'),
+            (['success', 'achieve', 'achievement'], 'When {word} leads to real success'),
+        ]),
+        ('time', ['time', 'moment', 'period', 'history', 'age', 'era', 'temporal'], [
+            (['time', 'moment', 'history', 'historical'], 'When {word} marks a defining moment'),
+            (['nostalgia', 'memory'], 'When {word} awakens memory'),
+        ]),
+        ('nature/environment', ['nature', 'environment', 'natural', 'earth', 'world'], [
+            (['nature', 'environment', 'world'], 'When {word} reflects in nature'),
+            (['sustain', 'responsibility'], 'When {word} shapes environmental choice'),
+        ]),
+    ],
+)
+
+
+RULE_SETS = {rules.name: rules for rules in (ALL_EXAMPLES_RULES, V2_RULES, COMPREHENSIVE_RULES)}
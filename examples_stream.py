@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""JSON Lines format for generated examples, with an incremental reader.
+
+One record per line: {"word": ..., "categories": [...], "examples": {...}}.
+generate_examples.py --jsonl writes records as it goes, in wordContent.ts
+order, and inject_examples.py reads them one at a time, so the two can be
+piped together and neither holds the whole corpus.
+
+The legacy examples_output.json ({word: {"categories", "examples"}}) is
+still accepted; it is recognised because its first line is not a complete
+JSON object, and is loaded whole as before.
+"""
+import json
+import sys
+
+
+def write_record(out, word, data):
+    out.write(json.dumps({'word': word, **data}, ensure_ascii=False))
+    out.write('\n')
+
+
+def iter_records(stream):
+    """Yield (word, {"categories", "examples"}) from a JSONL or legacy JSON stream."""
+    first = stream.readline()
+    try:
+        record = json.loads(first) if first.strip() else None
+    except ValueError:
+        record = None
+    if record is None or 'word' not in record:
+        # Legacy pretty-printed JSON object keyed by word.
+        legacy = json.loads(first + stream.read()) if first.strip() else {}
+        yield from legacy.items()
+        return
+    while record is not None:
+        word = record.pop('word')
+        yield word, record
+        record = None
+        for line in stream:
+            if line.strip():
+                record = json.loads(line)
+                break
+
+
+def open_records(path):
+    """Open `path` ('-' for stdin) and yield its records."""
+    if path == '-':
+        yield from iter_records(sys.stdin)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from iter_records(f)
+
+
+class StreamLookup:
+    """Dict-like `.get(word)` over a record stream in (mostly) source order.
+
+    Records are consumed as words are asked for; a record that arrives
+    before it is needed is parked until its word comes up. When records and
+    lookups share the same order, at most one record is held at a time.
+    """
+
+    def __init__(self, records):
+        self._records = iter(records)
+        self._pending = {}
+
+    def get(self, word, default=None):
+        if word in self._pending:
+            return self._pending.pop(word)
+        for record_word, data in self._records:
+            if record_word == word:
+                return data
+            self._pending[record_word] = data
+        return default
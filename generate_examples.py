@@ -1,26 +1,13 @@
 #!/usr/bin/env python3
-import re
+import argparse
 import json
+import os
+import sys
 
-# Read the wordContent.ts file
-with open('data/wordContent.ts', 'r') as f:
-    content = f.read()
-
-# Extract all word-category pairs
-word_pattern = r"word: '([^']+)'.*?anchor:\s*{[^}]*categories:\s*\[([^\]]+)\]"
-matches = re.finditer(word_pattern, content, re.DOTALL)
-
-word_examples = {}
-
-for match in matches:
-    word = match.group(1)
-    categories_str = match.group(2)
-    categories = [cat.strip().strip("'\"") for cat in categories_str.split(',')]
-    
-    word_examples[word] = {
-        'categories': categories,
-        'examples': {}
-    }
+from category_match import CategoryResolver
+from corpus_cache import load_corpus
+from examples_stream import write_record
+from scenarios import SCENARIOS_PATH, load_scenarios
 
 # Generate examples for each word-category combination
 example_templates = {
@@ -106,14 +93,87 @@ example_templates = {
     'Transformation': 'When {word} transforms everything',
 }
 
-# Generate for each word
-for word, data in word_examples.items():
-    for category in data['categories']:
-        if category in example_templates:
-            data['examples'][category] = example_templates[category].format(word=word)
+
+def extract_word_categories(entries):
+    """Extract all word-category pairs"""
+    word_examples = {}
+    for entry in entries:
+        if not entry.anchor:
+            continue
+        word_examples[entry.word] = {
+            'categories': entry.categories,
+            'examples': {}
+        }
+    return word_examples
+
+
+# Templates and scenarios that unknown categories may resolve to (built on first use)
+_resolver = None
+_resolved_templates = {}
+
+
+def template_resolver():
+    """CategoryResolver over the template keys, then the update_examples.txt scenario categories"""
+    global _resolver
+    if _resolver is None:
+        scenarios = load_scenarios() if os.path.exists(SCENARIOS_PATH) else {}
+        # Scenarios are complete sentences; escape them so .format(word=...) leaves them as is
+        _resolved_templates.update(
+            (category, scenario.replace('{', '{{').replace('}', '}}')) for category, scenario in scenarios.items())
+        _resolved_templates.update(example_templates)
+        _resolver = CategoryResolver(list(example_templates) + list(scenarios))
+    return _resolver
+
+
+def template_for(category):
+    """The category's own template, else the nearest template or scenario (None if nothing is close)"""
+    template = example_templates.get(category)
+    if template is None:
+        match = template_resolver().resolve(category)
+        template = _resolved_templates[match] if match is not None else None
+    return template
+
+
+def fill_examples(word, categories):
+    """Template example for each of a word's categories"""
+    examples = {}
+    for category in categories:
+        template = template_for(category)
+        if template is not None:
+            examples[category] = template.format(word=word)
         else:
             # Fallback for unknown categories
-            data['examples'][category] = f'When {word} matters in {category}'
+            examples[category] = f'When {word} matters in {category}'
+    return examples
+
+
+def fill_templates(word_examples):
+    """Generate for each word"""
+    for word, data in word_examples.items():
+        data['examples'].update(fill_examples(word, data['categories']))
+    return word_examples
+
+
+def iter_example_records(entries):
+    """Yield (word, {categories, examples}) per anchored entry, in source order"""
+    for entry in entries:
+        if entry.anchor:
+            yield entry.word, {'categories': entry.categories,
+                               'examples': fill_examples(entry.word, entry.categories)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate template examples for data/wordContent.ts')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='stream one JSON record per word instead of one JSON object')
+    args = parser.parse_args()
+
+    if args.jsonl:
+        # Streamed entry by entry from the corpus cache, so it can be piped into inject_examples.py
+        for word, data in iter_example_records(load_corpus()):
+            write_record(sys.stdout, word, data)
+    else:
+        word_examples = fill_templates(extract_word_categories(load_corpus()))
 
-# Print output
-print(json.dumps(word_examples, indent=2))
+        # Print output
+        print(json.dumps(word_examples, indent=2))
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Generate multiple-choice exercises with distractors picked by definition similarity.
+
+Usage: python3 generate_exercises.py [--all] [--source PATH] [--options 3] [--output PATH]
+
+Words that have no hand-written exercise (in wordContent.ts or any other
+source content_sources.py joins) get one in the `exercise` shape used by
+wordContent.ts: "What does "X" mean?" with the word's definition and the
+definitions of its most similar words in the same cluster as options.
+--all writes one for every word.
+
+Every distinct definition becomes a row of hashed TF-IDF features
+(unigrams and bigrams, signed hashing into --dim columns), L2-normalized.
+For each cluster, the targets' rows are multiplied against the cluster's
+candidate rows (at most MAX_CANDIDATES distinct definitions, spread evenly
+through it) one float32 block at a time, and each row's distractors are
+read off with a few argmax passes, so no pair of words is ever compared in
+Python. Near-duplicates (similarity above --max-similarity, e.g. the same
+definition repeated) are skipped, since a distractor that means the same
+thing is a second right answer. Words in clusters too small to supply
+distractors are matched against the whole corpus.
+
+Needs numpy.
+"""
+import argparse
+import re
+import time
+import zlib
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # optional: the script reports it and exits without it
+    np = None
+
+from content_sources import SOURCES, load_merged
+from ts_emitter import atomic_write
+from word_content import WORD_CONTENT_PATH, encode_string
+
+OUTPUT_PATH = 'lib/generatedExercises.ts'
+DEFAULT_DIM = 512
+DEFAULT_OPTIONS = 3
+DEFAULT_MAX_SIMILARITY = 0.9
+# Rows per similarity block: block × candidates float32 scores in memory.
+BLOCK_ROWS = 1024
+# Distinct definitions a cluster offers as candidates; bounds the matrix
+# product at targets × MAX_CANDIDATES × dim.
+MAX_CANDIDATES = 1024
+OPTION_IDS = 'ABCDEFGH'
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def definition_tokens(definition):
+    """Lowercase word tokens of a definition, in order and with repeats."""
+    return _WORD.findall(definition.casefold())
+
+
+class _FeatureIds(dict):
+    """Feature -> dense id, assigned on first lookup."""
+
+    def __missing__(self, feature):
+        index = self[feature] = len(self)
+        return index
+
+
+class DefinitionVectors:
+    """Hashed TF-IDF features of many definitions, kept as sparse rows.
+
+    Rows are built into dense float32 blocks on demand, one cluster at a
+    time, so memory follows the largest block rather than the corpus.
+    """
+
+    def __init__(self, definitions, dim=DEFAULT_DIM):
+        self.dim = dim
+        self.count = len(definitions)
+        ids = _FeatureIds()
+        tokens, lengths = array('I'), array('I')
+        for definition in definitions:
+            found = definition_tokens(definition)
+            tokens.extend(map(ids.__getitem__, found))
+            lengths.append(len(found))
+        digests = np.fromiter((zlib.crc32(token.encode('utf-8')) for token in ids), dtype=np.int64, count=len(ids))
+        unigrams = digests[np.frombuffer(tokens, dtype=np.uint32)]
+        counts = np.frombuffer(lengths, dtype=np.uint32).astype(np.int64)
+        token_offsets = np.zeros(self.count + 1, dtype=np.int64)
+        np.cumsum(counts, out=token_offsets[1:])
+
+        # Each row holds its n unigrams, then its n - 1 bigrams, hashed from
+        # the digests of the two tokens.
+        features = counts * 2 - (counts > 0)
+        self.offsets = np.zeros(self.count + 1, dtype=np.int64)
+        np.cumsum(features, out=self.offsets[1:])
+        row = np.repeat(np.arange(self.count), counts)
+        local = np.arange(len(unigrams)) - token_offsets[row]
+        hashes = np.empty(self.offsets[-1], dtype=np.int64)
+        hashes[self.offsets[row] + local] = unigrams
+        first = np.flatnonzero(local < counts[row] - 1)
+        bigrams = (unigrams[first] * 1000003 ^ unigrams[first + 1]) & 0xFFFFFFFF
+        hashes[self.offsets[row[first]] + counts[row[first]] + local[first]] = bigrams
+        self.cols = (hashes >> 1) % dim
+        # One hash bit picks the sign, so colliding features tend to cancel
+        # instead of piling up.
+        self.signs = np.where(hashes & 1, 1.0, -1.0)
+        self.idf = self._idf()
+
+    def _idf(self):
+        """Smoothed inverse document frequency per column."""
+        df = np.zeros(self.dim, dtype=np.int64)
+        # A row × column bitmap counts each column once per row; built a
+        # slice of rows at a time to keep it small.
+        for start in range(0, self.count, BLOCK_ROWS * 64):
+            stop = min(start + BLOCK_ROWS * 64, self.count)
+            lo, hi = self.offsets[start], self.offsets[stop]
+            rows = np.repeat(np.arange(stop - start), np.diff(self.offsets[start:stop + 1]))
+            seen = np.zeros((stop - start) * self.dim, dtype=bool)
+            seen[rows * self.dim + self.cols[lo:hi]] = True
+            df += seen.reshape(stop - start, self.dim).sum(axis=0)
+        return (np.log((1 + self.count) / (1 + df)) + 1).astype(np.float32)
+
+    def matrix(self, rows):
+        """L2-normalized float32 rows for the definition ids in `rows`."""
+        rows = np.asarray(rows, dtype=np.int64)
+        starts, lengths = self.offsets[rows], self.offsets[rows + 1] - self.offsets[rows]
+        owner = np.repeat(np.arange(len(rows)), lengths)
+        # Positions of every feature of every requested row, in row order.
+        index = np.arange(len(owner)) - np.repeat(np.cumsum(lengths) - lengths, lengths) + starts[owner]
+        flat = owner * self.dim + self.cols[index]
+        counts = np.bincount(flat, weights=self.signs[index], minlength=len(rows) * self.dim)
+        matrix = counts.reshape(len(rows), self.dim).astype(np.float32)
+        # Sublinear term frequency keeps a repeated word from dominating.
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        matrix /= norms
+        return matrix
+
+
+def nearest(queries, candidates, k, max_similarity, exclude=None):
+    """Indices of the k most similar candidate rows per query row, best first.
+
+    Candidates above `max_similarity` are skipped, as is exclude[i] (a
+    candidate index, -1 for none) for query row i; rows with fewer than k
+    usable candidates are padded with -1.
+    """
+    result = np.full((len(queries), k), -1, dtype=np.int64)
+    for start in range(0, len(queries), BLOCK_ROWS):
+        scores = queries[start:start + BLOCK_ROWS] @ candidates.T
+        np.putmask(scores, scores > max_similarity, -np.inf)
+        rows = np.arange(len(scores))
+        if exclude is not None:
+            # The threshold alone misses a query that is its own candidate
+            # when its row is all zeros (a definition with no tokens).
+            own = np.asarray(exclude[start:start + len(scores)], dtype=np.int64)
+            scores[rows[own >= 0], own[own >= 0]] = -np.inf
+        # k is a handful, so k argmax passes beat a full argpartition.
+        for j in range(min(k, candidates.shape[0])):
+            best = scores.argmax(axis=1)
+            found = np.isfinite(scores[rows, best])
+            result[start:start + len(scores), j] = np.where(found, best, -1)
+            scores[rows, best] = -np.inf
+    return result
+
+
+def _spread(items, limit):
+    """At most `limit` items, evenly spaced through `items`."""
+    if len(items) <= limit:
+        return items
+    return [items[i] for i in np.linspace(0, len(items) - 1, limit).astype(np.int64)]
+
+
+def pick_distractors(definitions, clusters, targets, k, max_similarity=DEFAULT_MAX_SIMILARITY,
+                     dim=DEFAULT_DIM, max_candidates=MAX_CANDIDATES):
+    """{target doc: [distractor docs]}, from the target's own cluster when it is big enough.
+
+    Documents sharing a definition text share one row: each distinct text
+    is vectorized and scored once, and stands for the first document with
+    that text in the cluster. Each cluster offers at most `max_candidates`
+    distinct definitions, spread evenly through it.
+    """
+    text_ids = {}
+    doc_texts = [text_ids.setdefault(definition, len(text_ids)) for definition in definitions]
+    vectors = DefinitionVectors(list(text_ids), dim)
+
+    # Per cluster: {text id: first doc with that text}, in document order.
+    members = {}
+    for doc, (cluster, text) in enumerate(zip(clusters, doc_texts)):
+        members.setdefault(cluster, {}).setdefault(text, doc)
+    wanted = {}
+    for doc in targets:
+        wanted.setdefault(clusters[doc], []).append(doc)
+
+    everyone = None
+    picked = {}
+    for cluster, queries in wanted.items():
+        pool = members[cluster]
+        if len(pool) <= k:
+            # Too few distinct definitions here; draw on the whole corpus.
+            if everyone is None:
+                everyone = {}
+                for doc, text in enumerate(doc_texts):
+                    everyone.setdefault(text, doc)
+            pool = everyone
+        candidates = _spread(list(pool), max_candidates)
+        query_texts = list(dict.fromkeys(doc_texts[doc] for doc in queries))
+        slots = {text: i for i, text in enumerate(candidates)}
+        found = nearest(vectors.matrix(query_texts), vectors.matrix(candidates), k, max_similarity,
+                        exclude=[slots.get(text, -1) for text in query_texts])
+        chosen = {
+            text: [pool[candidates[i]] for i in row if i >= 0]
+            for text, row in zip(query_texts, found)
+        }
+        for doc in queries:
+            picked[doc] = chosen[doc_texts[doc]]
+    return picked
+
+
+def first_sentence(definition):
+    return _SENTENCE_END.split(definition.strip(), 1)[0]
+
+
+def build_exercise(word, definition, distractors):
+    """An exercise in wordContent.ts's shape; the answer's slot is stable per word."""
+    texts = [first_sentence(other) for other in distractors]
+    answer = zlib.crc32(word.encode('utf-8')) % (len(texts) + 1)
+    texts.insert(answer, first_sentence(definition))
+    return {
+        'question': f'What does "{word}" mean?',
+        'options': [{'id': OPTION_IDS[i], 'text': text} for i, text in enumerate(texts)],
+        'correctAnswer': OPTION_IDS[answer],
+        'explanation': definition,
+    }
+
+
+def write_exercise_module(path, exercises):
+    """Emit `generatedExercises: Record<string, Exercise>` plus a default export."""
+    with atomic_write(path) as out:
+        out.write("const generatedExercises: Record<string, {\n"
+                  "  question: string;\n"
+                  "  options: Array<{ id: string; text: string }>;\n"
+                  "  correctAnswer: string;\n"
+                  "  explanation?: string;\n"
+                  "}> = {\n")
+        for word, exercise in exercises:
+            out.write(f"  {encode_string(word)}: {{\n")
+            out.write(f"    question: {encode_string(exercise['question'])},\n")
+            out.write("    options: [\n")
+            for option in exercise['options']:
+                out.write(f"      {{ id: {encode_string(option['id'])}, text: {encode_string(option['text'])} }},\n")
+            out.write("    ],\n")
+            out.write(f"    correctAnswer: {encode_string(exercise['correctAnswer'])},\n")
+            out.write(f"    explanation: {encode_string(exercise['explanation'])},\n")
+            out.write("  },\n")
+        out.write("};\n\nexport default generatedExercises;\n")
+    return out.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate multiple-choice exercises for words without one')
+    parser.add_argument('--source', default=WORD_CONTENT_PATH, help='wordContent.ts-style file to use')
+    parser.add_argument('--all', action='store_true', help='generate for every word, not only those without one')
+    parser.add_argument('--options', type=int, default=DEFAULT_OPTIONS, help='options per exercise (default: 3)')
+    parser.add_argument('--dim', type=int, default=DEFAULT_DIM, help='hashed feature columns (default: 512)')
+    parser.add_argument('--max-similarity', type=float, default=DEFAULT_MAX_SIMILARITY,
+                        help='skip distractors at least this similar (near-duplicates)')
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    args = parser.parse_args()
+    if np is None:
+        parser.error('numpy is required (pip install numpy)')
+    if not 0 < args.max_similarity < 1:
+        parser.error('--max-similarity must be between 0 and 1')
+    if not 2 <= args.options <= len(OPTION_IDS):
+        parser.error(f"--options must be between 2 and {len(OPTION_IDS)}")
+
+    start = time.perf_counter()
+    sources = tuple((name, args.source if path == WORD_CONTENT_PATH else path) for name, path in SOURCES)
+    merged, _ = load_merged(sources)
+    words = [record for record in merged.values() if record.definition]
+    loaded = time.perf_counter()
+
+    targets = [doc for doc, record in enumerate(words) if args.all or record.get('exercise') is None]
+    distractors = pick_distractors([record.definition for record in words], [record.cluster for record in words],
+                                   targets, args.options - 1, args.max_similarity, args.dim)
+    picked = time.perf_counter()
+
+    exercises = sorted(
+        (words[doc].word, build_exercise(words[doc].word, words[doc].definition,
+                                         [words[other].definition for other in distractors[doc]]))
+        for doc in targets)
+    write_exercise_module(args.output, exercises)
+    short = sum(1 for doc in targets if len(distractors[doc]) < args.options - 1)
+
+    print(f"✓ {len(exercises)} exercises for {len(words)} words "
+          f"(load {loaded - start:.2f}s, distractors {picked - loaded:.2f}s)")
+    if short:
+        print(f"  {short} with fewer than {args.options} options (not enough distinct definitions)")
+    print(f"✓ Wrote {args.output}")
+    for word, exercise in exercises[:3]:
+        print(f"\n  {exercise['question']}")
+        for option in exercise['options']:
+            mark = '✓' if option['id'] == exercise['correctAnswer'] else ' '
+            print(f"   {mark} {option['id']}. {option['text']}")
+
+
+if __name__ == '__main__':
+    main()
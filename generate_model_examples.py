@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Fill generic rule fallbacks with model-written examples via /api/generate.
+
+Usage: python3 generate_model_examples.py [--url URL | --stub] [--all]
+           [--concurrency N] [--rate PER_SEC] [--retries N] [--limit N]
+
+Pairs without a hand-authored example whose rule lookup lands on the rule
+set's generic default ("When Zeitgeist shapes culture") are sent to the
+model proxy (every non-authored pair with --all). Requests run on asyncio
+through model_client.ModelClient: pooled keep-alive connections, a
+concurrency limit, a token bucket and jittered retries. By default pairs
+are packed into multi-pair prompts with JSON replies (model_prompts.py);
+--pack none sends one pair per request.
+
+Every accepted example is appended to a journal under .content-cache/
+as soon as it arrives, keyed by a fingerprint of the prompt inputs, so an
+interrupted run picks up where it stopped. A finished run folds the
+journal into the example cache (example_cache.py), and pairs already in
+the cache are never sent again. lib/wordAnchorExamples/ is then written
+with authored examples first, model examples next and the rules for
+whatever is left; rule output is cached too, keyed by the template a pair
+resolves to, so a rule tweak only regenerates the pairs it changes.
+--cache-only writes the modules from the cache alone.
+
+--stub runs the bundled stub_generate_server.py in-process, for trying the
+whole stage end to end without the app or an API key.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from build_manifest import CACHE_DIR
+from corpus_cache import load_word_content_cached
+from example_cache import CACHE_PATH, DEFAULT_MAX_ENTRIES, ExampleCache, fingerprint
+from example_rules import RULE_SETS
+from model_client import DEFAULT_URL, ModelClient, ModelError
+from model_prompts import (MAX_TOKENS, PACKED_MAX_TOKENS, PROMPT_VERSION, build_packed_prompt, build_prompt,
+                           clean_example, parse_packed_reply, plan_packs, reply_budget)
+from ts_emitter import ANCHOR_EXAMPLES_DIR, write_word_anchor_examples
+
+OUTPUT_PATH = ANCHOR_EXAMPLES_DIR
+JOURNAL_PATH = os.path.join(CACHE_DIR, 'model-examples.jsonl')
+
+def pair_key(word, definition, category):
+    """Fingerprint of everything that shapes a pair's prompt."""
+    return fingerprint('model', PROMPT_VERSION, word, definition, category)
+
+
+def rule_key(compiled, word, definition, category):
+    """Fingerprint of a rule-generated pair: the template it resolves to."""
+    return fingerprint('rules', compiled.rules.name, compiled.template_for(definition, category), word, category)
+
+
+def select_pairs(entries, compiled, all_pairs=False):
+    """(word, definition, category) pairs that should go to the model."""
+    default = compiled.rules.default
+    pairs = []
+    for entry in entries:
+        authored = entry.examples or {}
+        for category in entry.categories:
+            if category in authored:
+                continue
+            if all_pairs or compiled.template_for(entry.definition, category) == default:
+                pairs.append((entry.word, entry.definition, category))
+    return pairs
+
+
+class Journal:
+    """Append-only JSONL of finished pairs; survives interruption."""
+
+    def __init__(self, path, fresh=False):
+        self.path = path
+        self.records = {}
+        if fresh and os.path.exists(path):
+            os.unlink(path)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from an interrupted run
+                    self.records[record['key']] = record
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._out = open(path, 'a', encoding='utf-8')
+
+    def get(self, key):
+        record = self.records.get(key)
+        return record and record['example']
+
+    def record(self, key, word, category, example):
+        record = self.records[key] = {'key': key, 'word': word, 'category': category, 'example': example}
+        self._out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._out.flush()
+
+    def fold_into(self, cache):
+        """Move every journaled example into `cache` and empty the journal."""
+        cache.put_many((r['key'], r['word'], r['category'], r['example']) for r in self.records.values())
+        self.records.clear()
+        self._out.truncate(0)
+
+    def close(self):
+        self._out.close()
+
+
+async def generate_pairs(pairs, client, journal, progress_every=100):
+    """Send every pair not already journaled; returns (counts, resumed)."""
+    todo = [pair for pair in pairs if journal.get(pair_key(*pair)) is None]
+    counts = {'done': 0, 'rejected': 0, 'failed': 0}
+    start = time.perf_counter()
+
+    async def one(word, definition, category):
+        try:
+            text = await client.complete(build_prompt(word, definition, category), MAX_TOKENS)
+        except ModelError as err:
+            counts['failed'] += 1
+            print(f"  ✗ {word} / {category}: {err}", file=sys.stderr)
+            return
+        example = clean_example(text)
+        if example is None:
+            counts['rejected'] += 1
+            return
+        journal.record(pair_key(word, definition, category), word, category, example)
+        counts['done'] += 1
+        finished = sum(counts.values())
+        if finished % progress_every == 0:
+            rate = finished / (time.perf_counter() - start)
+            print(f"  {finished}/{len(todo)} pairs ({rate:.1f}/s)")
+
+    await asyncio.gather(*(one(*pair) for pair in todo))
+    return counts, len(pairs) - len(todo)
+
+
+async def generate_packed(pairs, client, journal, group_by='word', max_tokens=PACKED_MAX_TOKENS,
+                          progress_every=100):
+    """Like generate_pairs(), but many pairs per request.
+
+    Pairs whose entries come back missing or malformed are re-split in
+    halves and resent; a lone pair gets one retry before it is rejected.
+    """
+    todo = [pair for pair in pairs if journal.get(pair_key(*pair)) is None]
+    packs = plan_packs(todo, group_by, max_tokens)
+    counts = {'done': 0, 'rejected': 0, 'failed': 0, 'resent': 0}
+    start = time.perf_counter()
+    print(f"  {len(todo)} pairs in {len(packs)} packed requests")
+
+    async def send(pack, retried=False):
+        try:
+            text = await client.complete(build_packed_prompt(pack), reply_budget(len(pack)))
+        except ModelError as err:
+            counts['failed'] += len(pack)
+            print(f"  ✗ pack of {len(pack)} starting {pack[0][0]} / {pack[0][2]}: {err}", file=sys.stderr)
+            return
+        good, bad = parse_packed_reply(text, len(pack))
+        before = counts['done'] + counts['rejected'] + counts['failed']
+        for i, example in good.items():
+            word, definition, category = pack[i - 1]
+            journal.record(pair_key(word, definition, category), word, category, example)
+        counts['done'] += len(good)
+        finished = counts['done'] + counts['rejected'] + counts['failed']
+        if finished // progress_every > before // progress_every:
+            rate = finished / (time.perf_counter() - start)
+            print(f"  {finished}/{len(todo)} pairs ({rate:.1f}/s)")
+        if not bad:
+            return
+        resend = [pack[i - 1] for i in bad]
+        if len(pack) == 1:
+            if retried:
+                counts['rejected'] += 1
+                return
+            await send(resend, retried=True)
+            return
+        counts['resent'] += len(resend)
+        half = (len(resend) + 1) // 2
+        await asyncio.gather(*(send(part) for part in (resend[:half], resend[half:]) if part))
+
+    await asyncio.gather(*(send(pack) for pack in packs))
+    return counts, len(pairs) - len(todo)
+
+
+def build_word_examples(entries, compiled, cache, cache_only=False):
+    """Authored > cached model example > cached or freshly generated rules.
+
+    Returns ({word: {category: example}}, pairs missing from the cache when
+    `cache_only`, which are left out).
+    """
+    rule_keys = {}
+    model_keys = {}
+    for entry in entries:
+        authored = entry.examples or {}
+        for category in entry.categories:
+            if category not in authored:
+                pair = (entry.word, entry.definition, category)
+                model_keys[pair] = pair_key(*pair)
+                rule_keys[pair] = rule_key(compiled, *pair)
+    cached = cache.get_many(list(model_keys.values()))
+    cached.update(cache.get_many([key for pair, key in rule_keys.items() if model_keys[pair] not in cached]))
+
+    word_examples = {}
+    generated = []
+    missing = 0
+    for entry in entries:
+        authored = entry.examples or {}
+        examples = {}
+        for category in entry.categories:
+            example = authored.get(category)
+            if example is None:
+                pair = (entry.word, entry.definition, category)
+                example = cached.get(model_keys[pair]) or cached.get(rule_keys[pair])
+                if example is None:
+                    if cache_only:
+                        missing += 1
+                        continue
+                    example = compiled.generate(*pair)
+                    cached[rule_keys[pair]] = example
+                    generated.append((rule_keys[pair], entry.word, category, example))
+            examples[category] = example
+        word_examples[entry.word] = examples
+    if generated:
+        cache.put_many(generated)
+    return word_examples, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', default=DEFAULT_URL, help=f"model proxy (default: {DEFAULT_URL})")
+    target.add_argument('--stub', action='store_true', help='use an in-process stub_generate_server')
+    target.add_argument('--cache-only', action='store_true',
+                        help='send nothing; write the module from cached examples only')
+    parser.add_argument('--stub-latency', type=float, default=0.2, help='stub seconds per request')
+    parser.add_argument('--stub-fail-rate', type=float, default=0.05, help='stub share of 429/503 replies')
+    parser.add_argument('--stub-malformed-rate', type=float, default=0.05,
+                        help='stub share of malformed packed entries')
+    parser.add_argument('--rules', choices=sorted(RULE_SETS), default='comprehensive')
+    parser.add_argument('--all', action='store_true', help='send every non-authored pair, not just fallbacks')
+    parser.add_argument('--limit', type=int, help='send at most N pairs this run')
+    parser.add_argument('--pack', choices=('none', 'word', 'category'), default='word',
+                        help='pairs per request: one, or packed by word or by category (default: word)')
+    parser.add_argument('--max-tokens', type=int, default=PACKED_MAX_TOKENS,
+                        help=f"reply budget per packed request (default: {PACKED_MAX_TOKENS})")
+    parser.add_argument('--concurrency', type=int, default=8, help='requests in flight (default: 8)')
+    parser.add_argument('--rate', type=float, help='max requests per second (default: unlimited)')
+    parser.add_argument('--retries', type=int, default=4, help='retries per request (default: 4)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds per attempt (default: 60)')
+    parser.add_argument('--fresh', action='store_true', help='discard the resume journal first')
+    parser.add_argument('--cache', default=CACHE_PATH, help=f"example cache (default: {CACHE_PATH})")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_ENTRIES, help='max cached examples')
+    parser.add_argument('--cache-ttl-days', type=float, default=90, help='cached example lifetime (default: 90)')
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    entries = [entry for entry in load_word_content_cached() if entry.categories]
+    compiled = RULE_SETS[args.rules].compile()
+    cache = ExampleCache(args.cache, max_entries=args.cache_size, ttl=args.cache_ttl_days * 86400)
+    journal = Journal(JOURNAL_PATH, fresh=args.fresh)
+
+    try:
+        if not args.cache_only:
+            pairs = select_pairs(entries, compiled, args.all)
+            cached = cache.get_many([pair_key(*pair) for pair in pairs])
+            pairs = [pair for pair in pairs if pair_key(*pair) not in cached]
+            if args.limit is not None:
+                pairs = pairs[:args.limit]
+            print(f"{len(pairs)} pairs for the model ({'all non-authored' if args.all else 'rule fallbacks only'}), "
+                  f"{len(cached)} already cached")
+            if pairs:
+                send_to_model(pairs, journal, args)
+        # Completed (or resumed) model examples become permanent cache entries
+        journal.fold_into(cache)
+
+        word_examples, missing = build_word_examples(entries, compiled, cache, args.cache_only)
+    finally:
+        journal.close()
+        cache.close()
+    print(f"  cache: {cache.summary()}")
+    if missing:
+        print(f"  {missing} pairs had no cached example and were left out")
+
+    write_word_anchor_examples(word_examples, {entry.word: entry.cluster for entry in entries}, args.output)
+    print(f"✓ Wrote {len(word_examples)} words to {args.output}")
+
+
+def send_to_model(pairs, journal, args):
+    stub = None
+    url = args.url
+    if args.stub:
+        from stub_generate_server import StubServer
+        stub = StubServer(latency=args.stub_latency, jitter=args.stub_latency / 2,
+                          fail_rate=args.stub_fail_rate, malformed_rate=args.stub_malformed_rate).start()
+        url = stub.url
+        print(f"✓ Stub /api/generate on {url}")
+
+    async def run():
+        async with ModelClient(url, concurrency=args.concurrency, rate=args.rate,
+                               retries=args.retries, timeout=args.timeout) as client:
+            if args.pack == 'none':
+                result = await generate_pairs(pairs, client, journal)
+            else:
+                result = await generate_packed(pairs, client, journal, args.pack, args.max_tokens)
+            return result, client.stats
+
+    start = time.perf_counter()
+    try:
+        (counts, resumed), stats = asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; {len(journal.records)} examples journaled, rerun to resume")
+        raise SystemExit(130)
+    finally:
+        if stub is not None:
+            stub.shutdown()
+            stub.server_close()
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ {counts['done']} new, {resumed} resumed from journal, "
+          f"{counts['rejected']} rejected, {counts['failed']} failed in {elapsed:.1f}s")
+    if counts.get('resent'):
+        print(f"  {counts['resent']} malformed pairs re-split and resent")
+    print(f"  {stats['requests']} requests over {stats['connections']} connections, {stats['retries']} retries")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,116 @@
 #!/usr/bin/env python3
-import re
-import json
-
-# Read the examples
-with open('examples_output.json', 'r') as f:
-    word_examples = json.load(f)
-
-# Read the wordContent.ts
-with open('data/wordContent.ts', 'r') as f:
-    content = f.read()
-
-# For each word, find its anchor block and add examples
-for word, data in word_examples.items():
-    examples = data['examples']
-    
-    # Create the examples object string
-    examples_str = '      examples: {\n'
-    for category, example in examples.items():
-        examples_str += f"        '{category}': '{example}',\n"
-    examples_str += '      }'
-    
-    # Find the anchor block for this word
-    # Pattern: "word: 'wordname'" ... "anchor: { ... "categories: [...]" ... "}"
-    pattern = f"(word: '{re.escape(word)}'[^}}]*anchor: {{[^}}]*categories: \\[[^\\]]+\\])(\n    }})"
-    
-    def replace_func(match):
-        return match.group(1) + ',\n' + examples_str + match.group(2)
-    
-    content = re.sub(pattern, replace_func, content, flags=re.DOTALL)
-
-# Write back
-with open('data/wordContent.ts', 'w') as f:
-    f.write(content)
-
-print("Updated wordContent.ts with examples")
+"""Inject generated examples into the anchor blocks of data/wordContent.ts.
+
+The source is parsed once to index every anchor block by byte offset, each
+word's change becomes an (start, end, text) splice, and the splices are
+applied in one streaming pass through an atomic write. Anchors that already
+have an `examples:` block get it updated in place: missing categories are
+appended and, with --overwrite, existing ones are replaced. Re-running never
+duplicates a block and leaves the file untouched when nothing changed.
+"""
+import argparse
+
+from examples_stream import StreamLookup, open_records
+from ts_emitter import atomic_write
+from word_content import TsObject, encode_string, iter_word_objects, read_source
+
+EXAMPLES_PATH = 'examples_output.json'
+WORD_CONTENT_PATH = 'data/wordContent.ts'
+
+
+def _indent_of(source, offset):
+    line_start = source.rfind(b'\n', 0, offset) + 1
+    indent = source[line_start:offset]
+    return indent.decode() if not indent.strip() else '      '
+
+
+def render_examples(examples, indent):
+    """Render {category: example} as an object literal at the given key indent."""
+    members = ",\n".join(f"{indent}  {encode_string(c)}: {encode_string(e)}" for c, e in examples.items())
+    return f"{{\n{members}\n{indent}}}"
+
+
+def plan_splices(source, word_examples, overwrite=False):
+    """Yield (start, end, text) splices, in source order, for every changed anchor.
+
+    `word_examples` only needs `.get(word)`: a dict, or a StreamLookup over
+    records arriving in source order. Examples already in the source win
+    unless `overwrite` is set.
+    """
+    for entry in iter_word_objects(source):
+        anchor = entry.get('anchor')
+        if not isinstance(anchor, TsObject):
+            continue
+        data = word_examples.get(entry['word'])
+        if not data or not data.get('examples') or 'categories' not in anchor.spans:
+            continue
+        existing = anchor.get('examples')
+        if existing is not None:
+            merged = dict(existing)
+            for category, example in data['examples'].items():
+                if overwrite or category not in merged:
+                    merged[category] = example
+            if merged == existing:
+                continue
+            key_start, value_start, value_end = anchor.spans['examples']
+            text = render_examples(merged, _indent_of(source, key_start))
+            yield value_start, value_end, text
+        else:
+            key_start, _, value_end = anchor.spans['categories']
+            indent = _indent_of(source, key_start)
+            text = f",\n{indent}examples: {render_examples(data['examples'], indent)}"
+            yield value_end, value_end, text
+
+
+def iter_spliced(source, splices):
+    """Yield `source` as byte chunks with `splices` applied."""
+    view = memoryview(source)
+    position = 0
+    for start, end, text in splices:
+        yield view[position:start]
+        yield text.encode('utf-8')
+        position = end
+    yield view[position:]
+
+
+def inject_examples(source, word_examples, overwrite=False):
+    """Return `source` (bytes) with `word_examples` injected."""
+    return b''.join(iter_spliced(source, plan_splices(source, word_examples, overwrite)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inject generated examples into data/wordContent.ts')
+    parser.add_argument('--examples', default=EXAMPLES_PATH,
+                        help=f"examples as JSON Lines or legacy JSON, '-' for stdin (default: {EXAMPLES_PATH})")
+    parser.add_argument('--overwrite', action='store_true',
+                        help='replace examples that already exist in wordContent.ts')
+    args = parser.parse_args()
+
+    # Records are pulled as their words come up in the source, so a piped
+    # `generate_examples.py --jsonl` is consumed while it is still running
+    word_examples = StreamLookup(open_records(args.examples))
+    source = read_source(WORD_CONTENT_PATH)
+
+    changed = 0
+
+    def tally(splices):
+        nonlocal changed
+        for splice in splices:
+            changed += 1
+            yield splice
+
+    # Write back
+    with atomic_write(WORD_CONTENT_PATH) as out:
+        for chunk in iter_spliced(source, tally(plan_splices(source, word_examples, args.overwrite))):
+            out.write_bytes(chunk)
+        if not changed:
+            out.discard()
+
+    if changed:
+        print(f"Updated wordContent.ts with examples ({changed} anchors changed)")
+    else:
+        print("wordContent.ts already up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+const generatedExercises: Record<string, {
+  question: string;
+  options: Array<{ id: string; text: string }>;
+  correctAnswer: string;
+  explanation?: string;
+}> = {
+  'analytical': {
+    question: 'What does "analytical" mean?',
+    options: [
+      { id: 'A', text: 'The combination of ideas to form a theory or system, or the production of a substance by combining elements.' },
+      { id: 'B', text: 'To estimate, infer, or conclude by extending known information beyond its original scope.' },
+      { id: 'C', text: 'Relating to or using analysis or logical reasoning.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'Relating to or using analysis or logical reasoning. The systematic examination of something to understand its nature or determine its essential features.',
+  },
+  'antecedent': {
+    question: 'What does "antecedent" mean?',
+    options: [
+      { id: 'A', text: 'A thing or event that existed before or logically precedes another.' },
+      { id: 'B', text: 'Forming or characterizing an epoch; of major importance or significance.' },
+      { id: 'C', text: 'A survey or review of past time or events.' },
+    ],
+    correctAnswer: 'A',
+    explanation: 'A thing or event that existed before or logically precedes another. In grammar, the word or phrase that a pronoun refers back to.',
+  },
+  'attuned': {
+    question: 'What does "attuned" mean?',
+    options: [
+      { id: 'A', text: 'Made aware or responsive to something.' },
+      { id: 'B', text: 'To make or become accustomed to something through repeated exposure.' },
+      { id: 'C', text: 'To perceive or recognize something with careful attention or judgment.' },
+    ],
+    correctAnswer: 'A',
+    explanation: 'Made aware or responsive to something. Being in harmony or adjusted to a particular situation or environment.',
+  },
+  'canonical': {
+    question: 'What does "canonical" mean?',
+    options: [
+      { id: 'A', text: 'Daily or occurring every day; ordinary, commonplace, mundane.' },
+      { id: 'B', text: 'Relating to or believing in the superiority of a select group; advocating for power held by an elite few.' },
+      { id: 'C', text: 'Included in the list of sacred books officially accepted as genuine.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'Included in the list of sacred books officially accepted as genuine. In literature and culture, refers to works considered the most important and influential.',
+  },
+  'chronicle': {
+    question: 'What does "chronicle" mean?',
+    options: [
+      { id: 'A', text: 'Forming or characterizing an epoch; of major importance or significance.' },
+      { id: 'B', text: 'A factual written account of important events in the order of their occurrence.' },
+      { id: 'C', text: 'A survey or review of past time or events.' },
+    ],
+    correctAnswer: 'B',
+    explanation: 'A factual written account of important events in the order of their occurrence. A historical record or narrative of events over time.',
+  },
+  'delegate': {
+    question: 'What does "delegate" mean?',
+    options: [
+      { id: 'A', text: 'A balance achieved between two desirable but incompatible features; a compromise involving giving up one thing in return for another.' },
+      { id: 'B', text: 'A tangible or intangible good or service produced as a result of a project.' },
+      { id: 'C', text: 'To entrust a task or responsibility to another person, typically one who is less senior.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'To entrust a task or responsibility to another person, typically one who is less senior. A key management skill for distributing workload effectively.',
+  },
+  'deliverable': {
+    question: 'What does "deliverable" mean?',
+    options: [
+      { id: 'A', text: 'A standard or reference point used to measure performance or quality.' },
+      { id: 'B', text: 'The ability of a system or process to handle growth without losing quality or efficiency.' },
+      { id: 'C', text: 'A tangible or intangible good or service produced as a result of a project.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'A tangible or intangible good or service produced as a result of a project. Something that can be provided to satisfy a contractual obligation.',
+  },
+  'elitist': {
+    question: 'What does "elitist" mean?',
+    options: [
+      { id: 'A', text: 'The defining spirit, mood, or general intellectual and moral climate of an era.' },
+      { id: 'B', text: 'Relating to or believing in the superiority of a select group; advocating for power held by an elite few.' },
+      { id: 'C', text: 'Located at the edge or periphery; relating to something of little importance or influence.' },
+    ],
+    correctAnswer: 'B',
+    explanation: 'Relating to or believing in the superiority of a select group; advocating for power held by an elite few. Exclusive and dismissive of non-elite groups.',
+  },
+  'epochal': {
+    question: 'What does "epochal" mean?',
+    options: [
+      { id: 'A', text: 'A factual written account of important events in the order of their occurrence.' },
+      { id: 'B', text: 'A survey or review of past time or events.' },
+      { id: 'C', text: 'Forming or characterizing an epoch; of major importance or significance.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'Forming or characterizing an epoch; of major importance or significance. Describes events that mark the beginning of a new period in history.',
+  },
+  'grassroots': {
+    question: 'What does "grassroots" mean?',
+    options: [
+      { id: 'A', text: 'Originating from and involving ordinary people rather than established institutions or elites.' },
+      { id: 'B', text: 'The language or dialect spoken by the ordinary people in a particular region.' },
+      { id: 'C', text: 'An underlying and often distinct theme in a conversation or piece of writing.' },
+    ],
+    correctAnswer: 'A',
+    explanation: 'Originating from and involving ordinary people rather than established institutions or elites. Bottom-up movements driven by community members.',
+  },
+  'habituate': {
+    question: 'What does "habituate" mean?',
+    options: [
+      { id: 'A', text: 'Made aware or responsive to something.' },
+      { id: 'B', text: 'To make or become accustomed to something through repeated exposure.' },
+      { id: 'C', text: 'Truthful and straightforward; frank and sincere without evasion or pretense.' },
+    ],
+    correctAnswer: 'B',
+    explanation: 'To make or become accustomed to something through repeated exposure. The process of forming a habit or becoming used to a situation.',
+  },
+  'heuristic': {
+    question: 'What does "heuristic" mean?',
+    options: [
+      { id: 'A', text: 'A typical example or model; a framework of ideas, assumptions, and methods that shape how we understand and approach problems in a field.' },
+      { id: 'B', text: 'A practical approach to problem-solving using methods that are sufficient for reaching an immediate solution.' },
+      { id: 'C', text: 'Standing out prominently or notably; the most noticeable, important, or relevant aspect.' },
+    ],
+    correctAnswer: 'B',
+    explanation: 'A practical approach to problem-solving using methods that are sufficient for reaching an immediate solution. Learning through discovery and experimentation.',
+  },
+  'marginal': {
+    question: 'What does "marginal" mean?',
+    options: [
+      { id: 'A', text: 'Relating to or believing in the superiority of a select group; advocating for power held by an elite few.' },
+      { id: 'B', text: 'The defining spirit, mood, or general intellectual and moral climate of an era.' },
+      { id: 'C', text: 'Located at the edge or periphery; relating to something of little importance or influence.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'Located at the edge or periphery; relating to something of little importance or influence. Existing on the fringe rather than at the center.',
+  },
+  'mundane': {
+    question: 'What does "mundane" mean?',
+    options: [
+      { id: 'A', text: 'Direct and outspoken; expressing thoughts or feelings clearly without hesitation.' },
+      { id: 'B', text: 'A series of actions performed according to a prescribed order, often with symbolic meaning.' },
+      { id: 'C', text: 'Lacking interest or excitement; dull and routine.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'Lacking interest or excitement; dull and routine. Describes ordinary aspects of everyday life, often with a slightly negative connotation.',
+  },
+  'retrospect': {
+    question: 'What does "retrospect" mean?',
+    options: [
+      { id: 'A', text: 'A survey or review of past time or events.' },
+      { id: 'B', text: 'A factual written account of important events in the order of their occurrence.' },
+      { id: 'C', text: 'Forming or characterizing an epoch; of major importance or significance.' },
+    ],
+    correctAnswer: 'A',
+    explanation: 'A survey or review of past time or events. Looking back on or dealing with past circumstances, often with the benefit of hindsight.',
+  },
+  'ritual': {
+    question: 'What does "ritual" mean?',
+    options: [
+      { id: 'A', text: 'A series of actions performed according to a prescribed order, often with symbolic meaning.' },
+      { id: 'B', text: 'Direct and outspoken; expressing thoughts or feelings clearly without hesitation.' },
+      { id: 'C', text: 'Made aware or responsive to something.' },
+    ],
+    correctAnswer: 'A',
+    explanation: 'A series of actions performed according to a prescribed order, often with symbolic meaning. Can be religious, cultural, or personal in nature.',
+  },
+  'strategic': {
+    question: 'What does "strategic" mean?',
+    options: [
+      { id: 'A', text: 'Assigning responsibility and authority to others to accomplish tasks.' },
+      { id: 'B', text: 'To entrust a task or responsibility to another person, typically one who is less senior.' },
+      { id: 'C', text: 'Relating to the identification of long-term aims and interests and the means of achieving them.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'Relating to the identification of long-term aims and interests and the means of achieving them. Involves careful planning and positioning for success.',
+  },
+  'subtext': {
+    question: 'What does "subtext" mean?',
+    options: [
+      { id: 'A', text: 'The language or dialect spoken by the ordinary people in a particular region.' },
+      { id: 'B', text: 'An underlying and often distinct theme in a conversation or piece of writing.' },
+      { id: 'C', text: 'The defining spirit, mood, or general intellectual and moral climate of an era.' },
+    ],
+    correctAnswer: 'B',
+    explanation: 'An underlying and often distinct theme in a conversation or piece of writing. The implicit meaning beneath the surface of what is said or written.',
+  },
+  'synthesis': {
+    question: 'What does "synthesis" mean?',
+    options: [
+      { id: 'A', text: 'Relating to or using analysis or logical reasoning.' },
+      { id: 'B', text: 'The continued possession, use, or control of something, especially information in memory.' },
+      { id: 'C', text: 'The combination of ideas to form a theory or system, or the production of a substance by combining elements.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'The combination of ideas to form a theory or system, or the production of a substance by combining elements. Represents the creation of something new from existing parts.',
+  },
+  'vernacular': {
+    question: 'What does "vernacular" mean?',
+    options: [
+      { id: 'A', text: 'An underlying and often distinct theme in a conversation or piece of writing.' },
+      { id: 'B', text: 'Daily or occurring every day; ordinary, commonplace, mundane.' },
+      { id: 'C', text: 'The language or dialect spoken by the ordinary people in a particular region.' },
+    ],
+    correctAnswer: 'C',
+    explanation: 'The language or dialect spoken by the ordinary people in a particular region. Everyday, informal language as opposed to formal or literary language.',
+  },
+};
+
+export default generatedExercises;
@@ -2,6 +2,14 @@
 
 import { UserProfile, UserProfileManager } from './userProfile';
 import { BehaviorTracker } from './behaviorTracker';
+import calibratedDifficulty from './wordDifficulty';
+
+/**
+ * Difficulty calibrated from tracked events (event_analytics.py), else the hand-set value
+ */
+function difficultyOf(word: any): number {
+  return calibratedDifficulty[word.word] || word.difficulty || 5;
+}
 
 export interface WordRecommendation {
   words: any[];
@@ -98,7 +106,7 @@ export class PersonalizationEngine {
     let score = 0;
     
     const wordCluster = word.cluster || 'general';
-    const wordDifficulty = word.difficulty || 5;
+    const wordDifficulty = difficultyOf(word);
     
     // Cluster match (0-40 points)
     if (topClusters.includes(wordCluster)) {
@@ -214,7 +222,7 @@ export class PersonalizationEngine {
     clusters.slice(0, 5).forEach(cluster => {
       const clusterWords = wordDatabase
         .filter(w => (w.cluster || 'general') === cluster)
-        .filter(w => w.difficulty >= 4 && w.difficulty <= 7) // medium difficulty
+        .filter(w => difficultyOf(w) >= 4 && difficultyOf(w) <= 7) // medium difficulty
         .slice(0, wordsPerCluster);
       
       selected.push(...clusterWords);
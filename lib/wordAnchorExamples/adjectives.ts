@@ -0,0 +1,46 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'contingent': {
+    'Planning': 'Our trip is contingent on the weather forecast.',
+    'Uncertainty': 'There’s uncertainty because the outcome is contingent on funding.',
+    'Decision Making': 'My next step is contingent on the results of this meeting.',
+    'Future': 'The project’s future is contingent on market demand.',
+  },
+  'exigent': {
+    'Urgency': 'Exigent needs require urgent action and focus.',
+    'Crisis': 'In a crisis, exigent problems can’t be ignored.',
+    'Decision Making': 'Exigent situations force quick decision making.',
+    'Leadership': 'Leadership is tested by how one handles exigent demands.',
+  },
+  'inchoate': {
+    'Creativity': 'An inchoate idea can spark creativity before it’s fully formed.',
+    'Growth': 'Growth often starts in an inchoate stage, fragile and new.',
+    'Beginning': 'Every beginning is inchoate—uncertain and unshaped.',
+    'Development': 'Inchoate plans need nurturing to reach full development.',
+  },
+  'intractable': {
+    'Resilience': 'When intractable realities demand resilience beyond quick fixes',
+    'Acceptance': 'When you accept it as intractable and let go of control',
+    'Problem Solving': 'When an intractable bottleneck forces you to reframe the approach',
+    'Patience': 'When steady patience outlasts a problem that remains intractable',
+  },
+  'latent': {
+    'Growth': 'Growth can remain latent until new challenges arise.',
+    'Potential': 'You might not notice your potential is latent until the right moment.',
+    'Self-Discovery': 'Through self-discovery, a hidden talent may prove to be latent.',
+    'Dreams': 'Some dreams stay hidden, their latent power waiting to emerge.',
+  },
+  'nebulous': {
+    'Communication': 'When nebulous shapes communication',
+    'Clarity': 'When nebulous shapes clarity',
+    'Emotion': 'When feelings overwhelm rational thought',
+    'Understanding': 'When nebulous shapes understanding',
+  },
+  'opaque': {
+    'Understanding': 'When opaque brings genuine understanding',
+    'Trust': 'When opaque shapes trust',
+    'Communication': 'When opaque shapes communication',
+    'Clarity': 'When opaque shapes clarity',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,16 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'bane': {
+    'Work Habits': 'When bane shapes work habits',
+    'Personal Growth': 'When bane shapes personal growth',
+    'Challenges': 'When bane presents a real challenge',
+    'Obstacles': 'When bane presents a real challenge',
+  },
+  'plight': {
+    'Social Issues': 'When plight shapes social issues',
+    'Current Events': 'When breaking news shifts the conversation everywhere',
+    'Personal Experience': 'When plight shapes personal experience',
+    'History': 'When the past explains the present',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
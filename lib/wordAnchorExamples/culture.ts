@@ -0,0 +1,52 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'Zeitgeist': {
+    'Culture': 'Art and music often reflect the Zeitgeist of their time.',
+    'Society': 'Social movements can shape the Zeitgeist of a generation.',
+    'History': 'Each era’s Zeitgeist is recorded in its history.',
+    'Values': 'Changing values signal a shift in the Zeitgeist.',
+  },
+  'anachronistic': {
+    'History': 'A smartphone in ancient Rome is anachronistic.',
+    'Literature': 'The novel’s language felt anachronistic for its setting.',
+    'Film': 'Anachronistic costumes can distract viewers in historical films.',
+    'Culture': 'Some traditions seem anachronistic in today’s culture.',
+  },
+  'derivative': {
+    'Art': 'The painting was dismissed as derivative, echoing styles seen countless times before.',
+    'Creativity': 'Her approach felt derivative, lacking the spark of true innovation.',
+    'Criticism': 'Critics called the novel derivative because it borrowed too heavily from earlier works.',
+    'Culture': 'In pop culture, derivative trends often fade quickly as audiences crave originality.',
+  },
+  'didactic': {
+    'Teaching': 'Didactic teaching makes lessons clear but can feel rigid.',
+    'Art': 'Art becomes didactic when it puts the message above the experience.',
+    'Literature': 'Didactic literature spells out its moral for the reader.',
+    'Learning': 'Learning can be stifled if the approach is too didactic.',
+  },
+  'dogma': {
+    'Beliefs': 'When dogma shapes beliefs',
+    'Authority': 'When dogma shapes authority',
+    'Critical Thinking': 'When you question assumptions instead of accepting them',
+    'Growth': 'When you become more capable than you were before',
+  },
+  'ken': {
+    'Learning': 'Every new subject expands my ken just a little further.',
+    'Science': 'Some scientific theories remain outside my ken, but I enjoy exploring them.',
+    'Philosophy': 'Philosophy often pushes the boundaries of my ken.',
+    'Culture': 'Traveling exposes me to cultures beyond my ken.',
+  },
+  'parochial': {
+    'Culture': 'When shared beliefs and practices define how a group behaves',
+    'Travel': 'When parochial shapes travel',
+    'Perspective': 'When parochial shapes perspective',
+    'Bias': 'When parochial shapes bias',
+  },
+  'quotidian': {
+    'Routine': 'Brushing my teeth is a quotidian act that starts and ends my day.',
+    'Meaning': 'A quotidian walk with my dog brings unexpected joy and reflection.',
+    'Culture': 'In every culture, quotidian customs shape the rhythm of daily life.',
+    'Mindfulness': 'By noticing the beauty in quotidian moments, I practice mindfulness each morning.',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,28 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'candid': {
+    'Communication': 'When candid shapes communication',
+    'Growth': 'When you become more capable than you were before',
+    'Relationships': 'When candid shapes relationships',
+    'Honesty': 'When telling truth risks consequences',
+  },
+  'discern': {
+    'Observation': 'Careful observation helps you discern subtle changes.',
+    'Judgment': 'It takes sound judgment to discern truth from deception.',
+    'Insight': 'Insightful people discern patterns others overlook.',
+    'Understanding': 'To discern meaning requires deep understanding.',
+  },
+  'forthright': {
+    'Communication': 'When forthright shapes communication',
+    'Honesty': 'When telling truth risks consequences',
+    'Courage': 'When forthright shapes courage',
+    'Leadership': 'When you guide others toward a shared vision',
+  },
+  'resilient': {
+    'Challenge': 'When resilient shapes challenge',
+    'Growth': 'When you become more capable than you were before',
+    'Strength': 'When resilient shapes strength',
+    'Adaptation': 'When resilient shapes adaptation',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
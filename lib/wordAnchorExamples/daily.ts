@@ -0,0 +1,22 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'cordial': {
+    'Workplace': 'When cordial shapes workplace',
+    'Networking': 'When cordial shapes networking',
+    'Social Events': 'When cordial shapes social events',
+    'Customer Service': 'When you help someone solve their problem patiently',
+  },
+  'empathy': {
+    'Relationships': 'When you discover empathy is what deepens bonds with someone',
+    'Understanding': 'When true understanding requires genuine empathy',
+    'Vulnerability': 'When vulnerability becomes safe through empathy',
+    'Connection': 'When empathy creates a moment of real human connection',
+  },
+  'nuance': {
+    'Communication': 'When nuance shapes communication',
+    'Art': 'When nuance fuels creative expression',
+    'Relationships': 'When nuance shapes relationships',
+    'Decision Making': 'When nuance shapes decision making',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'complicity': {
+    'Accountability': 'Complicity requires accountability for silent approval.',
+    'Systems': 'Unjust systems can foster complicity among their members.',
+    'Responsibility': 'Taking responsibility means refusing complicity in harm.',
+    'Ethics': 'Ethical choices help us avoid complicity in wrongdoing.',
+  },
+  'culpable': {
+    'Accountability': 'I felt culpable and took accountability for my mistake.',
+    'Integrity': 'Integrity means admitting when you are culpable.',
+    'Responsibility': 'She was found culpable and accepted responsibility.',
+    'Growth': 'Growth comes from recognizing when you are culpable and learning from it.',
+  },
+  'exculpatory': {
+    'Judgment': 'Exculpatory facts can change your judgment about someone’s actions.',
+    'Fairness': 'A fair process considers exculpatory evidence before blaming.',
+    'Perspective': 'A new perspective may reveal exculpatory reasons for a mistake.',
+    'Justice': 'Justice requires weighing all exculpatory information.',
+  },
+  'expedient': {
+    'Decisions': 'Choosing the expedient option can solve problems quickly.',
+    'Compromise': 'An expedient compromise may sacrifice long-term goals.',
+    'Integrity': 'Integrity sometimes means rejecting expedient solutions.',
+    'Pragmatism': 'Expedient actions are often favored by pragmatists.',
+  },
+  'instrumentalise': {
+    'Relationships': 'When instrumentalise shapes relationships',
+    'Ethics': 'When you must choose between conflicting moral principles',
+    'Respect': 'When instrumentalise shapes respect',
+    'Work': 'When instrumentalise shapes work',
+  },
+  'moral hazard': {
+    'Risk': 'Moral hazard increases risk when people feel shielded from consequences.',
+    'Economics': 'In economics, moral hazard can distort market behavior.',
+    'Incentives': 'Poorly designed incentives may create moral hazard.',
+    'Policy': 'Policy makers must consider moral hazard when crafting regulations.',
+  },
+  'moralising': {
+    'Judgment': 'When you evaluate worth or quality',
+    'Communication': 'When moralising shapes communication',
+    'Humility': 'When you recognize your limitations honestly',
+    'Perspective': 'When moralising shapes perspective',
+  },
+  'normative': {
+    'Values': 'Normative values guide our sense of right and wrong.',
+    'Philosophy': 'Philosophers debate normative questions about how we should act.',
+    'Standards': 'A normative standard sets expectations for behavior.',
+    'Beliefs': 'Many beliefs are normative, expressing what ought to be.',
+  },
+  'paternalistic': {
+    'Autonomy': 'A paternalistic rule can limit personal autonomy for perceived benefit.',
+    'Authority': 'Paternalistic authority often justifies decisions as being for others’ good.',
+    'Care': 'Care can become paternalistic when it overrides someone’s choices.',
+    'Control': 'Paternalistic control restricts freedom under the guise of protection.',
+  },
+  'principled': {
+    'Integrity': 'When your actions match your stated values',
+    'Values': 'When principled shapes values',
+    'Character': 'When principled shapes character',
+    'Courage': 'When principled shapes courage',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,262 @@
+// Generated by the anchor example generators; do not edit by hand.
+export type AnchorExamples = Record<string, string>;
+type Shard = Record<string, AnchorExamples>;
+
+export const wordShards: Record<string, string> = {
+  'Zeitgeist': 'culture',
+  'actual': 'intellectual-clarity',
+  'actually': 'relational-calibration',
+  'alexithymia': 'psychology',
+  'ambivalence': 'psychology',
+  'ambivalent': 'nuance-traps',
+  'ameliorate': 'precision',
+  'anachronistic': 'culture',
+  'anhedonia': 'psychology',
+  'anthropogenic': 'nature',
+  'appreciate': 'relational-calibration',
+  'artefact': 'science',
+  'assertive': 'relational-calibration',
+  'assist': 'professional-precision',
+  'asymmetry': 'society',
+  'attenuate': 'precision',
+  'bane': 'conflict',
+  'benchmark': 'work',
+  'biodiversity': 'nature',
+  'blithe': 'literary',
+  'broach': 'precision',
+  'candid': 'daily-life',
+  'carbon sink': 'nature',
+  'circumscribe': 'precision',
+  'cleave': 'literary',
+  'cohesion': 'society',
+  'complicity': 'ethics',
+  'concern': 'relational-calibration',
+  'concerning': 'professional-precision',
+  'conflate': 'precision',
+  'consequential': 'nuance-traps',
+  'contingent': 'adjectives',
+  'cordial': 'daily',
+  'corroborate': 'precision',
+  'critical': 'intellectual-clarity',
+  'culpable': 'ethics',
+  'degenerate': 'science',
+  'delegation': 'work',
+  'depletion': 'nature',
+  'derivative': 'culture',
+  'desensitised': 'psychology',
+  'desertification': 'nature',
+  'didactic': 'culture',
+  'discern': 'daily-life',
+  'discuss': 'professional-precision',
+  'disinterested': 'nuance-traps',
+  'dissociation': 'psychology',
+  'distill': 'precision',
+  'dogma': 'culture',
+  'dogwhistle': 'rhetoric',
+  'dysphoria': 'psychology',
+  'elegiac': 'literary',
+  'elide': 'precision',
+  'elucidate': 'precision',
+  'emergent': 'science',
+  'empathy': 'daily',
+  'empirical': 'school',
+  'enormity': 'nuance-traps',
+  'entitlement': 'society',
+  'equivocal': 'nuance-traps',
+  'equivocation': 'rhetoric',
+  'eutrophication': 'nature',
+  'eventually': 'intellectual-clarity',
+  'exculpatory': 'ethics',
+  'exigent': 'adjectives',
+  'expedient': 'ethics',
+  'expert': 'school',
+  'externality': 'nature',
+  'extrapolate': 'school',
+  'facilitate': 'professional-precision',
+  'false dichotomy': 'rhetoric',
+  'falsifiable': 'school',
+  'fealty': 'literary',
+  'flashpoint': 'nature',
+  'forlorn': 'literary',
+  'forthright': 'daily-life',
+  'frugal': 'relational-calibration',
+  'furthermore': 'intellectual-clarity',
+  'gaslighting': 'rhetoric',
+  'gatekeeping': 'society',
+  'gleam': 'literary',
+  'granular': 'science',
+  'heathen': 'literary',
+  'hedging': 'rhetoric',
+  'hegemony': 'society',
+  'highlight': 'precision',
+  'honestly': 'relational-calibration',
+  'impugn': 'precision',
+  'inchoate': 'adjectives',
+  'incidental': 'nuance-traps',
+  'indicate': 'precision',
+  'ineffable': 'literary',
+  'inquire': 'professional-precision',
+  'insouciant': 'literary',
+  'instrumentalise': 'ethics',
+  'intractable': 'adjectives',
+  'invidious': 'nuance-traps',
+  'irritability': 'psychology',
+  'issue': 'professional-precision',
+  'justify': 'precision',
+  'ken': 'culture',
+  'kindly': 'professional-precision',
+  'lassitude': 'literary',
+  'latent': 'adjectives',
+  'legitimacy': 'society',
+  'leverage': 'professional-precision',
+  'loaded': 'rhetoric',
+  'logical fallacy': 'rhetoric',
+  'lugubrious': 'literary',
+  'moral hazard': 'ethics',
+  'moralising': 'ethics',
+  'naught': 'literary',
+  'nebulous': 'adjectives',
+  'nonplussed': 'nuance-traps',
+  'normative': 'ethics',
+  'nuance': 'daily',
+  'obdurate': 'literary',
+  'obfuscation': 'rhetoric',
+  'oblique': 'nuance-traps',
+  'opaque': 'adjectives',
+  'ostensible': 'nuance-traps',
+  'othering': 'society',
+  'paradigm': 'school',
+  'parochial': 'culture',
+  'parsimonious': 'science',
+  'paternalistic': 'ethics',
+  'pedagogy': 'school',
+  'performative': 'society',
+  'perfunctory': 'nuance-traps',
+  'pithy': 'literary',
+  'plight': 'conflict',
+  'polarisation': 'society',
+  'preclude': 'precision',
+  'prevarication': 'rhetoric',
+  'principled': 'ethics',
+  'proficiency': 'school',
+  'projection': 'psychology',
+  'quite': 'relational-calibration',
+  'quoth': 'literary',
+  'quotidian': 'culture',
+  'rather': 'relational-calibration',
+  'regarding': 'professional-precision',
+  'repudiate': 'precision',
+  'resignation': 'psychology',
+  'resilience': 'nature',
+  'resilient': 'daily-life',
+  'resolve': 'precision',
+  'respect': 'relational-calibration',
+  'retention': 'school',
+  'rewilding': 'nature',
+  'robust': 'science',
+  'rumination': 'psychology',
+  'salient': 'school',
+  'sardonic': 'literary',
+  'scalability': 'work',
+  'scalable': 'science',
+  'sensible': 'relational-calibration',
+  'significant': 'intellectual-clarity',
+  'simple': 'intellectual-clarity',
+  'smite': 'literary',
+  'social capital': 'society',
+  'somewhat': 'relational-calibration',
+  'specious': 'rhetoric',
+  'speculative': 'nuance-traps',
+  'stochastic': 'science',
+  'suggest': 'professional-precision',
+  'support': 'relational-calibration',
+  'swain': 'literary',
+  'sward': 'literary',
+  'synergy': 'work',
+  'tenuous': 'school',
+  'trade-off': 'work',
+  'undermine': 'precision',
+  'understand': 'relational-calibration',
+  'unique': 'relational-calibration',
+  'utilize': 'intellectual-clarity',
+  'verdant': 'literary',
+  'wane': 'literary',
+  'wend': 'literary',
+  'wraith': 'literary',
+  'wrath': 'literary',
+  'yore': 'literary',
+};
+
+const shardLoaders: Record<string, () => Promise<{ default: Shard }>> = {
+  'adjectives': () => import('./adjectives'),
+  'conflict': () => import('./conflict'),
+  'culture': () => import('./culture'),
+  'daily': () => import('./daily'),
+  'daily-life': () => import('./daily-life'),
+  'ethics': () => import('./ethics'),
+  'intellectual-clarity': () => import('./intellectual-clarity'),
+  'literary': () => import('./literary'),
+  'nature': () => import('./nature'),
+  'nuance-traps': () => import('./nuance-traps'),
+  'precision': () => import('./precision'),
+  'professional-precision': () => import('./professional-precision'),
+  'psychology': () => import('./psychology'),
+  'relational-calibration': () => import('./relational-calibration'),
+  'rhetoric': () => import('./rhetoric'),
+  'school': () => import('./school'),
+  'science': () => import('./science'),
+  'society': () => import('./society'),
+  'work': () => import('./work'),
+};
+
+type ContentManifest = Record<string, { path: string }>;
+
+let contentManifest: Promise<ContentManifest> | undefined;
+const loadedShards: Record<string, Promise<Shard>> = {};
+
+async function fetchJson<T>(url: string): Promise<T> {
+  const res = await fetch(url);
+  if (!res.ok) throw new Error(`${url}: HTTP ${res.status}`);
+  return res.json();
+}
+
+function loadContentManifest(): Promise<ContentManifest> {
+  if (!contentManifest) {
+    contentManifest = fetchJson<ContentManifest>('/content/manifest.json').catch((err) => {
+      contentManifest = undefined;
+      throw err;
+    });
+  }
+  return contentManifest;
+}
+
+// The published artifact (content-addressed, precompressed) when the
+// manifest lists it, otherwise the chunk bundled with the app.
+async function fetchShard(shard: string, loader: () => Promise<{ default: Shard }>): Promise<Shard> {
+  try {
+    const artifact = (await loadContentManifest())['wordAnchorExamples/' + shard];
+    if (artifact) return await fetchJson<Shard>(artifact.path);
+  } catch {
+    // Fall through to the bundled chunk
+  }
+  return (await loader()).default;
+}
+
+export function loadShard(shard: string): Promise<Shard> {
+  if (!loadedShards[shard]) {
+    const loader = shardLoaders[shard];
+    loadedShards[shard] = loader
+      ? fetchShard(shard, loader).catch((err) => {
+          // Forget a failed load so the next call retries it
+          delete loadedShards[shard];
+          throw err;
+        })
+      : Promise.resolve({});
+  }
+  return loadedShards[shard];
+}
+
+export async function loadAnchorExamples(word: string): Promise<AnchorExamples | undefined> {
+  const shard = wordShards[word];
+  return shard ? (await loadShard(shard))[word] : undefined;
+}
@@ -0,0 +1,46 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'actual': {
+    'Language Learning': 'When you acquire new ways of thinking through tongues',
+    'False Friends': 'When words that look similar mean completely different things',
+    'Communication': 'When actual transforms how you speak',
+    'Identity': 'When you define who you are',
+  },
+  'critical': {
+    'Work Email': 'When critical shapes work email',
+    'Feedback': 'When input from others helps you improve or stings your pride',
+    'Anxiety': 'When critical shapes anxiety',
+    'Miscommunication': 'When critical shapes miscommunication',
+  },
+  'eventually': {
+    'Language Learning': 'When you acquire new ways of thinking through tongues',
+    'Mistakes': 'When eventually shapes mistakes',
+    'Growth': 'When you become more capable than you were before',
+    'Communication': 'When eventually shapes communication',
+  },
+  'furthermore': {
+    'Presentations': 'When furthermore shapes presentations',
+    'Meetings': 'When groups gather to decide or discuss',
+    'Public Speaking': 'When furthermore shapes public speaking',
+    'Communication': 'When furthermore shapes communication',
+  },
+  'significant': {
+    'Presentations': 'When significant shapes presentations',
+    'Reports': 'When significant shapes reports',
+    'Data': 'When numbers tell a story words cannot',
+    'Communication': 'When significant shapes communication',
+  },
+  'simple': {
+    'Design': 'A simple design can be both elegant and effective.',
+    'Problem Solving': 'Simple solutions often solve complex problems best.',
+    'Creativity': 'Creativity can shine in a simple, clear idea.',
+    'Work': 'Simple processes at work reduce errors and stress.',
+  },
+  'utilize': {
+    'Writing': 'Writers often utilize complex words when simple ones work better.',
+    'Communication': 'Clear communication rarely needs "utilize" instead of "use".',
+    'Clarity': 'To maximize clarity, utilize direct and simple language.',
+    'Confidence': 'Confident speakers utilize plain words to build trust.',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
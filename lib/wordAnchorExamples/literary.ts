@@ -0,0 +1,154 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'blithe': {
+    'Youth': 'When blithe shapes youth',
+    'Relationship': 'When blithe deepens your relationships',
+    'Warning Ignored': 'When blithe shapes warning ignored',
+    'Responsibility': 'When blithe shapes responsibility',
+  },
+  'cleave': {
+    'Family': 'When blood or chosen bonds create your closest ties',
+    'Partnership': 'When cleave shapes partnership',
+    'Friendship': 'When trust and affection grow over time',
+    'Creative Collaboration': 'When artists combine their talents to make something new',
+  },
+  'elegiac': {
+    'Art': 'When elegiac fuels creative expression',
+    'Literature': 'When stories reveal universal human truths',
+    'Memory': 'When elegiac shapes memory',
+    'Emotion': 'When feelings overwhelm rational thought',
+  },
+  'fealty': {
+    'Loyalty': 'When commitment persists through difficulty',
+    'Honor': 'When you uphold principles even when it costs you',
+    'Commitment': 'When fealty shapes commitment',
+    'Relationships': 'When fealty shapes relationships',
+  },
+  'forlorn': {
+    'Travel': 'A forlorn train station at night felt empty and cold.',
+    'Memory': 'A childhood memory can seem forlorn with the passage of time.',
+    'Reading': 'The novel’s hero wandered through a forlorn landscape.',
+    'Film': 'A forlorn scene in the film showed a lone figure in the rain.',
+  },
+  'gleam': {
+    'Hope': 'A gleam of hope can change your outlook in dark times.',
+    'Inspiration': 'Sometimes a creative idea starts as a simple gleam.',
+    'Light': 'A single gleam lit up the entire room.',
+    'Possibility': 'Every new project begins with a gleam of possibility.',
+  },
+  'heathen': {
+    'Identity': 'When you define who you are',
+    'Outsider': 'When heathen shapes outsider',
+    'Culture': 'When shared beliefs and practices define how a group behaves',
+    'Perspective': 'When heathen shapes perspective',
+  },
+  'ineffable': {
+    'Spirituality': 'When ineffable shapes spirituality',
+    'Art': 'When ineffable fuels creative expression',
+    'Love': 'When deep affection transcends rational explanation',
+    'Mystery': 'When ineffable shapes mystery',
+  },
+  'insouciant': {
+    'Confidence': 'An insouciant attitude can project effortless confidence.',
+    'Freedom': 'She felt insouciant, free from worry or restraint.',
+    'Attitude': 'His insouciant smile disarmed the critics.',
+    'Literature': 'Many literary heroes are admired for their insouciant charm.',
+  },
+  'lassitude': {
+    'Fatigue': 'After days of work, lassitude left me unable to focus.',
+    'Emotion': 'A wave of lassitude followed the emotional news.',
+    'Resilience': 'Resilience means finding energy even in lassitude.',
+    'Health': 'Poor health can bring on a sense of lassitude.',
+  },
+  'lugubrious': {
+    'Literature': 'When stories reveal universal human truths',
+    'Emotion': 'When feelings overwhelm rational thought',
+    'Atmosphere': 'When lugubrious shapes atmosphere',
+    'Memory': 'When lugubrious shapes memory',
+  },
+  'naught': {
+    'Project': 'When naught shapes project',
+    'Relationship': 'When naught shapes relationship',
+    'Goal': 'When a clear target focuses your efforts',
+    'Creative Work': 'When you make something original that didn\'t exist before',
+  },
+  'obdurate': {
+    'Conflict': 'When obdurate shapes conflict',
+    'Character': 'When obdurate shapes character',
+    'Relationships': 'When obdurate shapes relationships',
+    'Growth': 'When you become more capable than you were before',
+  },
+  'pithy': {
+    'Writing': 'When pithy shapes writing',
+    'Communication': 'When pithy shapes communication',
+    'Advice': 'When pithy shapes advice',
+    'Wisdom': 'When pithy shapes wisdom',
+  },
+  'quoth': {
+    'Literature': 'When stories reveal universal human truths',
+    'Wisdom': 'When quoth shapes wisdom',
+    'Repetition': 'When quoth shapes repetition',
+    'Prophecy': 'When quoth shapes prophecy',
+  },
+  'sardonic': {
+    'Humor': 'Sardonic humor uses wit to mask cynicism.',
+    'Communication': 'A sardonic remark can change the mood of a conversation.',
+    'Tone': 'A sardonic tone often sounds mocking or dry.',
+    'Personality': 'A sardonic personality is quick with sharp, dark comments.',
+  },
+  'smite': {
+    'Revelation': 'A sudden revelation can smite you with clarity.',
+    'Impact': 'The news smote the community with unexpected impact.',
+    'Divine': 'Legends tell of gods who smite wrongdoers.',
+    'Transformation': 'Sometimes, change smites us and we are transformed.',
+  },
+  'swain': {
+    'Courtship': 'When swain shapes courtship',
+    'Love Letters': 'When written words carry the heart',
+    'Traditions': 'When swain shapes traditions',
+    'Gestures': 'When small acts communicate what words cannot',
+  },
+  'sward': {
+    'Childhood Place': 'When sward shapes childhood place',
+    'Travel Memory': 'When sward shapes travel memory',
+    'Park': 'When sward shapes park',
+    'Natural Setting': 'When sward shapes natural setting',
+  },
+  'verdant': {
+    'Nature': 'When verdant shapes nature',
+    'Travel': 'When verdant shapes travel',
+    'Memory': 'When verdant shapes memory',
+    'Beauty': 'When verdant shapes beauty',
+  },
+  'wane': {
+    'Change': 'As seasons shift, my enthusiasm can wane and then return anew.',
+    'Acceptance': 'I accept that some friendships wane over the years.',
+    'Time': 'With time, excitement for old hobbies may wane.',
+    'Impermanence': 'Wane reminds me that nothing lasts forever.',
+  },
+  'wend': {
+    'Journey': 'When the path matters as much as the destination',
+    'Purpose': 'When wend shapes purpose',
+    'Path': 'When wend shapes path',
+    'Future': 'When you imagine what\'s ahead with hope or dread',
+  },
+  'wraith': {
+    'Past Relationship': 'When wraith shapes past relationship',
+    'Old Home': 'When wraith shapes old home',
+    'Childhood Memory': 'When wraith awakens memory',
+    'Lost Dream': 'When you grieve what will never be',
+  },
+  'wrath': {
+    'Literature': 'When stories reveal universal human truths',
+    'History': 'When the past explains the present',
+    'Mythology': 'When wrath shapes mythology',
+    'Film': 'When cinema captures something words cannot',
+  },
+  'yore': {
+    'Family History': 'When your ancestors\' stories shape your identity',
+    'Historical Era': 'When a specific time period shapes events and values',
+    'Mythology': 'When yore shapes mythology',
+    'Old Customs': 'When yore shapes old customs',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
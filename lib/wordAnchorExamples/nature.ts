@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'anthropogenic': {
+    'Human Impact': 'When actions affect people in profound ways',
+    'Environment': 'When your surroundings profoundly affect your state',
+    'Responsibility': 'When anthropogenic shapes responsibility',
+    'Action': 'When anthropogenic shapes action',
+  },
+  'biodiversity': {
+    'Variety': 'Biodiversity brings variety to every ecosystem.',
+    'Health': 'Ecosystem health depends on rich biodiversity.',
+    'Connections': 'Connections between species are shaped by biodiversity.',
+    'Strength': 'Greater biodiversity gives strength and resilience to nature.',
+  },
+  'carbon sink': {
+    'Balance': 'Forests act as a carbon sink, helping maintain balance in the atmosphere.',
+    'Absorption': 'A carbon sink absorbs more CO₂ than it releases.',
+    'Protection': 'Carbon sinks provide protection against climate change.',
+    'Stability': 'Stable carbon sinks are vital for long-term environmental health.',
+  },
+  'depletion': {
+    'Sustainability': 'Depletion of forests threatens the sustainability of our planet.',
+    'Limits': 'Depletion shows the limits of our resources.',
+    'Energy': 'After a long week, I feel the depletion of my energy reserves.',
+    'Balance': 'To avoid depletion, I strive for balance between work and rest.',
+  },
+  'desertification': {
+    'Degradation': 'Desertification is a warning sign of land degradation.',
+    'Neglect': 'Neglect can lead to desertification in both land and life.',
+    'Warning': 'Desertification serves as a warning to change our habits.',
+    'Care': 'Care and attention can prevent desertification and restore vitality.',
+  },
+  'eutrophication': {
+    'Balance': 'Eutrophication disrupts the natural balance of aquatic ecosystems.',
+    'Excess': 'Excess nutrients in water lead to eutrophication.',
+    'Consequences': 'A major consequence of eutrophication is oxygen depletion.',
+    'Systems': 'Eutrophication shows how systems can collapse from oversupply.',
+  },
+  'externality': {
+    'Consequences': 'Pollution is a classic negative externality of industry.',
+    'Responsibility': 'Responsible companies work to reduce externalities.',
+    'Impact': 'Externality effects can ripple far beyond the original action.',
+    'Awareness': 'Awareness of externality helps inform better decisions.',
+  },
+  'flashpoint': {
+    'Threshold': 'A flashpoint marks the threshold where change becomes inevitable.',
+    'Crisis': 'Every crisis has a flashpoint that sets it off.',
+    'Awareness': 'Awareness of flashpoints can help you avoid escalation.',
+    'Prevention': 'Prevention means addressing issues before they reach a flashpoint.',
+  },
+  'resilience': {
+    'Recovery': 'When resilience shapes recovery',
+    'Adaptation': 'When resilience shapes adaptation',
+    'Strength': 'When resilience shapes strength',
+    'Growth': 'When you become more capable than you were before',
+  },
+  'rewilding': {
+    'Nature': 'Restoring lost habitats and species is the goal of rewilding.',
+    'Control': 'Letting go of control can feel like rewilding your routine.',
+    'Restoration': 'Restoration sometimes means rewilding both land and mind.',
+    'Balance': 'A better balance with nature can result from rewilding.',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,76 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'ambivalent': {
+    'Emotion': 'When feelings overwhelm rational thought',
+    'Decision Making': 'When ambivalent shapes decision making',
+    'Relationships': 'When ambivalent deepens your relationships',
+    'Growth': 'When you become more capable than you were before',
+  },
+  'consequential': {
+    'Impact': 'When actions create lasting change',
+    'Importance': 'When something deserves priority and attention',
+    'Choice': 'When consequential shapes choice',
+    'Life Direction': 'When big choices determine your path',
+  },
+  'disinterested': {
+    'Fairness': 'A disinterested approach ensures fairness for all sides.',
+    'Judgment': 'Disinterested judgment is free from personal bias.',
+    'Conflict': 'In conflict, a disinterested mediator can help both parties.',
+    'Impartiality': 'Impartiality means being truly disinterested in the outcome.',
+  },
+  'enormity': {
+    'History': 'When the past explains the present',
+    'Morality': 'When enormity guides ethical choices',
+    'Justice': 'When fairness is served through systems or actions',
+    'Understanding': 'When enormity shapes understanding',
+  },
+  'equivocal': {
+    'Communication': 'Equivocal communication leaves room for multiple interpretations.',
+    'Ambiguity': 'Ambiguity often results from an equivocal statement.',
+    'Honesty': 'An equivocal answer can hide the truth or avoid commitment.',
+    'Language': 'Language is powerful when it’s clear, but equivocal words can confuse.',
+  },
+  'incidental': {
+    'Chance': 'Incidental meetings can lead to unexpected opportunities.',
+    'Discovery': 'An incidental discovery changed the course of my research.',
+    'Perspective': 'Incidental details sometimes shift your perspective.',
+    'Attention': 'Paying attention to the incidental can reveal hidden patterns.',
+  },
+  'invidious': {
+    'Fairness': 'Invidious remarks undermine fairness in any group.',
+    'Bias': 'Bias is often revealed through invidious comparisons.',
+    'Social Justice': 'Social justice seeks to address invidious discrimination.',
+    'Ethics': 'Ethics demand we avoid making invidious judgments.',
+  },
+  'nonplussed': {
+    'Surprise': 'When nonplussed shapes surprise',
+    'Emotion': 'When feelings overwhelm rational thought',
+    'Reaction': 'When nonplussed shapes reaction',
+    'Language': 'When words unlock or obscure understanding',
+  },
+  'oblique': {
+    'Communication': 'When oblique shapes communication',
+    'Directness': 'When you skip the sugar-coating and speak plainly',
+    'Relationships': 'When oblique shapes relationships',
+    'Courage': 'When oblique shapes courage',
+  },
+  'ostensible': {
+    'Truth': 'The truth was hidden behind an ostensible explanation.',
+    'Deception': 'Ostensible motives can be a form of deception.',
+    'Relationships': 'In relationships, ostensible reasons may mask deeper feelings.',
+    'Insight': 'Insight revealed the ostensible excuse was not the real reason.',
+  },
+  'perfunctory': {
+    'Attention': 'A perfunctory glance shows little real attention.',
+    'Respect': 'Perfunctory greetings can feel disrespectful.',
+    'Connection': 'A perfunctory reply weakens genuine connection.',
+    'Authenticity': 'Authenticity is lost in perfunctory interactions.',
+  },
+  'speculative': {
+    'Uncertainty': 'When speculative shapes uncertainty',
+    'Decision Making': 'When speculative shapes decision making',
+    'Risk': 'When speculative shapes risk',
+    'Intuition': 'When your gut knows before your brain can explain',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
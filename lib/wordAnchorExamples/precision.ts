@@ -0,0 +1,106 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'ameliorate': {
+    'Problem Solving': 'We worked together to ameliorate the effects of the outage.',
+    'Improvement': 'Small changes can ameliorate even persistent issues.',
+    'Leadership': 'A good leader seeks to ameliorate team stress during busy times.',
+    'Action': 'Taking action early helped ameliorate the crisis.',
+  },
+  'attenuate': {
+    'Time': 'The effects of a mistake can attenuate with time.',
+    'Emotion': 'Intense emotions often attenuate as circumstances change.',
+    'Healing': 'Therapy can attenuate the pain of past trauma.',
+    'Perspective': 'Distance helps attenuate the impact of old conflicts.',
+  },
+  'broach': {
+    'Communication': 'When broach shapes communication',
+    'Courage': 'When broach shapes courage',
+    'Relationships': 'When broach shapes relationships',
+    'Honesty': 'When telling truth risks consequences',
+  },
+  'circumscribe': {
+    'Constraint': 'Strict rules circumscribe what is possible in this competition.',
+    'Creativity': 'Sometimes, being circumscribed by time sparks creative solutions.',
+    'Boundaries': 'The project was circumscribed by clear boundaries set at the start.',
+    'Adaptation': 'I learned to adapt when my options were circumscribed by circumstance.',
+  },
+  'conflate': {
+    'Precision': 'Precision is lost when you conflate separate ideas.',
+    'Language': 'People sometimes conflate words with similar meanings.',
+    'Critical Thinking': 'Critical thinking helps you not conflate facts and opinions.',
+    'Clarity': 'To achieve clarity, avoid conflating unrelated issues.',
+  },
+  'corroborate': {
+    'Validation': 'When corroborate shapes validation',
+    'Truth': 'When corroborate shapes truth',
+    'Evidence': 'When facts either support or undermine a claim',
+    'Support': 'When corroborate provides genuine support',
+  },
+  'distill': {
+    'Analysis': 'We tried to distill the data into a few key trends.',
+    'Clarity': 'Distill your message for clarity and impact.',
+    'Communication': 'Good communication can distill complex topics for any audience.',
+    'Understanding': 'I gained understanding by distilling the lesson to its core ideas.',
+  },
+  'elide': {
+    'Communication': 'When elide shapes communication',
+    'Honesty': 'When telling truth risks consequences',
+    'Avoidance': 'When elide shapes avoidance',
+    'Tact': 'When elide shapes tact',
+  },
+  'elucidate': {
+    'Learning': 'A good example can elucidate a difficult topic for learners.',
+    'Teaching': 'She used stories to elucidate complex ideas in her teaching.',
+    'Clarity': 'Analogies often elucidate abstract concepts, bringing clarity.',
+    'Understanding': 'My understanding improved when the teacher elucidated each step.',
+  },
+  'highlight': {
+    'Communication': 'I highlight key points to ensure everyone understands the message.',
+    'Visibility': 'Highlighting achievements increases visibility for the whole team.',
+    'Leadership': 'A good leader knows when to highlight the efforts of others.',
+    'Priorities': 'It is important to highlight our top priorities during busy times.',
+  },
+  'impugn': {
+    'Trust': 'It hurts when others impugn your trustworthiness without cause.',
+    'Criticism': 'The review seemed to impugn my work rather than offer helpful feedback.',
+    'Integrity': 'She refused to let anyone impugn her integrity during the investigation.',
+    'Conflict': 'In heated conflict, people sometimes impugn each other’s motives.',
+  },
+  'indicate': {
+    'Signals': 'A sudden drop in sales may indicate a problem with our product.',
+    'Awareness': 'My awareness of stress can indicate when I need a break.',
+    'Strategy': 'Changing market trends indicate it’s time to adjust our strategy.',
+    'Evidence': 'Clear evidence is needed to indicate a real improvement.',
+  },
+  'justify': {
+    'Accountability': 'When justify shapes accountability',
+    'Reasoning': 'When justify shapes reasoning',
+    'Stakeholders': 'When justify shapes stakeholders',
+    'Values': 'When justify shapes values',
+  },
+  'preclude': {
+    'Decisions': 'When preclude shapes decisions',
+    'Limitations': 'When boundaries define what\'s possible',
+    'Adaptation': 'When preclude shapes adaptation',
+    'Constraints': 'When preclude shapes constraints',
+  },
+  'repudiate': {
+    'Growth': 'When you become more capable than you were before',
+    'Change': 'When repudiate shapes change',
+    'Values': 'When repudiate shapes values',
+    'Identity': 'When you define who you are',
+  },
+  'resolve': {
+    'Decision Making': 'I resolve to act after weighing all the options carefully.',
+    'Conflict': 'We worked together to resolve the disagreement peacefully.',
+    'Clarity': 'A clear plan can resolve confusion before it grows.',
+    'Follow-through': 'Resolve is needed to follow through on tough commitments.',
+  },
+  'undermine': {
+    'Trust': 'When undermine shapes trust',
+    'Power': 'When undermine shapes power',
+    'Team Dynamics': 'When undermine shapes team dynamics',
+    'Integrity': 'When your actions match your stated values',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'assist': {
+    'Workplace Relationships': 'When assist shapes workplace relationships',
+    'Tone': 'When assist shapes tone',
+    'Friendliness': 'When warmth creates easy connection',
+    'Professional Distance': 'When assist shapes professional distance',
+  },
+  'concerning': {
+    'Performance Review': 'When concerning shapes performance review',
+    'Feedback': 'When input from others helps you improve or stings your pride',
+    'Work Anxiety': 'When concerning shapes work anxiety',
+    'Communication': 'When concerning transforms how you speak',
+  },
+  'discuss': {
+    'Meetings': 'When groups gather to decide or discuss',
+    'Conflict': 'When discuss shapes conflict',
+    'Decision Making': 'When discuss shapes decision making',
+    'Communication': 'When discuss shapes communication',
+  },
+  'facilitate': {
+    'Project Management': 'When facilitate shapes project management',
+    'Leadership': 'When you guide others toward a shared vision',
+    'Coordination': 'When facilitate shapes coordination',
+    'Teamwork': 'When facilitate shapes teamwork',
+  },
+  'inquire': {
+    'Job Search': 'When you inquire about opportunities with respect and professionalism',
+    'Networking': 'When using inquire elevates your outreach above casual asking',
+    'First Impressions': 'When the word inquire signals you understand formality',
+    'Professional Email': 'When you inquire in writing and set the right tone',
+  },
+  'issue': {
+    'Crisis Management': 'When you keep calm and make decisions under extreme pressure',
+    'Client Communication': 'When issue shapes client communication',
+    'Spin': 'When issue shapes spin',
+    'Professional': 'When issue shapes professional',
+  },
+  'kindly': {
+    'Work Email': 'When kindly shapes work email',
+    'Conflict': 'When kindly shapes conflict',
+    'Boundaries': 'When kindly shapes boundaries',
+    'Professional Communication': 'When kindly shapes professional communication',
+  },
+  'leverage': {
+    'Strategy': 'When leverage shapes strategy',
+    'Business': 'When leverage shapes business',
+    'Jargon': 'When specialized language excludes or includes',
+    'Communication': 'When leverage shapes communication',
+  },
+  'regarding': {
+    'Client Email': 'When regarding shapes client email',
+    'Team Communication': 'When regarding strengthens your team',
+    'Professional Tone': 'When regarding shapes professional tone',
+    'Formality': 'When proper manners and protocol matter',
+  },
+  'suggest': {
+    'Meetings': 'I suggest a new approach during our meetings.',
+    'Leadership': 'Good leadership can suggest change without demanding it.',
+    'Confidence': 'Low confidence may suggest uncertainty to others.',
+    'Decision Making': 'I suggest we review all options before deciding.',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'alexithymia': {
+    'Emotional Literacy': 'When you can name and understand complex feelings',
+    'Reflection': 'When alexithymia shapes reflection',
+    'Communication': 'When alexithymia shapes communication',
+    'Growth': 'When you become more capable than you were before',
+  },
+  'ambivalence': {
+    'Decisions': 'When ambivalence shapes decisions',
+    'Values': 'When ambivalence shapes values',
+    'Conflict': 'When ambivalence shapes conflict',
+    'Self-Insight': 'When ambivalence shapes self-insight',
+  },
+  'anhedonia': {
+    'Mood': 'When anhedonia shapes mood',
+    'Recovery': 'When anhedonia shapes recovery',
+    'Habits': 'When repeated actions become automatic',
+    'Self-Care': 'When anhedonia shapes self-care',
+  },
+  'desensitised': {
+    'Boundaries': 'When desensitised shapes boundaries',
+    'Adaptation': 'When desensitised shapes adaptation',
+    'Media': 'When information shapes collective understanding',
+    'Wellbeing': 'When desensitised shapes wellbeing',
+  },
+  'dissociation': {
+    'Coping': 'When dissociation shapes coping',
+    'Safety': 'When dissociation shapes safety',
+    'Presence': 'When dissociation shapes presence',
+    'Regulation': 'When dissociation shapes regulation',
+  },
+  'dysphoria': {
+    'Mood': 'When dysphoria shapes mood',
+    'Self-Monitoring': 'When dysphoria shapes self-monitoring',
+    'Wellbeing': 'When dysphoria shapes wellbeing',
+    'Awareness': 'When dysphoria shapes awareness',
+  },
+  'irritability': {
+    'Regulation': 'Good regulation helps reduce irritability throughout the day.',
+    'Stress': 'High stress can quickly lead to irritability over small things.',
+    'Self-Care': 'Neglecting self-care often increases my irritability.',
+    'Awareness': 'Awareness of my triggers helps me manage irritability.',
+  },
+  'projection': {
+    'Self-Awareness': 'Self-awareness helps me notice when projection is happening.',
+    'Bias': 'Projection can bias our view of others unfairly.',
+    'Relationships': 'In relationships, projection often causes misunderstandings.',
+    'Emotions': 'Strong emotions may lead to projection onto those around us.',
+  },
+  'resignation': {
+    'Agency': 'When resignation shapes agency',
+    'Motivation': 'When resignation shapes motivation',
+    'Change': 'When resignation signals transformative change',
+    'Mindset': 'When resignation shapes mindset',
+  },
+  'rumination': {
+    'Coping': 'When rumination shapes coping',
+    'Awareness': 'When rumination shapes awareness',
+    'Habits': 'When repeated actions become automatic',
+    'Mental Health': 'When rumination shapes mental health',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,88 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'actually': {
+    'Meetings': 'When groups gather to decide or discuss',
+    'Misunderstandings': 'When actually shapes misunderstandings',
+    'Conflict': 'When actually shapes conflict',
+    'Communication': 'When actually shapes communication',
+  },
+  'appreciate': {
+    'Gratitude': 'When appreciation deepens your experience',
+    'Teamwork': 'When appreciate shapes teamwork',
+    'Relationships': 'When appreciate shapes relationships',
+    'Support': 'When appreciate shapes support',
+  },
+  'assertive': {
+    'Meetings': 'Being assertive in meetings helps your ideas get heard.',
+    'Conflict': 'Assertive responses can resolve conflict without aggression.',
+    'Confidence': 'Assertive people show confidence by expressing their views.',
+    'Communication': 'Clear, assertive communication prevents misunderstandings.',
+  },
+  'concern': {
+    'Feedback': 'When input from others helps you improve or stings your pride',
+    'Care': 'When concern shapes care',
+    'Criticism': 'When someone points out flaws you didn\'t want to see',
+    'Relationships': 'When concern deepens your relationships',
+  },
+  'frugal': {
+    'Money': 'A frugal approach to money means spending wisely, not excessively.',
+    'Relationships': 'Frugal habits can cause tension or admiration in relationships.',
+    'Values': 'Being frugal often reflects personal values about waste and need.',
+    'Judgment': 'Calling someone frugal can be praise or a subtle judgment.',
+  },
+  'honestly': {
+    'Difficult Conversations': 'When you must say something hard but necessary',
+    'Trust': 'When honestly shapes trust',
+    'Vulnerability': 'When honestly shapes vulnerability',
+    'Communication': 'When honestly shapes communication',
+  },
+  'quite': {
+    'Cultural Differences': 'When customs or values clash across cultures',
+    'International Work': 'When cultural context complicates collaboration',
+    'Miscommunication': 'When quite transforms how you speak',
+    'Compliments': 'When quite shapes compliments',
+  },
+  'rather': {
+    'Feedback': 'When using rather softens criticism but muddles the message',
+    'Compliments': 'When you say rather good and sound less enthusiastic than intended',
+    'Tone': 'When using rather creates the distance you didn\'t mean to create',
+    'Encouragement': 'When hedging with rather takes the power out of your words',
+  },
+  'respect': {
+    'Boundaries': 'When respect shapes boundaries',
+    'Disagreement': 'When you respectfully hold opposing views',
+    'Relationships': 'When respect deepens your relationships',
+    'Acceptance': 'When respect shapes acceptance',
+  },
+  'sensible': {
+    'Language Learning': 'Learning English, I thought "sensible" meant sensitive.',
+    'Embarrassment': 'I felt embarrassed when my sensible advice was misunderstood.',
+    'False Friends': 'Sensible and sensitive are classic false friends in language.',
+    'Communication': 'A sensible comment can help resolve misunderstandings.',
+  },
+  'somewhat': {
+    'Difficult Conversations': 'Her response was somewhat defensive during our talk.',
+    'Feedback': 'I said the report was somewhat unclear to soften my critique.',
+    'Relationships': 'Being somewhat honest can help preserve a relationship.',
+    'Honesty': 'My honesty was somewhat compromised by my desire to be kind.',
+  },
+  'support': {
+    'Commitment': 'True commitment means you support your team through challenges.',
+    'Action': 'I chose to support the project by taking action, not just agreeing.',
+    'Advocacy': 'Advocacy requires you to support causes you believe in.',
+    'Teamwork': 'Support from teammates makes collaboration successful.',
+  },
+  'understand': {
+    'Empathy': 'When you understand another\'s pain as deeply as your own',
+    'Listening': 'When truly listening means you understand before you respond',
+    'Emotional Support': 'When understanding becomes a bridge instead of a barrier',
+    'Friendship': 'When friends understand you in ways that matter',
+  },
+  'unique': {
+    'Feedback': 'When input from others helps you improve or stings your pride',
+    'Art': 'When unique shapes art',
+    'Creativity': 'When an unexpected solution pops into your mind',
+    'Communication': 'When unique shapes communication',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'dogwhistle': {
+    'Language': 'When words unlock or obscure understanding',
+    'Codes': 'When dogwhistle shapes codes',
+    'Awareness': 'When dogwhistle shapes awareness',
+    'Interpretation': 'When meaning depends on perspective',
+  },
+  'equivocation': {
+    'Honesty': 'Equivocation undermines honesty by hiding the truth.',
+    'Communication': 'Clear communication avoids the trap of equivocation.',
+    'Accountability': 'People use equivocation to dodge accountability.',
+    'Self-Awareness': 'Recognizing your own equivocation takes self-awareness.',
+  },
+  'false dichotomy': {
+    'Logic': 'A false dichotomy ignores logical alternatives.',
+    'Nuance': 'Nuance is lost when a false dichotomy is presented.',
+    'Critical Thinking': 'Critical thinking helps expose a false dichotomy in arguments.',
+    'Polarization': 'False dichotomy often fuels polarization in debates.',
+  },
+  'gaslighting': {
+    'Manipulation': 'When someone controls through deception',
+    'Psychological': 'When gaslighting shapes psychological',
+    'Awareness': 'When gaslighting shapes awareness',
+    'Protection': 'When gaslighting shapes protection',
+  },
+  'hedging': {
+    'Communication': 'When hedging shapes communication',
+    'Accountability': 'When hedging shapes accountability',
+    'Courage': 'When hedging shapes courage',
+    'Honesty': 'When telling truth risks consequences',
+  },
+  'loaded': {
+    'Language': 'When words unlock or obscure understanding',
+    'Emotion': 'When feelings overwhelm rational thought',
+    'Bias': 'When loaded shapes bias',
+    'Awareness': 'When loaded shapes awareness',
+  },
+  'logical fallacy': {
+    'Critical Thinking': 'When you question assumptions instead of accepting them',
+    'Logic': 'When reason guides you through complexity',
+    'Reasoning': 'When logical fallacy shapes reasoning',
+    'Skepticism': 'When logical fallacy shapes skepticism',
+  },
+  'obfuscation': {
+    'Communication': 'When obfuscation shapes communication',
+    'Clarity': 'When obfuscation shapes clarity',
+    'Deception': 'When you realize someone intentionally misled you',
+    'Awareness': 'When obfuscation brings genuine understanding',
+  },
+  'prevarication': {
+    'Honesty': 'Prevarication undermines honesty by twisting the truth.',
+    'Integrity': 'A person with integrity avoids prevarication in all forms.',
+    'Evasion': 'Prevarication is a subtle form of evasion.',
+    'Ethics': 'Ethical standards reject prevarication as misleading.',
+  },
+  'specious': {
+    'Critical Thinking': 'Critical thinking helps you spot specious arguments quickly.',
+    'Debate': 'In debate, specious claims can mislead the audience.',
+    'Media': 'Specious headlines in media often distort the facts.',
+    'Decision Making': 'Avoiding specious reasoning is key to sound decision making.',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'empirical': {
+    'Learning': 'When knowledge fundamentally changes you',
+    'Testing': 'When empirical shapes testing',
+    'Science': 'When empirical shapes science',
+    'Growth': 'When you become more capable than you were before',
+  },
+  'expert': {
+    'Professional Skill': 'When expert sharpens your skills',
+    'Hobby': 'When you pursue something purely for joy',
+    'Creative Pursuit': 'When you chase an artistic dream despite obstacles',
+    'Life Experience': 'When living teaches what studying cannot',
+  },
+  'extrapolate': {
+    'Prediction': 'To predict the outcome, I had to extrapolate from limited data.',
+    'Problem Solving': 'Sometimes, you must extrapolate a solution from a few clues.',
+    'Planning': 'We extrapolated future needs based on current trends.',
+    'Inference': 'Extrapolating from past events helped me infer what might happen next.',
+  },
+  'falsifiable': {
+    'Critical Thinking': 'A falsifiable claim can be challenged and tested through evidence.',
+    'Science': 'Scientific theories must be falsifiable to be considered valid.',
+    'Beliefs': 'Not all beliefs are falsifiable, making them hard to disprove.',
+    'Learning': 'Learning what is falsifiable sharpens critical thinking.',
+  },
+  'paradigm': {
+    'Perspective': 'When paradigm shapes perspective',
+    'Learning': 'When knowledge fundamentally changes you',
+    'Growth': 'When you become more capable than you were before',
+    'Belief': 'When paradigm shapes belief',
+  },
+  'pedagogy': {
+    'Education': 'Modern pedagogy emphasizes active learning in the classroom.',
+    'Mentorship': 'A mentor’s pedagogy shapes how knowledge is shared.',
+    'Self-Teaching': 'Effective self-teaching borrows from sound pedagogy.',
+    'Skill Development': 'Skill development benefits from adaptive pedagogy.',
+  },
+  'proficiency': {
+    'Language': 'Proficiency in a language means thinking and expressing yourself with ease.',
+    'Music': 'Musical proficiency lets you play complex pieces smoothly.',
+    'Sports': 'Proficiency in sports shows in skillful, confident moves.',
+    'Technical Skill': 'Technical proficiency is solving problems with expertise.',
+  },
+  'retention': {
+    'School Memory': 'When retention shapes school memory',
+    'Life Lesson': 'When hard-won wisdom emerges from struggle',
+    'Professional Knowledge': 'When retention shapes professional knowledge',
+    'Personal Story': 'When retention shapes personal story',
+  },
+  'salient': {
+    'Reading': 'When salient shapes reading',
+    'Writing': 'When salient shapes writing',
+    'Memory': 'When salient shapes memory',
+    'Learning': 'When knowledge fundamentally changes you',
+  },
+  'tenuous': {
+    'Relationships': 'When tenuous deepens your relationships',
+    'Work': 'When tenuous shapes work',
+    'Learning': 'When knowledge fundamentally changes you',
+    'Change': 'When tenuous shapes change',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
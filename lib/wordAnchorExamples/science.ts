@@ -0,0 +1,52 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'artefact': {
+    'Bias': 'When a sampling artefact looks like bias',
+    'Reflection': 'When you call it an artefact and rethink the claim',
+    'Learning': 'When artefacts vanish after you change the method',
+    'Objectivity': 'When objectivity demands that you test for artefacts first',
+  },
+  'degenerate': {
+    'Strategy': 'When degenerate shapes strategy',
+    'Equivalence': 'When two different things turn out to be essentially the same',
+    'Insight': 'When sudden understanding illuminates what was dark',
+    'Efficiency': 'When you accomplish more with less effort or time',
+  },
+  'emergent': {
+    'Systems': 'When emergent structure arises from simple local rules',
+    'Teams': 'When a team’s emergent rhythm outperforms any single star',
+    'Complexity': 'When complexity yields emergent patterns no part predicts alone',
+    'Observation': 'When careful observation reveals truly emergent behavior',
+  },
+  'granular': {
+    'Problem-Solving': 'A granular approach helped me solve the complex problem step by step.',
+    'Precision': 'Granular data allows for precise measurements and conclusions.',
+    'Analysis': 'We performed a granular analysis to uncover hidden trends.',
+    'Learning': 'Learning improves when you break concepts down to a granular level.',
+  },
+  'parsimonious': {
+    'Decision-Making': 'I made a parsimonious decision by picking the simplest solution.',
+    'Design': 'The building’s parsimonious design used only what was needed.',
+    'Efficiency': 'A parsimonious workflow cut out all unnecessary steps.',
+    'Strategy': 'We chose a parsimonious strategy with one clear goal.',
+  },
+  'robust': {
+    'Resilience': 'When robust systems absorb shocks without losing integrity',
+    'Reliability': 'When your process stays robust across messy inputs',
+    'Habits': 'When a robust habit carries you through chaos',
+    'Performance': 'When even on bad days, your results stay robust',
+  },
+  'scalable': {
+    'Principles': 'A scalable principle guides both individuals and teams.',
+    'Transfer': 'Scalable solutions transfer easily from one context to another.',
+    'Systems': 'If a system is scalable, it works at any size.',
+    'Leadership': 'Scalable leadership adapts from small groups to large organizations.',
+  },
+  'stochastic': {
+    'Uncertainty': 'Stochastic events introduce uncertainty into predictions.',
+    'Patterns': 'Stochastic processes can reveal hidden patterns over time.',
+    'Observation': 'Careful observation helps distinguish stochastic noise from real signals.',
+    'Risk': 'Understanding stochastic risk is crucial in finance and science.',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
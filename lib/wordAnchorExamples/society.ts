@@ -0,0 +1,64 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'asymmetry': {
+    'Imbalance': 'When things tip unfairly or unsustainably',
+    'Power': 'When asymmetry shapes power',
+    'Inequality': 'When unfair systems advantage some over others',
+    'Awareness': 'When asymmetry shapes awareness',
+  },
+  'cohesion': {
+    'Unity': 'Cohesion brings unity to diverse groups.',
+    'Community': 'A sense of community grows from strong cohesion.',
+    'Bonds': 'Shared experiences create bonds and cohesion.',
+    'Belonging': 'Cohesion gives people a sense of belonging.',
+  },
+  'entitlement': {
+    'Privilege': 'Entitlement often grows from unexamined privilege.',
+    'Self-Examination': 'Self-examination can reveal hidden entitlement.',
+    'Expectations': 'High expectations may signal entitlement rather than merit.',
+    'Awareness': 'Awareness helps challenge entitlement in ourselves and others.',
+  },
+  'gatekeeping': {
+    'Access': 'Gatekeeping limits access to certain groups or resources.',
+    'Exclusion': 'Strict boundaries can result from exclusion and gatekeeping.',
+    'Control': 'Communities sometimes use gatekeeping to control who belongs.',
+    'Belonging': 'A sense of belonging may be lost when gatekeeping is too strong.',
+  },
+  'hegemony': {
+    'Power': 'Hegemony gives power to dominant groups in subtle ways.',
+    'Culture': 'Cultural hegemony influences what is seen as normal.',
+    'Norms': 'Social norms often reflect the hegemony of a majority.',
+    'Awareness': 'Awareness of hegemony helps challenge unfair systems.',
+  },
+  'legitimacy': {
+    'Authority': 'Legitimacy turns power into true authority.',
+    'Recognition': 'Recognition by the people grants legitimacy to leaders.',
+    'Power': 'Power without legitimacy is often challenged.',
+    'Acceptance': 'Legitimacy depends on acceptance by those governed.',
+  },
+  'othering': {
+    'Exclusion': 'Othering leads to exclusion and isolation of groups.',
+    'Awareness': 'Awareness of othering helps challenge harmful stereotypes.',
+    'Social Dynamics': 'Othering shapes social dynamics by creating in-groups and out-groups.',
+    'Identity': 'Othering can impact how people see their own identity.',
+  },
+  'performative': {
+    'Authenticity': 'When performative shapes authenticity',
+    'Self-Examination': 'When performative shapes self-examination',
+    'Sincerity': 'When performative shapes sincerity',
+    'Action': 'When performative shapes action',
+  },
+  'polarisation': {
+    'Division': 'When a group splits into opposing factions',
+    'Extremes': 'When you push to the absolute limits',
+    'Conflict': 'When polarisation shapes conflict',
+    'Society': 'When polarisation shapes cultural moments',
+  },
+  'social capital': {
+    'Connections': 'When social capital shapes connections',
+    'Community': 'When social capital shapes community',
+    'Resources': 'When social capital shapes resources',
+    'Support': 'When social capital shapes support',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
@@ -0,0 +1,34 @@
+const wordAnchorExamples: Record<string, Record<string, string>> = {
+  'benchmark': {
+    'Personal Goals': 'When you use a benchmark to know if you\'re actually getting closer to your goal',
+    'Competition': 'A benchmark reveals your place in the competition.',
+    'Self-Assessment': 'When an honest benchmark reveals both your strengths and gaps',
+    'Progress': 'When consistent benchmarking proves your improvement over time',
+  },
+  'delegation': {
+    'Leadership': 'When delegation multiplies your impact by empowering others',
+    'Team Management': 'When effective delegation builds trust and develops your team',
+    'Projects': 'When delegation gets the project done faster and better',
+    'Learning': 'When delegation forces you to trust others and grow as a leader',
+  },
+  'scalability': {
+    'Learning': 'When scalability shows how practice transforms struggle into ease',
+    'Growth': 'When scalability of your abilities compounds over time',
+    'Efficiency': 'When scalability means doing more with less effort',
+    'Mastery': 'When true scalability emerges from deliberate practice',
+  },
+  'synergy': {
+    'Team Project': 'When synergy between collaborators exceeds what individual talents could achieve',
+    'Collaboration': 'When you find the right partners and synergy emerges naturally',
+    'Creative Work': 'When creative synergy transforms diverse artistic visions into something revolutionary',
+    'Problem Solving': 'When synergy across disciplines unlocks solutions no single approach could find',
+  },
+  'trade-off': {
+    'Career': 'When trade-off shapes career',
+    'Decision Making': 'When trade-off guides your important decisions',
+    'Priorities': 'When trade-off clarifies what truly matters',
+    'Strategy': 'When trade-off shapes strategy',
+  },
+};
+
+export default wordAnchorExamples;
\ No newline at end of file
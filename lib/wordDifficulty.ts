@@ -0,0 +1,4 @@
+const calibratedDifficulty: Record<string, number> = {
+};
+
+export default calibratedDifficulty;
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Asyncio client for the app's POST /api/generate model proxy.
+
+The proxy takes {"prompt", "max_tokens"} and returns the upstream JSON
+(`completion` for the legacy completion API) or {"error"} with a non-2xx
+status. The client speaks HTTP/1.1 directly over asyncio streams so the
+tooling stays standard-library only:
+
+  - keep-alive connections are pooled and reused, at most `concurrency`
+    open (and in flight) at once
+  - a token bucket caps the request rate (`rate` per second, `burst` at once)
+  - connection errors, timeouts, 429 and 5xx are retried with capped
+    exponential backoff and full jitter, honouring Retry-After
+"""
+import asyncio
+import json
+import math
+import random
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+DEFAULT_URL = 'http://localhost:3000/api/generate'
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class ModelError(RuntimeError):
+    """A request that failed for good (non-retryable, or out of retries)."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def retry_after_seconds(value):
+    """Seconds to wait from a Retry-After header (delay or HTTP-date); None if unusable."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+    return max(seconds, 0.0) if math.isfinite(seconds) else None
+
+
+class _RetryableError(Exception):
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """`rate` tokens per second, holding at most `burst`; rate None is unlimited."""
+
+    def __init__(self, rate=None, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    def close(self):
+        self.writer.close()
+
+
+async def _read_body(reader, headers):
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                # Trailers end with a blank line.
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+    length = headers.get('content-length')
+    if length is not None:
+        return await reader.readexactly(int(length))
+    return await reader.read()
+
+
+class ModelClient:
+    """Pooled, rate-limited, retrying client; use as `async with`."""
+
+    def __init__(self, url=DEFAULT_URL, concurrency=8, rate=None, burst=None,
+                 retries=4, timeout=60.0, backoff=0.5, backoff_cap=20.0):
+        parts = urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError(f"only http:// proxies are supported, got {url!r}")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or '/'
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.backoff_cap = backoff_cap
+        self.bucket = TokenBucket(rate, burst or concurrency)
+        self._slots = asyncio.Semaphore(concurrency)
+        self._idle = []
+        self.stats = {'requests': 0, 'retries': 0, 'connections': 0, 'failures': 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _connect(self):
+        if self._idle:
+            return self._idle.pop()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        self.stats['connections'] += 1
+        return _Connection(reader, writer)
+
+    async def _post(self, conn, body):
+        conn.writer.write(
+            f"POST {self.path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: keep-alive\r\n\r\n".encode('ascii') + body)
+        await conn.writer.drain()
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise ConnectionResetError('connection closed by proxy')
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[0].startswith(b'HTTP/') or not parts[1].isdigit():
+            # Garbage from a misbehaving proxy; the connection is closed and the request retried.
+            raise _RetryableError(f"malformed status line {status_line[:80]!r}")
+        status = int(parts[1])
+        headers = {}
+        while True:
+            line = await conn.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        payload = await _read_body(conn.reader, headers)
+        if headers.get('connection', '').lower() == 'close':
+            conn.reusable = False
+        return status, headers, payload
+
+    async def _attempt(self, body):
+        await self.bucket.acquire()
+        async with self._slots:
+            conn = await self._connect()
+            try:
+                status, headers, payload = await asyncio.wait_for(self._post(conn, body), self.timeout)
+            except BaseException:
+                conn.close()
+                raise
+            if conn.reusable:
+                self._idle.append(conn)
+            else:
+                conn.close()
+        self.stats['requests'] += 1
+        if status in RETRY_STATUSES:
+            raise _RetryableError(f"HTTP {status}", retry_after_seconds(headers.get('retry-after')))
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            raise ModelError(f"HTTP {status}: response is not JSON", status)
+        if not isinstance(data, dict):
+            raise ModelError(f"HTTP {status}: response is not a JSON object", status)
+        if status >= 400 or 'error' in data:
+            raise ModelError(f"HTTP {status}: {data.get('error')}", status)
+        return data
+
+    async def complete(self, prompt, max_tokens=300):
+        """Completion text for `prompt`, retrying transient failures."""
+        body = json.dumps({'prompt': prompt, 'max_tokens': max_tokens}).encode('utf-8')
+        for attempt in range(self.retries + 1):
+            try:
+                data = await self._attempt(body)
+            except (_RetryableError, ConnectionError, OSError,
+                    asyncio.TimeoutError, asyncio.IncompleteReadError) as err:
+                if attempt == self.retries:
+                    self.stats['failures'] += 1
+                    raise ModelError(f"gave up after {attempt + 1} attempts: {err}") from err
+                self.stats['retries'] += 1
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff * 2 ** attempt))
+                await asyncio.sleep(max(delay, getattr(err, 'retry_after', None) or 0))
+                continue
+            except ModelError:
+                self.stats['failures'] += 1
+                raise
+            return completion_text(data)
+
+    async def complete_many(self, prompts, max_tokens=300):
+        """Complete every prompt concurrently; failures come back as ModelError."""
+        return await asyncio.gather(*(self.complete(p, max_tokens) for p in prompts), return_exceptions=True)
+
+
+def completion_text(data):
+    """Text of a legacy completion or a messages-API response."""
+    if 'completion' in data:
+        return data['completion']
+    content = data.get('content')
+    if isinstance(content, list):
+        return ''.join(block.get('text', '') for block in content if isinstance(block, dict))
+    raise ModelError(f"unrecognised response shape: {sorted(data)}")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Prompts for model-written anchor examples, single and packed.
+
+A single prompt asks for one sentence for one (word, definition, category)
+pair. A packed prompt lists many numbered pairs and asks for a JSON reply,
+{"examples": [{"id": 1, "example": "When ..."}, ...]}, so one request
+carries a whole word (all its categories) or one category across many
+words. plan_packs() fills packs up to a reply budget of `max_tokens`, and
+parse_packed_reply() validates a reply entry by entry so only the pairs
+that came back malformed need another request.
+
+Packing is only a transport detail: an example is keyed by the single
+prompt's fingerprint however it was requested, so packed and unpacked runs
+share cache entries.
+"""
+import hashlib
+import json
+import re
+
+MAX_TOKENS = 80
+PACKED_MAX_TOKENS = 1200
+
+# Rough sizes for budgeting, in tokens (about four characters each).
+EXAMPLE_TOKENS = 40
+REPLY_OVERHEAD_TOKENS = 20
+
+PROMPT_TEMPLATE = (
+    "\n\nHuman: Write one short memory-anchor sentence for a vocabulary word.\n"
+    "It must start with \"When\", use the word naturally, and fit the category.\n"
+    "Reply with the sentence only.\n\n"
+    "Word: {word}\n"
+    "Definition: {definition}\n"
+    "Category: {category}\n\n"
+    "Assistant:"
+)
+PROMPT_VERSION = hashlib.sha1(f"{PROMPT_TEMPLATE}\0{MAX_TOKENS}".encode('utf-8')).hexdigest()[:16]
+
+PACKED_HEADER = (
+    "\n\nHuman: Write one short memory-anchor sentence for each numbered item below.\n"
+    "Each must start with \"When\", use the word naturally, and fit the category.\n"
+    "Reply with JSON only, exactly in the form "
+    "{\"examples\": [{\"id\": 1, \"example\": \"When ...\"}]}, with one entry per item.\n\n"
+)
+PACKED_ITEM = "{id}. Word: {word} | Definition: {definition} | Category: {category}\n"
+PACKED_FOOTER = "\nAssistant:"
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def build_prompt(word, definition, category):
+    return PROMPT_TEMPLATE.format(word=word, definition=definition, category=category)
+
+
+def clean_example(text):
+    """First non-empty line of a completion, unquoted; None if unusable."""
+    for line in text.strip().splitlines():
+        line = line.strip().strip('"\'“”').strip()
+        if line:
+            return line if line.lower().startswith('when') else None
+    return None
+
+
+def _one_line(value):
+    return ' '.join(value.split())
+
+
+def build_packed_prompt(pack):
+    """Numbered prompt for a list of (word, definition, category) pairs."""
+    items = ''.join(
+        PACKED_ITEM.format(id=i, word=_one_line(word), definition=_one_line(definition),
+                           category=_one_line(category))
+        for i, (word, definition, category) in enumerate(pack, 1))
+    return PACKED_HEADER + items + PACKED_FOOTER
+
+
+def reply_budget(size):
+    """max_tokens to request for a pack of `size` pairs."""
+    return REPLY_OVERHEAD_TOKENS + EXAMPLE_TOKENS * size
+
+
+def plan_packs(pairs, group_by='word', max_tokens=PACKED_MAX_TOKENS):
+    """Cut pairs into packs whose replies fit in `max_tokens`.
+
+    Pairs are grouped by word or by category, keeping first-seen order;
+    whole groups are added to the current pack while they fit, and a group
+    is split only when it is larger than a pack on its own.
+    """
+    capacity = max(1, (max_tokens - REPLY_OVERHEAD_TOKENS) // EXAMPLE_TOKENS)
+    position = 0 if group_by == 'word' else 2
+    groups = {}
+    for pair in pairs:
+        groups.setdefault(pair[position], []).append(pair)
+
+    packs = []
+    current = []
+    for group in groups.values():
+        if len(current) + len(group) > capacity and current:
+            packs.append(current)
+            current = []
+        for i in range(0, len(group), capacity):
+            chunk = group[i:i + capacity]
+            if len(current) + len(chunk) > capacity:
+                packs.append(current)
+                current = []
+            current.extend(chunk)
+    if current:
+        packs.append(current)
+    return packs
+
+
+def parse_packed_reply(text, size):
+    """({id: example}, [ids missing or malformed]) for a packed reply.
+
+    Ids are 1-based as in the prompt. Anything that is not valid JSON of
+    the requested shape marks every id as malformed.
+    """
+    match = _JSON_OBJECT.search(text)
+    try:
+        data = json.loads(match.group()) if match else None
+    except ValueError:
+        data = None
+    entries = data.get('examples') if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return {}, list(range(1, size + 1))
+
+    good = {}
+    seen = set()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        entry_id = entry.get('id')
+        example = entry.get('example')
+        if not isinstance(entry_id, int) or not 1 <= entry_id <= size or entry_id in seen:
+            continue
+        seen.add(entry_id)
+        if isinstance(example, str):
+            example = clean_example(example)
+            if example is not None:
+                good[entry_id] = example
+    return good, [i for i in range(1, size + 1) if i not in good]
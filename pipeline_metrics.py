@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Opt-in timing and rule hit counters for the example generators.
+
+The generators take `--metrics PATH` (repeatable). Without it nothing is
+measured; with it each run records
+
+  - wall and CPU seconds per stage: read, parse, generate, emit, write
+    (scripts that load through the corpus cache count that under parse)
+  - how many shipped examples were authored, came from a scenario file or
+    came from rules
+  - for every branch of the rule cascade, how many rule-made examples it
+    produced, including the generic default ("When {word} shapes ...")
+    reached with no matching group or with a group but no matching branch
+
+and writes them on exit as Prometheus text format when PATH ends in .prom
+or .txt, and as JSON otherwise, so CI can track speed and fallback rate.
+
+Hit counts are taken over the final examples, not the pairs evaluated in
+this run, so incremental and --jobs runs report the same numbers as a full
+serial run.
+"""
+import contextlib
+import json
+import time
+
+from ts_emitter import atomic_write
+
+NO_GROUP = '(none)'
+DEFAULT_BRANCH = '(default)'
+PROMETHEUS_SUFFIXES = ('.prom', '.txt')
+
+
+def branch_label(keywords):
+    return '/'.join(keywords)
+
+
+def _prometheus_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _sample(name, labels, value):
+    rendered = ','.join(f'{key}="{_prometheus_label(val)}"' for key, val in labels.items())
+    return f"{name}{{{rendered}}} {value}\n"
+
+
+class PipelineMetrics:
+    """Stage timers and rule counters for one generator run."""
+
+    def __init__(self, pipeline, paths=()):
+        self.pipeline = pipeline
+        self.paths = list(paths or ())
+        self.enabled = bool(self.paths)
+        self.stages = {}
+        self.examples = {'authored': 0, 'scenarios': 0, 'rules': 0}
+        self.rules = None
+        self.rules_version = None
+        self.rule_hits = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.save()
+
+    def save(self):
+        """Write every requested export; does nothing when disabled."""
+        if self.enabled:
+            for path in self.paths:
+                self.write(path)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the block under `name`; repeated blocks accumulate."""
+        if not self.enabled:
+            yield
+            return
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            totals = self.stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'calls': 0})
+            totals['wall_seconds'] += time.perf_counter() - start
+            totals['cpu_seconds'] += time.process_time() - cpu_start
+            totals['calls'] += 1
+
+    def count_rules(self, rules, records, scenarios=None):
+        """Count which branch made each example for example_pool-style records.
+
+        `records` are (word, definition, categories, authored) tuples; a
+        later record for the same word replaces an earlier one, as in
+        generation. Authored and scenario categories are counted but not
+        attributed.
+        """
+        if not self.enabled:
+            return
+        compiled = rules.compile()
+        self.rules = rules.name
+        self.rules_version = rules.version
+        hits = {}
+        for label, _, branches in rules.groups:
+            for keywords, _ in branches:
+                hits[label, branch_label(keywords)] = 0
+            hits[label, DEFAULT_BRANCH] = 0
+        hits[NO_GROUP, DEFAULT_BRANCH] = 0
+
+        latest = {record[0]: record for record in records}
+        for _, definition, categories, authored in latest.values():
+            for category in dict.fromkeys(categories):
+                if category in authored:
+                    self.examples['authored'] += 1
+                    continue
+                if scenarios is not None and scenarios.get(category) is not None:
+                    self.examples['scenarios'] += 1
+                    continue
+                self.examples['rules'] += 1
+                group, branch = compiled.branch_for(definition, category)
+                if group < 0:
+                    key = NO_GROUP, DEFAULT_BRANCH
+                else:
+                    label, _, branches = rules.groups[group]
+                    key = label, DEFAULT_BRANCH if branch < 0 else branch_label(branches[branch][0])
+                hits[key] += 1
+        self.rule_hits = hits
+
+    @property
+    def fallback_hits(self):
+        return sum(count for (_, branch), count in self.rule_hits.items() if branch == DEFAULT_BRANCH)
+
+    @property
+    def fallback_rate(self):
+        return self.fallback_hits / self.examples['rules'] if self.examples['rules'] else 0.0
+
+    def to_json(self):
+        data = {
+            'pipeline': self.pipeline,
+            'stages': {name: dict(totals) for name, totals in self.stages.items()},
+            'examples': dict(self.examples),
+        }
+        if self.rules is not None:
+            data['rules'] = {
+                'name': self.rules,
+                'version': self.rules_version,
+                'fallback_hits': self.fallback_hits,
+                'fallback_rate': self.fallback_rate,
+                'branches': [{'group': group, 'branch': branch, 'hits': count}
+                             for (group, branch), count in self.rule_hits.items()],
+            }
+        return data
+
+    def to_prometheus(self):
+        lines = []
+        pipeline = {'pipeline': self.pipeline}
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}\n# TYPE {name} {kind}\n")
+            lines.extend(_sample(name, labels, value) for labels, value in samples)
+
+        metric('content_pipeline_stage_wall_seconds', 'gauge', 'Wall-clock seconds spent in each stage.',
+               [({**pipeline, 'stage': name}, totals['wall_seconds']) for name, totals in self.stages.items()])
+        metric('content_pipeline_stage_cpu_seconds', 'gauge', 'CPU seconds spent in each stage.',
+               [({**pipeline, 'stage': name}, totals['cpu_seconds']) for name, totals in self.stages.items()])
+        metric('content_pipeline_examples', 'gauge', 'Shipped examples by where they came from.',
+               [({**pipeline, 'source': source}, count) for source, count in self.examples.items()])
+        if self.rules is not None:
+            rules = {**pipeline, 'rules': self.rules}
+            metric('content_pipeline_rule_hits', 'gauge', 'Rule-made examples produced by each cascade branch.',
+                   [({**rules, 'group': group, 'branch': branch}, count)
+                    for (group, branch), count in self.rule_hits.items()])
+            metric('content_pipeline_fallback_ratio', 'gauge',
+                   'Share of rule-made examples that used the generic default.',
+                   [(rules, self.fallback_rate)])
+        return ''.join(lines)
+
+    def write(self, path):
+        with atomic_write(path) as out:
+            if path.endswith(PROMETHEUS_SUFFIXES):
+                out.write(self.to_prometheus())
+            else:
+                out.write(json.dumps(self.to_json(), indent=2) + "\n")
+
+    def summary(self):
+        timing = ', '.join(f"{name} {totals['wall_seconds']:.3f}s" for name, totals in self.stages.items())
+        text = (f"{timing}; {self.examples['authored']} authored, "
+                f"{self.examples['scenarios']} from scenarios, {self.examples['rules']} rule-made")
+        if self.rules is not None:
+            text += f", {self.fallback_rate:.1%} generic default"
+        return text
+
+
+def add_metrics_argument(parser):
+    parser.add_argument('--metrics', action='append', default=[], metavar='PATH',
+                        help='write stage timings and rule hit counts (.prom/.txt: Prometheus, else JSON); '
+                             'repeatable')
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Compare every rule set on every (word, category) pair in one pass.
+
+Usage: python3 rule_diff.py [--source PATH] [--rules all_examples,v2,comprehensive]
+                            [--output diffs.jsonl] [--summary summary.json] [--limit 10]
+
+The corpus is parsed once (through the corpus cache) and every pair is
+evaluated under all the chosen rule sets together (example_rules'
+CompiledRuleSets): each definition is lowercased and scanned once for all
+of them, and each distinct category once. Pairs where every rule set picks
+the same template are settled without formatting anything.
+
+Pairs whose examples differ are streamed as JSON lines to --output (stdout
+by default) as they are found: word, category, and per rule set the
+example and the branch that made it. Per-branch totals and diff counts
+are printed to stderr at the end, and written as JSON with --summary.
+"""
+import argparse
+import json
+import sys
+import time
+
+from corpus_cache import load_word_content_cached
+from example_rules import RULE_SETS, CompiledRuleSets
+from pipeline_metrics import DEFAULT_BRANCH, NO_GROUP, branch_label
+from ts_emitter import atomic_write
+from word_content import WORD_CONTENT_PATH
+
+DEFAULT_LIMIT = 10
+
+
+def _branch_labels(rules):
+    """[group][branch] -> (group label, branch label), with -1 slots for the defaults."""
+    labels = [[(label, branch_label(keywords)) for keywords, _ in branches] + [(label, DEFAULT_BRANCH)]
+              for label, _, branches in rules.groups]
+    labels.append([(NO_GROUP, DEFAULT_BRANCH)])
+    return labels
+
+
+def diff_rule_sets(entries, rule_sets, counts):
+    """Yield a dict for every pair whose examples differ between `rule_sets`.
+
+    `counts` is filled once the pairs are exhausted: counts[name][(group,
+    branch)] is [pairs, differing pairs] for each rule set. A word's last
+    entry wins, as in generation.
+    """
+    compiled = CompiledRuleSets(rule_sets)
+    names = [rules.name for rules in rule_sets]
+    labels = [_branch_labels(rules) for rules in rule_sets]
+    sets = range(len(rule_sets))
+
+    # Everything but the formatted text depends only on the definition
+    # groups and the category, so it is worked out once per combination.
+    decided = {}
+    tallies = {}
+
+    latest = {}
+    for entry in entries:
+        if entry.categories:
+            latest[entry.word] = entry
+    for word, entry in latest.items():
+        groups = compiled.groups_for(entry.definition)
+        for category in dict.fromkeys(entry.categories):
+            key = groups, category
+            decision = decided.get(key)
+            if decision is None:
+                cat_lower, branches, templates = compiled.resolve_category(category)
+                chosen = [templates[s][groups[s]] for s in sets]
+                picked = tuple(labels[s][groups[s]][branches[s][groups[s]]] for s in sets)
+                same = chosen.count(chosen[0]) == len(chosen)
+                decision = decided[key] = (cat_lower, None if same else chosen, picked)
+                tallies[key] = [0, 0]
+            tally = tallies[key]
+            tally[0] += 1
+            cat_lower, chosen, picked = decision
+            if chosen is None:
+                continue
+            examples = [template.format(word=word, category=cat_lower) for template in chosen]
+            if examples.count(examples[0]) == len(examples):
+                continue
+            tally[1] += 1
+            yield {
+                'word': word,
+                'category': category,
+                'examples': dict(zip(names, examples)),
+                'branches': {name: list(label) for name, label in zip(names, picked)},
+            }
+
+    for name, rule_labels in zip(names, labels):
+        counts[name] = {label: [0, 0] for group in rule_labels for label in group}
+    for key, (total, differing) in tallies.items():
+        for name, label in zip(names, decided[key][2]):
+            counts[name][label][0] += total
+            counts[name][label][1] += differing
+
+
+def summary_json(counts, pairs, differing, seconds):
+    return {
+        'pairs': pairs,
+        'differing': differing,
+        'seconds': seconds,
+        'rules': {
+            name: [{'group': group, 'branch': branch, 'pairs': total, 'differing': diff}
+                   for (group, branch), (total, diff) in tally.items()]
+            for name, tally in counts.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream the pairs where the rule sets disagree')
+    parser.add_argument('--source', default=WORD_CONTENT_PATH)
+    parser.add_argument('--rules', default=','.join(RULE_SETS),
+                        help=f"comma-separated rule sets to compare (default: {','.join(RULE_SETS)})")
+    parser.add_argument('--output', default='-', help='JSON lines of differing pairs (default: stdout)')
+    parser.add_argument('--summary', metavar='PATH', help='write per-branch counts as JSON')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='branches listed per rule set (0 = all)')
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.rules.split(',') if name.strip()]
+    unknown = [name for name in names if name not in RULE_SETS]
+    if unknown or len(names) < 2:
+        parser.error(f"--rules needs two or more of {', '.join(RULE_SETS)}")
+
+    start = time.perf_counter()
+    entries = load_word_content_cached(args.source)
+    counts = {}
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    differing = 0
+    try:
+        for pair in diff_rule_sets(entries, [RULE_SETS[name] for name in names], counts):
+            out.write(json.dumps(pair, ensure_ascii=False) + "\n")
+            differing += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    pairs = sum(total for total, _ in counts[names[0]].values())
+    log = sys.stderr
+    print(f"✓ {differing} of {pairs} pairs differ across {', '.join(names)} ({elapsed:.2f}s)", file=log)
+    for name, tally in counts.items():
+        print(f"\n  {name}:", file=log)
+        ranked = sorted(tally.items(), key=lambda item: (-item[1][1], -item[1][0]))
+        for (group, branch), (total, diff) in ranked[:args.limit] if args.limit > 0 else ranked:
+            if total:
+                print(f"    {diff:>8} / {total:<8} {group} → {branch}", file=log)
+
+    if args.summary:
+        with atomic_write(args.summary) as summary:
+            summary.write(json.dumps(summary_json(counts, pairs, differing, elapsed), indent=2) + "\n")
+        print(f"\n✓ Wrote {args.summary}", file=log)
+
+
+if __name__ == '__main__':
+    main()
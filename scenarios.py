@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Hand-written "Category → scenario" example files such as update_examples.txt.
+
+Usage: python3 scenarios.py [PATH ...]   (prints the parsed map)
+
+Each line that contains an arrow (`→`, or `->`) maps a category to one
+scenario sentence; anything else (headings, blank lines) is ignored. When
+several files are loaded, or a category repeats, the later line wins.
+
+ScenarioMap looks scenarios up by normalized category name ("team
+project" finds "Team Project"), caching the answer per distinct category,
+so merging scenarios into a whole corpus costs one dict lookup per
+word × category pair however many scenario lines there are.
+"""
+import hashlib
+import os
+import re
+import sys
+
+from corpus_index import normalize
+
+SCENARIOS_PATH = 'update_examples.txt'
+
+_LINE = re.compile(r'^\s*(?P<category>[^→]+?)\s*(?:→|->)\s*(?P<scenario>\S.*?)\s*$')
+
+
+def parse_scenarios(lines):
+    """Yield (category, scenario) for every scenario line in `lines`."""
+    for line in lines:
+        match = _LINE.match(line)
+        if match:
+            yield match.group('category'), match.group('scenario')
+
+
+def load_scenarios(paths=(SCENARIOS_PATH,)):
+    """{category: scenario} from one or more scenario files, in order."""
+    scenarios = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            scenarios.update(parse_scenarios(f))
+    return scenarios
+
+
+def default_scenario_paths():
+    """[update_examples.txt] when it exists, else no scenario files."""
+    return [SCENARIOS_PATH] if os.path.exists(SCENARIOS_PATH) else []
+
+
+class ScenarioMap:
+    """Scenarios by category, matched on the normalized name."""
+
+    def __init__(self, scenarios):
+        self.scenarios = dict(scenarios)
+        self._normalized = {normalize(category): scenario for category, scenario in self.scenarios.items()}
+        self._matched = {}
+
+    @classmethod
+    def load(cls, paths):
+        return cls(load_scenarios(paths))
+
+    def __len__(self):
+        return len(self.scenarios)
+
+    def get(self, category):
+        """The scenario for `category`, or None."""
+        try:
+            return self._matched[category]
+        except KeyError:
+            scenario = self._matched[category] = self._normalized.get(normalize(category))
+            return scenario
+
+    def digest(self, digest, categories, authored=()):
+        """`digest` extended with the scenarios `categories` without an authored
+        example pick up; unchanged when they pick up none."""
+        picked = [f"{category}\0{self.get(category)}" for category in categories
+                  if category not in authored and self.get(category) is not None]
+        if not picked:
+            return digest
+        return hashlib.sha1('\n'.join([digest, *picked]).encode('utf-8')).hexdigest()
+
+
+if __name__ == '__main__':
+    scenarios = load_scenarios(sys.argv[1:] or (SCENARIOS_PATH,))
+    for category, scenario in scenarios.items():
+        print(f"{category} → {scenario}")
+    print(f"{len(scenarios)} scenarios", file=sys.stderr)
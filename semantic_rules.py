@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Pick rule branches by vector similarity instead of literal substrings.
+
+Usage: python3 semantic_rules.py [--rules comprehensive] [--threshold 0.5]
+                                 [--semantic-only] [--source PATH] [--samples 10]
+
+The cascade only fires on literal keywords ('team' in the category, 'feel'
+in the definition), so a "Friendship" category or a definition about
+"affinity" falls through to the generic "When X shapes Y". SemanticRules
+scores every (word, category) pair against every branch of a RuleSet:
+
+  definitions   hashed TF-IDF rows (generate_exercises.DefinitionVectors)
+  categories    character trigrams of the name, plus the mean of the
+                definitions of the words that carry the category
+  groups        the mean definition of the words whose definitions contain
+                one of the group's keywords, plus the keywords themselves
+  branches      the trigrams of each keyword (best keyword wins), plus the
+                mean of the categories that contain one of them
+
+A pair's score for branch (g, b) is cos(definition, group g) + cos(category,
+branch b), so the whole corpus is scored with one definition × group and
+one category × branch matrix product, gathered per pair in blocks. The
+top branch is kept when its score reaches the threshold, else the rule
+set's default applies.
+
+By default a literal cascade hit is kept as is, and when the cascade
+matched a group but none of its branches, only that group's branches are
+considered; scoring only rescues pairs the cascade sends to a default.
+--semantic-only scores every pair freely. Needs numpy.
+"""
+import argparse
+import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # optional: the script reports it and exits without it
+    np = None
+
+from corpus_cache import load_word_content_cached
+from corpus_index import normalize
+from example_rules import COMPREHENSIVE_RULES, RULE_SETS, CompiledRuleSets
+from generate_exercises import DEFAULT_DIM, DefinitionVectors
+from word_content import WORD_CONTENT_PATH
+
+DEFAULT_THRESHOLD = 0.5
+NAME_DIM = 256
+# Pairs scored per block: block × branches float32 scores in memory.
+PAIR_BLOCK = 1 << 16
+DEFAULT_SAMPLES = 10
+
+
+def name_trigrams(name):
+    padded = f"  {normalize(name)} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def hashed_rows(feature_lists, dim=NAME_DIM):
+    """L2-normalized float32 rows of signed, hashed feature counts."""
+    rows = np.zeros((len(feature_lists), dim), dtype=np.float32)
+    for i, features in enumerate(feature_lists):
+        for feature in features:
+            digest = zlib.crc32(feature.encode('utf-8'))
+            rows[i, (digest >> 1) % dim] += 1.0 if digest & 1 else -1.0
+    return _normalized(rows)
+
+
+def _normalized(rows):
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return rows / norms
+
+
+def _mean_rows(matrix, members, count):
+    """Row i is the normalized mean of matrix[members[i]] (zeros when empty)."""
+    out = np.zeros((count, matrix.shape[1]), dtype=np.float32)
+    for i, rows in enumerate(members):
+        if rows:
+            out[i] = matrix[rows].sum(axis=0)
+    return _normalized(out)
+
+
+class SemanticRules:
+    """A RuleSet whose branches are chosen by similarity to corpus-fit prototypes."""
+
+    def __init__(self, rules, records, dim=DEFAULT_DIM, threshold=DEFAULT_THRESHOLD):
+        """`records` are (word, definition, categories); a word's last record wins."""
+        self.rules = rules
+        self.threshold = threshold
+        latest = {}
+        for word, definition, categories in records:
+            latest[word] = (definition, list(dict.fromkeys(categories)))
+        self.words = list(latest)
+        self.word_definitions = [definition for definition, _ in latest.values()]
+        self.word_categories = [categories for _, categories in latest.values()]
+
+        # Branches flattened to one column each, in cascade order.
+        self.branch_group = []
+        self.branch_templates = []
+        self.group_offsets = []
+        for g, (_, _, branches) in enumerate(rules.groups):
+            self.group_offsets.append(len(self.branch_group))
+            for _, template in branches:
+                self.branch_group.append(g)
+                self.branch_templates.append(template)
+        self.branch_group = np.array(self.branch_group, dtype=np.int64)
+        self.group_offsets = np.array(self.group_offsets + [len(self.branch_group)], dtype=np.int64)
+
+        start = time.perf_counter()
+        self._fit(dim)
+        self.fit_seconds = time.perf_counter() - start
+
+    def _fit(self, dim):
+        rules = self.rules
+        groups = rules.groups
+        # Definitions: one row per distinct text, then one per group's keywords.
+        text_ids = {}
+        self.word_texts = np.array(
+            [text_ids.setdefault(definition, len(text_ids)) for definition in self.word_definitions],
+            dtype=np.int64)
+        texts = list(text_ids) + [' '.join(keywords) for _, keywords, _ in groups]
+        vectors = DefinitionVectors(texts, dim)
+        matrix = vectors.matrix(np.arange(len(texts)))
+        definitions, keyword_rows = matrix[:len(text_ids)], matrix[len(text_ids):]
+
+        # Categories: name trigrams and the mean definition of their words.
+        category_ids = {}
+        members = []
+        for word_id, categories in enumerate(self.word_categories):
+            for category in categories:
+                index = category_ids.setdefault(category, len(category_ids))
+                if index == len(members):
+                    members.append([])
+                members[index].append(self.word_texts[word_id])
+        self.category_ids = category_ids
+        names = list(category_ids)
+        category_names = hashed_rows([name_trigrams(name) for name in names])
+        category_usage = _mean_rows(definitions, members, len(names))
+
+        # Literal hits seed the prototypes; this is where the synonyms come
+        # from: a category or definition that never uses a keyword still
+        # sits close to the ones that do.
+        shared = CompiledRuleSets([rules])
+        definition_hits = [[] for _ in groups]
+        for text, definition in enumerate(text_ids):
+            for g in shared.group_hits(definition)[0]:
+                definition_hits[g].append(text)
+        group_usage = _mean_rows(definitions, definition_hits, len(groups))
+        group_prototypes = _normalized(group_usage + keyword_rows)
+
+        branch_hits = [[] for _ in self.branch_templates]
+        literal = np.full((len(names), len(groups) + 1), -1, dtype=np.int64)
+        for k, name in enumerate(names):
+            _, branches, _ = shared.resolve_category(name)
+            literal[k, :len(groups)] = branches[0][:len(groups)]
+            for g, branches_hit in enumerate(shared.branch_hits(name)[0]):
+                for b in branches_hit:
+                    branch_hits[self.group_offsets[g] + b].append(k)
+        branch_usage = _mean_rows(category_usage, branch_hits, len(branch_hits))
+
+        keywords, keyword_branch = [], []
+        for j, (g, (keyword_list, _)) in enumerate(
+                (g, branch) for g, (_, _, branches) in enumerate(groups) for branch in branches):
+            keywords.extend(keyword_list)
+            keyword_branch.extend([j] * len(keyword_list))
+        keyword_names = hashed_rows([name_trigrams(keyword) for keyword in keywords])
+
+        # The two matrix products everything else is gathered from.
+        self.definition_scores = definitions @ group_prototypes.T
+        name_scores = category_names @ keyword_names.T
+        best_name = np.full((len(names), len(branch_hits)), -np.inf, dtype=np.float32)
+        np.maximum.at(best_name.T, np.array(keyword_branch), name_scores.T)
+        self.category_scores = 0.5 * best_name + 0.5 * (category_usage @ branch_usage.T)
+
+        self.literal_branches = literal
+        text_groups = np.array([shared.groups_for(definition)[0] for definition in text_ids], dtype=np.int64)
+        self.word_groups = text_groups[self.word_texts]
+
+    def pairs(self):
+        """(word ids, category ids) of every pair, word by word."""
+        words, categories = [], []
+        for word_id, word_categories in enumerate(self.word_categories):
+            words.extend([word_id] * len(word_categories))
+            categories.extend(self.category_ids[category] for category in word_categories)
+        return np.array(words, dtype=np.int64), np.array(categories, dtype=np.int64)
+
+    def choose(self, words, categories, literal=True):
+        """(branch column or -1 for the default, score, literal branch column) per pair."""
+        chosen = np.empty(len(words), dtype=np.int64)
+        scores = np.empty(len(words), dtype=np.float32)
+        literal_columns = np.empty(len(words), dtype=np.int64)
+        branch_group = self.branch_group
+        for start in range(0, len(words), PAIR_BLOCK):
+            w, k = words[start:start + PAIR_BLOCK], categories[start:start + PAIR_BLOCK]
+            groups = self.word_groups[w]
+            block = self.definition_scores[self.word_texts[w]][:, branch_group] + self.category_scores[k]
+            branches = self.literal_branches[k, groups]
+            hit = (groups >= 0) & (branches >= 0)
+            literal_column = np.where(hit, self.group_offsets[np.maximum(groups, 0)] + branches, -1)
+            if literal:
+                # A definition that matched a group keeps the cascade's group.
+                np.putmask(block, (groups[:, None] >= 0) & (branch_group[None, :] != groups[:, None]), -np.inf)
+            best = block.argmax(axis=1)
+            score = block[np.arange(len(best)), best]
+            pick = np.where(score >= self.threshold, best, -1)
+            if literal:
+                pick = np.where(hit, literal_column, pick)
+            chosen[start:start + len(w)] = pick
+            scores[start:start + len(w)] = score
+            literal_columns[start:start + len(w)] = literal_column
+        return chosen, scores, literal_columns
+
+    def generate_all(self, literal=True):
+        """{word: {category: example}} for the fitted records."""
+        words, categories = self.pairs()
+        chosen, _, _ = self.choose(words, categories, literal)
+        names = list(self.category_ids)
+        templates = self.branch_templates + [self.rules.default]
+        examples = {word: {} for word in self.words}
+        for w, k, j in zip(words.tolist(), categories.tolist(), chosen.tolist()):
+            word, category = self.words[w], names[k]
+            examples[word][category] = templates[j].format(word=word, category=category.lower())
+        return examples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score rule branches by similarity and report the rescued pairs')
+    parser.add_argument('--source', default=WORD_CONTENT_PATH)
+    parser.add_argument('--rules', default=COMPREHENSIVE_RULES.name, choices=list(RULE_SETS))
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--semantic-only', action='store_true', help='ignore literal cascade hits')
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help='rescued pairs to show')
+    args = parser.parse_args()
+    if np is None:
+        parser.error('numpy is required (pip install numpy)')
+
+    entries = load_word_content_cached(args.source)
+    rules = RULE_SETS[args.rules]
+    engine = SemanticRules(rules, [(e.word, e.definition, e.categories) for e in entries if e.categories],
+                           threshold=args.threshold)
+    start = time.perf_counter()
+    words, categories = engine.pairs()
+    chosen, scores, literal = engine.choose(words, categories, literal=not args.semantic_only)
+    elapsed = time.perf_counter() - start
+
+    total = len(chosen)
+    if not total:
+        print(f"No (word, category) pairs in {args.source}")
+        return
+    literal_defaults = int((literal < 0).sum())
+    semantic_defaults = int((chosen < 0).sum())
+    print(f"✓ {total} pairs scored against {len(engine.branch_templates)} {rules.name} branches "
+          f"(fit {engine.fit_seconds:.2f}s, score {elapsed:.2f}s)")
+    print(f"  generic default: cascade {literal_defaults / total:.1%} → semantic {semantic_defaults / total:.1%}")
+    if args.semantic_only:
+        hits = literal >= 0
+        agree = int((chosen[hits] == literal[hits]).sum())
+        print(f"  agrees with {agree} of {int(hits.sum())} literal cascade hits")
+
+    rescued = np.flatnonzero((literal < 0) & (chosen >= 0))
+    if args.samples and len(rescued):
+        names = list(engine.category_ids)
+        print("\nRescued pairs:")
+        for i in rescued[np.argsort(-scores[rescued], kind='stable')][:args.samples]:
+            word, category = engine.words[words[i]], names[categories[i]]
+            example = engine.branch_templates[chosen[i]].format(word=word, category=category.lower())
+            print(f"  {scores[i]:.2f}  {word} / {category}: {example}")
+
+
+if __name__ == '__main__':
+    main()
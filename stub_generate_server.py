@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Local stand-in for the app's POST /api/generate route.
+
+Usage: python3 stub_generate_server.py [--port 3999] [--latency 0.2]
+                                       [--jitter 0.1] [--fail-rate 0.05]
+                                       [--malformed-rate 0.05]
+
+Speaks the same contract as app/api/generate/route.ts: a JSON body with
+`prompt` and optional `max_tokens`, answered with the upstream completion
+JSON ({"completion": ...}) or {"error": ...} and a non-2xx status. Replies
+are canned from the prompt: a single-pair prompt's `Word:` and `Category:`
+lines become a "When ..." sentence, and a packed prompt's numbered items
+become the structured {"examples": [...]} reply model_prompts.py asks for.
+Latency, jitter, a share of 429/503 responses (with Retry-After) and a
+share of malformed packed entries mimic the real proxy under load.
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROUTE = '/api/generate'
+_FIELD = re.compile(r'^(Word|Category|Definition): *(.*)$', re.MULTILINE)
+_PACKED_ITEM = re.compile(r'^(\d+)\. Word: (.*?) \| Definition: .*? \| Category: (.*)$', re.MULTILINE)
+
+
+def _sentence(word, category):
+    return f"When {word} comes up in {category.lower()}, people notice the difference"
+
+
+def stub_completion(prompt, rng=None, malformed_rate=0.0):
+    """Canned completion: one sentence, or a JSON reply for a packed prompt.
+
+    With `malformed_rate`, that share of packed entries is dropped, loses
+    its "When" or gets a bad id, and the same share of whole replies is
+    cut off mid-JSON.
+    """
+    items = _PACKED_ITEM.findall(prompt)
+    if not items:
+        fields = dict(_FIELD.findall(prompt))
+        return " " + _sentence(fields.get('Word', 'it'), fields.get('Category', 'everyday life'))
+
+    rng = rng or random.Random(0)
+    examples = []
+    for item_id, word, category in items:
+        entry = {'id': int(item_id), 'example': _sentence(word, category)}
+        if rng.random() < malformed_rate:
+            damage = rng.randrange(3)
+            if damage == 0:
+                continue
+            if damage == 1:
+                entry['example'] = entry['example'][len('When '):]
+            else:
+                entry['id'] = str(entry['id'])
+        examples.append(entry)
+    reply = json.dumps({'examples': examples}, indent=1)
+    if rng.random() < malformed_rate:
+        reply = reply[:len(reply) // 2]
+    return " " + reply
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status, payload, headers=()):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path != ROUTE:
+            return self._reply(404, {'error': f"no route {self.path}"})
+        try:
+            request = json.loads(body)
+            prompt = request['prompt']
+        except (ValueError, KeyError, TypeError) as err:
+            return self._reply(500, {'error': f"bad request body: {err}"})
+
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            delay = server.latency + server.rng.uniform(0, server.jitter)
+            failure = server.rng.random() < server.fail_rate
+            status = server.rng.choice((429, 503)) if failure else 200
+            completion = None if failure else server.respond(prompt, server.rng, server.malformed_rate)
+        time.sleep(delay)
+        if failure:
+            return self._reply(status, {'error': 'stub: simulated overload'}, [('Retry-After', '0.05')])
+        self._reply(200, {
+            'completion': completion,
+            'stop_reason': 'stop_sequence',
+            'model': 'stub',
+        })
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), latency=0.0, jitter=0.0, fail_rate=0.0,
+                 malformed_rate=0.0, seed=0, respond=stub_completion, verbose=False):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.malformed_rate = malformed_rate
+        self.rng = random.Random(seed)
+        self.respond = respond
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def handle_error(self, request, client_address):
+        # Clients hanging up mid-reply (an interrupted run) are routine here.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{ROUTE}"
+
+    def start(self):
+        """Serve from a daemon thread; returns self for `with` use."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        super().__exit__(*exc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stub of POST /api/generate')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3999)
+    parser.add_argument('--latency', type=float, default=0.2, help='seconds per request (default: 0.2)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='extra uniform random latency')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='share of 429/503 replies')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='share of malformed packed entries')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), args.latency, args.jitter, args.fail_rate, args.malformed_rate,
+                        verbose=args.verbose)
+    print(f"✓ Stub /api/generate listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
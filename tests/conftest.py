@@ -0,0 +1,6 @@
+"""The pipeline scripts live at the repository root; import them from there."""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,88 @@
+import os
+import shutil
+
+import pytest
+
+from conftest import ROOT
+from content_watch import IncrementalCorpus, word_records
+from word_content import WORD_CONTENT_PATH, iter_word_content, read_source
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = tmp_path / 'wordContent.ts'
+    shutil.copy(os.path.join(ROOT, WORD_CONTENT_PATH), path)
+    return str(path)
+
+
+def assert_matches_full_parse(corpus):
+    entries = list(iter_word_content(read_source(corpus.path)))
+    assert corpus.records == word_records(entries)
+    assert [e.word for e in corpus.entries] == [e.word for e in entries]
+    assert corpus.starts == [e.start for e in entries]
+    assert corpus.ends == [e.end for e in entries]
+
+
+def rewrite(path, edit):
+    with open(path, 'rb') as f:
+        source = f.read()
+    with open(path, 'wb') as f:
+        f.write(edit(source))
+
+
+def block(source, index):
+    entry = list(iter_word_content(source))[index]
+    return entry, source[entry.start:entry.end]
+
+
+def unique_block(source, index):
+    """The first entry from `index` on whose word is defined only once."""
+    entries = list(iter_word_content(source))
+    words = [e.word for e in entries]
+    entry = next(e for e in entries[index:] if words.count(e.word) == 1)
+    return entry, source[entry.start:entry.end]
+
+
+def test_edit_inside_a_block(source_path):
+    corpus = IncrementalCorpus(source_path)
+    # A word defined twice takes its record from the later entry.
+    entry, _ = unique_block(corpus.source, 5)
+    _, value_start, value_end = entry.spans['definition']
+    rewrite(source_path, lambda s: s[:value_start] + b"'A new definition.'" + s[value_end:])
+    assert corpus.reload() == {entry.word}
+    assert corpus.last_parse == 'partial'
+    assert corpus.records[entry.word][1] == 'A new definition.'
+    assert_matches_full_parse(corpus)
+
+
+def test_insert_and_delete_blocks(source_path):
+    corpus = IncrementalCorpus(source_path)
+    entry, text = block(corpus.source, 10)
+    copy = text.replace(f"'{entry.word}'".encode('utf-8'), b"'freshly-added'", 1)
+    rewrite(source_path, lambda s: s[:entry.end] + b',\n  ' + copy + s[entry.end:])
+    assert corpus.reload() == {'freshly-added'}
+    assert_matches_full_parse(corpus)
+
+    victim, _ = block(corpus.source, 3)
+    # Drop the block and the separator up to the next one.
+    rewrite(source_path, lambda s: s[:victim.start] + s[s.index(b'{', victim.end):])
+    assert victim.word in corpus.reload()
+    assert_matches_full_parse(corpus)
+
+
+@pytest.mark.parametrize('index', [0, -1])
+def test_edit_first_and_last_block(source_path, index):
+    corpus = IncrementalCorpus(source_path)
+    entry, _ = block(corpus.source, index)
+    category = entry.categories[0].encode('utf-8')
+    rewrite(source_path, lambda s: s[:entry.start] + s[entry.start:entry.end].replace(category, b'Renamed', 1)
+            + s[entry.end:])
+    assert corpus.reload() == {entry.word}
+    assert_matches_full_parse(corpus)
+
+
+def test_reload_without_changes(source_path):
+    corpus = IncrementalCorpus(source_path)
+    os.utime(source_path)
+    assert corpus.reload() == set()
+    assert_matches_full_parse(corpus)
@@ -0,0 +1,78 @@
+import pytest
+
+import example_cache
+from example_cache import ExampleCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(example_cache, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'examples.sqlite')
+
+
+def test_round_trip(path, clock):
+    with ExampleCache(path) as cache:
+        cache.put_many([('a', 'w', 'c', 'example a'), ('b', 'w', 'd', 'example b')])
+        assert cache.get_many(['a', 'b', 'c']) == {'a': 'example a', 'b': 'example b'}
+    with ExampleCache(path) as cache:
+        assert cache.get('a') == 'example a'
+        assert cache.stats['disk_hits'] == 1
+
+
+def test_ttl_expires_memory_and_disk(path, clock):
+    cache = ExampleCache(path, ttl=60)
+    cache.put('a', 'w', 'c', 'example')
+    clock.now += 30
+    assert cache.get('a') == 'example'
+    assert cache.stats['memory_hits'] == 1
+
+    clock.now += 31
+    assert cache.get('a') is None
+    assert cache.stats['expired'] == 1
+    assert len(cache) == 0
+    cache.close()
+
+    with ExampleCache(path, ttl=60) as cache:
+        cache.put('b', 'w', 'c', 'example')
+    clock.now += 61
+    with ExampleCache(path, ttl=60) as cache:
+        assert cache.get('b') is None
+
+
+def test_evicts_least_recently_used(path, clock):
+    with ExampleCache(path, max_entries=2) as cache:
+        for key in 'abc':
+            cache.put(key, 'w', key, f"example {key}")
+            clock.now += 1
+        # Reading 'a' makes it the most recently used, so 'b' goes first.
+        assert cache.get('a') == 'example a'
+    with ExampleCache(path, max_entries=2) as cache:
+        assert cache.get_many(['a', 'b', 'c']) == {'a': 'example a', 'c': 'example c'}
+
+
+def test_close_without_evict_keeps_rows(path, clock):
+    with ExampleCache(path, ttl=60) as cache:
+        cache.put('a', 'w', 'c', 'example')
+    clock.now += 120
+    cache = ExampleCache(path, ttl=60)
+    cache.close(evict=False)
+    cache = ExampleCache(path, ttl=60)
+    assert len(cache) == 1
+    cache.close()
+    cache = ExampleCache(path, ttl=60)
+    assert len(cache) == 0
+    cache.close()
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from conftest import ROOT
+from example_rules import RULE_SETS
+from word_content import WORD_CONTENT_PATH, load_word_content
+
+# Definitions and categories that reach every kind of branch: keyword hits
+# in either text, hits only in one of them, case and punctuation, and none.
+EXTRA_PAIRS = [
+    ('synergy', 'Working with a TEAM, together.', 'Team Project'),
+    ('grit', 'How you feel when you persist', 'Personal Growth'),
+    ('x', '', ''),
+    ('x', 'nothing matches here', 'Quantum Basket Weaving'),
+]
+
+
+@pytest.fixture(scope='module')
+def pairs():
+    entries = load_word_content(os.path.join(ROOT, WORD_CONTENT_PATH))
+    corpus = [(e.word, e.definition, c) for e in entries for c in e.categories]
+    assert corpus
+    return corpus + EXTRA_PAIRS
+
+
+@pytest.mark.parametrize('name', sorted(RULE_SETS))
+def test_compiled_matches_cascade(name, pairs):
+    rules = RULE_SETS[name]
+    compiled = rules.compile()
+    for word, definition, category in pairs:
+        assert compiled.generate(word, definition, category) == rules.cascade(word, definition, category), \
+            (word, definition, category)
@@ -0,0 +1,101 @@
+import pytest
+
+from inject_examples import inject_examples, plan_splices
+from word_content import ParseError, decode_string, encode_string, iter_word_content
+
+SOURCE = b"""export interface WordContent {
+  word: string;
+}
+
+export const wordDatabase: WordContent[] = [
+  // WORK CLUSTER
+  {
+    word: 'synergy',
+    cluster: 'Work',
+    definition: 'When skills combine. It\\'s more than the sum.',
+    exercise: { question: 'q', options: [{ id: 'A', text: "say \\"hi\\"" }], correctAnswer: 'A' },
+    anchor: {
+      prompt: 'When?',
+      categories: ['Team Project', 'Collaboration']
+    }
+  },
+  {
+    word: 'wane',
+    cluster: "Literary",
+    definition: `To decrease
+gradually`,
+    anchor: {
+      prompt: 'When?',
+      categories: ['Change'],
+      examples: {
+        'Change': 'My enthusiasm can wane \\u2014 and return.'
+      }
+    }
+  },
+];
+"""
+
+TRICKY = ["it's", 'say "hi"', 'back\\slash', 'line\nbreak', 'tab\there', 'café — \U0001f600', '']
+
+
+def test_parse_records():
+    entries = list(iter_word_content(SOURCE))
+    assert [e.word for e in entries] == ['synergy', 'wane']
+    synergy, wane = entries
+    assert synergy.definition == "When skills combine. It's more than the sum."
+    assert synergy.exercise['options'] == [{'id': 'A', 'text': 'say "hi"'}]
+    assert synergy.categories == ['Team Project', 'Collaboration']
+    assert synergy.anchor.examples is None
+    assert wane.definition == 'To decrease\ngradually'
+    assert wane.examples == {'Change': 'My enthusiasm can wane — and return.'}
+    assert SOURCE[synergy.start:synergy.start + 1] == b'{' and SOURCE[synergy.end - 1:synergy.end] == b'}'
+
+
+@pytest.mark.parametrize('value', TRICKY)
+def test_string_round_trip(value):
+    literal = encode_string(value)
+    assert decode_string(literal.encode('utf-8')) == value
+    source = f"const words = [{{ word: {literal}, definition: {literal} }}];".encode('utf-8')
+    (entry,) = iter_word_content(source)
+    assert entry.word == value and entry.definition == value
+
+
+@pytest.mark.parametrize('raw, value', [
+    (rb"'\x41B\u{43}'", 'ABC'),
+    (rb"'a\
+b'", 'ab'),
+    (rb"'\q'", 'q'),
+    (rb'"\0\v"', '\0\v'),
+])
+def test_escapes(raw, value):
+    assert decode_string(raw) == value
+
+
+@pytest.mark.parametrize('cut', [
+    SOURCE.index(b"'Collaboration'") + 5,   # inside a string
+    SOURCE.index(b'anchor: {') + 9,         # inside an object
+    len(SOURCE) - 4,                        # before the closing bracket
+])
+def test_truncated_source_raises(cut):
+    with pytest.raises(ParseError):
+        list(iter_word_content(SOURCE[:cut]))
+
+
+def test_inject_is_idempotent():
+    word_examples = {
+        'synergy': {'examples': {'Team Project': "When synergy isn't luck", 'Collaboration': 'When it clicks'}},
+        'wane': {'examples': {'Change': 'overwritten?', 'Loss': 'When hope begins to wane'}},
+    }
+    once = inject_examples(SOURCE, word_examples)
+    assert once != SOURCE
+    assert inject_examples(once, word_examples) == once
+    assert list(plan_splices(once, word_examples)) == []
+
+    synergy, wane = iter_word_content(once)
+    assert synergy.examples == word_examples['synergy']['examples']
+    # Authored examples win unless overwrite is set.
+    assert wane.examples == {'Change': 'My enthusiasm can wane — and return.', 'Loss': 'When hope begins to wane'}
+
+    overwritten = inject_examples(once, word_examples, overwrite=True)
+    assert inject_examples(overwritten, word_examples, overwrite=True) == overwritten
+    assert list(iter_word_content(overwritten))[1].examples['Change'] == 'overwritten?'
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Streaming TypeScript emitter for generated content modules.
+
+Entries are written straight to a buffered temp file next to the target and
+the temp file is renamed over the target only once it is complete, so the
+Next.js app never imports a half-written module and memory use does not
+depend on how many entries are emitted. A module whose bytes did not change
+is left untouched, so its mtime (and any bundler cache keyed on it) stays.
+
+Anchor examples are emitted as one module per cluster under
+lib/wordAnchorExamples/ plus an index.ts that maps each word to its shard
+and loads shards with dynamic import(), so the bundler can code-split them
+and a session only parses the clusters it touches. When the default tree
+is written the same shards are also published as precompressed JSON under
+public/content/ (see content_artifacts.py); index.ts fetches a shard from
+there through public/content/manifest.json and falls back to the bundled
+chunk when the manifest does not list it.
+"""
+import contextlib
+import hashlib
+import os
+import re
+import tempfile
+
+from build_manifest import combine_digests, file_digest
+from word_content import encode_string
+
+BUFFER_SIZE = 1 << 16
+ANCHOR_EXAMPLES_DIR = 'lib/wordAnchorExamples'
+# Where content_artifacts.py publishes the shards, as the app requests them.
+CONTENT_URL_PREFIX = '/content'
+ANCHOR_ARTIFACT_PREFIX = 'wordAnchorExamples/'
+MISC_SHARD = 'misc'
+
+
+class _HashingWriter:
+    """Text sink that writes UTF-8 to a binary file and hashes what it wrote."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._sha1 = hashlib.sha1()
+        self.discarded = False
+
+    def write(self, text):
+        self.write_bytes(text.encode('utf-8'))
+
+    def write_bytes(self, data):
+        self._sha1.update(data)
+        self._raw.write(data)
+
+    def hexdigest(self):
+        return self._sha1.hexdigest()
+
+    def discard(self):
+        """Drop everything written so far and leave the target untouched."""
+        self.discarded = True
+
+
+@contextlib.contextmanager
+def atomic_write(path):
+    """Open a writer whose output replaces `path` only if the block succeeds.
+
+    The temp file lives in the target's directory so the final os.replace()
+    is a same-filesystem rename. On any exception, or if the writer was
+    discard()ed, the temp file is removed and the existing target is left
+    untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=BUFFER_SIZE) as raw:
+            writer = _HashingWriter(raw)
+            yield writer
+            raw.flush()
+            os.fsync(raw.fileno())
+        if writer.discarded:
+            os.unlink(tmp_path)
+            return
+        # mkstemp creates the file 0600; keep the target readable like a normal write.
+        mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_record_module(path, name, entries, type_annotation='Record<string, Record<string, string>>'):
+    """Emit `const name: type = { word: { key: value } };` plus a default export.
+
+    `entries` is any iterable of (word, mapping) pairs and is consumed
+    lazily. Returns the sha1 of the module.
+    """
+    with atomic_write(path) as out:
+        out.write(f"const {name}: {type_annotation} = {{\n")
+        for word, mapping in entries:
+            out.write(f"  {encode_string(word)}: {{\n")
+            for key, value in mapping.items():
+                out.write(f"    {encode_string(key)}: {encode_string(value)},\n")
+            out.write("  },\n")
+        out.write(f"}};\n\nexport default {name};")
+        if out.hexdigest() == file_digest(path):
+            out.discard()
+    return out.hexdigest()
+
+
+def shard_name(cluster):
+    """Module name for a cluster: 'Daily Life' -> 'daily-life'."""
+    name = re.sub(r'[^a-z0-9]+', '-', (cluster or '').lower()).strip('-') or MISC_SHARD
+    return f"{name}-shard" if name == 'index' else name
+
+
+def _write_shard_index(path, word_shards, shards):
+    with atomic_write(path) as out:
+        out.write("// Generated by the anchor example generators; do not edit by hand.\n")
+        out.write("export type AnchorExamples = Record<string, string>;\n")
+        out.write("type Shard = Record<string, AnchorExamples>;\n\n")
+        out.write("export const wordShards: Record<string, string> = {\n")
+        for word in sorted(word_shards):
+            out.write(f"  {encode_string(word)}: {encode_string(word_shards[word])},\n")
+        out.write("};\n\n")
+        out.write("const shardLoaders: Record<string, () => Promise<{ default: Shard }>> = {\n")
+        for shard in shards:
+            out.write(f"  {encode_string(shard)}: () => import({encode_string('./' + shard)}),\n")
+        out.write("};\n\n")
+        out.write(
+            "type ContentManifest = Record<string, { path: string }>;\n\n"
+            "let contentManifest: Promise<ContentManifest> | undefined;\n"
+            "const loadedShards: Record<string, Promise<Shard>> = {};\n\n"
+            "async function fetchJson<T>(url: string): Promise<T> {\n"
+            "  const res = await fetch(url);\n"
+            "  if (!res.ok) throw new Error(`${url}: HTTP ${res.status}`);\n"
+            "  return res.json();\n"
+            "}\n\n"
+            "function loadContentManifest(): Promise<ContentManifest> {\n"
+            "  if (!contentManifest) {\n"
+            f"    contentManifest = fetchJson<ContentManifest>({encode_string(CONTENT_URL_PREFIX + '/manifest.json')})"
+            ".catch((err) => {\n"
+            "      contentManifest = undefined;\n"
+            "      throw err;\n"
+            "    });\n"
+            "  }\n"
+            "  return contentManifest;\n"
+            "}\n\n"
+            "// The published artifact (content-addressed, precompressed) when the\n"
+            "// manifest lists it, otherwise the chunk bundled with the app.\n"
+            "async function fetchShard(shard: string, loader: () => Promise<{ default: Shard }>): Promise<Shard> {\n"
+            "  try {\n"
+            f"    const artifact = (await loadContentManifest())[{encode_string(ANCHOR_ARTIFACT_PREFIX)} + shard];\n"
+            "    if (artifact) return await fetchJson<Shard>(artifact.path);\n"
+            "  } catch {\n"
+            "    // Fall through to the bundled chunk\n"
+            "  }\n"
+            "  return (await loader()).default;\n"
+            "}\n\n"
+            "export function loadShard(shard: string): Promise<Shard> {\n"
+            "  if (!loadedShards[shard]) {\n"
+            "    const loader = shardLoaders[shard];\n"
+            "    loadedShards[shard] = loader\n"
+            "      ? fetchShard(shard, loader).catch((err) => {\n"
+            "          // Forget a failed load so the next call retries it\n"
+            "          delete loadedShards[shard];\n"
+            "          throw err;\n"
+            "        })\n"
+            "      : Promise.resolve({});\n"
+            "  }\n"
+            "  return loadedShards[shard];\n"
+            "}\n\n"
+            "export async function loadAnchorExamples(word: string): Promise<AnchorExamples | undefined> {\n"
+            "  const shard = wordShards[word];\n"
+            "  return shard ? (await loadShard(shard))[word] : undefined;\n"
+            "}\n")
+        if out.hexdigest() == file_digest(path):
+            out.discard()
+    return out.hexdigest()
+
+
+def write_anchor_shard(directory, shard, entries):
+    """Write one shard module from (word, examples) pairs; returns its sha1."""
+    return write_record_module(os.path.join(directory, f"{shard}.ts"), 'wordAnchorExamples', entries)
+
+
+def write_anchor_index(directory, word_shards):
+    """Write index.ts for a {word: shard} map; returns its sha1."""
+    return _write_shard_index(os.path.join(directory, 'index.ts'), word_shards, sorted(set(word_shards.values())))
+
+
+def publishes(directory):
+    """Whether a tree written to `directory` is the one the app serves artifacts for."""
+    return os.path.abspath(directory) == os.path.abspath(ANCHOR_EXAMPLES_DIR)
+
+
+def write_word_anchor_examples(word_examples, clusters, directory=ANCHOR_EXAMPLES_DIR, publish=None):
+    """Write the sharded anchor examples from a {word: {category: example}} dict.
+
+    `clusters` maps word -> cluster and picks each word's shard; words
+    without one go to the misc shard. Shards no longer produced are removed.
+    With `publish` (by default, only when writing ANCHOR_EXAMPLES_DIR), the
+    shards also go to public/content/ as JSON artifacts. Returns a digest over every module, as
+    build_manifest.tree_digest() computes it from disk.
+    """
+    os.makedirs(directory, exist_ok=True)
+    word_shards = {word: shard_name(clusters.get(word)) for word in word_examples}
+    shards = sorted(set(word_shards.values()))
+    shard_words = {shard: sorted(word for word, name in word_shards.items() if name == shard) for shard in shards}
+    digests = {}
+    for shard, words in shard_words.items():
+        digests[f"{shard}.ts"] = write_anchor_shard(directory, shard, ((word, word_examples[word]) for word in words))
+    digests['index.ts'] = write_anchor_index(directory, word_shards)
+    for name in os.listdir(directory):
+        if name.endswith('.ts') and name not in digests:
+            os.unlink(os.path.join(directory, name))
+    if publish is None:
+        publish = publishes(directory)
+    if publish or publishes(directory):
+        # Imported here: content_artifacts builds on atomic_write above.
+        from content_artifacts import publish_anchor_examples
+        # Unpublished, the default tree withdraws the old artifacts so the
+        # app loads its bundled chunks rather than stale JSON.
+        publish_anchor_examples({
+            shard: {word: word_examples[word] for word in words} for shard, words in shard_words.items()
+        } if publish else {})
+    return combine_digests(digests)
@@ -1,3 +1,5 @@
+import generatedExercises from '@/lib/generatedExercises';
+
 interface ExerciseOption {
   id: string;
   text: string;
@@ -58,7 +60,9 @@ export function generateExerciseForWord(word: string, cluster: string): Exercise
     }
   };
 
-  return exercises[word] || {
+  // Words without a hand-written exercise use the generated one
+  // (generate_exercises.py), then a placeholder.
+  return exercises[word] || generatedExercises[word] || {
     question: `Which sentence best uses "${word}"?`,
     options: [
       { id: 'A', text: 'Option A (context-appropriate use)' },
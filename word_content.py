@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""Single-pass parser for the TypeScript object literals in data/*.ts.
+
+The content files only use a small subset of TypeScript: interface
+declarations, `const` declarations whose value is an object/array literal,
+strings, numbers and bare identifiers. This module tokenizes that subset in
+one forward pass over the raw bytes and turns every object literal carrying a
+`word:` key into a record, so every generator script shares one parser
+instead of re-scanning the file with its own DOTALL regexes.
+
+Offsets are byte offsets into the file as read from disk, which lets callers
+splice the original source without re-parsing it.
+"""
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+WORD_CONTENT_PATH = 'data/wordContent.ts'
+
+# Leading whitespace and comments are folded into each match, so every match
+# is exactly one token and group N holds it. Strings allow any backslash
+# escape, so `\'` inside a definition no longer terminates the literal.
+_STRING = rb"""'[^'\\\n]*(?:\\.[^'\\\n]*)*'|"[^"\\\n]*(?:\\.[^"\\\n]*)*"|`[^`\\]*(?:\\.[^`\\]*)*`"""
+_SKIP = rb"(?:\s+|//[^\n]*|/\*.*?\*/)*"
+_TOKEN = re.compile(_SKIP + rb"""
+    (?:
+        (""" + _STRING + rb""")
+      | (-?\d+(?:\.\d+)?)
+      | ([A-Za-z_$][\w$]*)
+      | (.)
+      | (\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+_STR, _NUM, _IDENT, _PUNCT, _EOF_GROUP = range(1, 6)
+
+# Fast path for the overwhelmingly common `key: 'string',` member, matched
+# from the start of the key in one step instead of four tokens.
+_STRING_MEMBER = re.compile(
+    rb"(?:([A-Za-z_$][\w$]*)|(" + _STRING + rb"))" + _SKIP + rb":" + _SKIP + rb"(" + _STRING + rb")"
+    + _SKIP + rb"(,)?",
+    re.DOTALL)
+
+_ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)", re.DOTALL)
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': ''}
+_LITERALS = {b'true': True, b'false': False, b'null': None, b'undefined': None}
+
+_EOF = 'eof'
+
+
+class ParseError(ValueError):
+    """Raised when the source leaves the supported object-literal subset."""
+
+    def __init__(self, message: str, data: bytes, offset: int):
+        line = data.count(b'\n', 0, offset) + 1
+        super().__init__(f"{message} at byte {offset} (line {line})")
+        self.offset = offset
+        self.line = line
+
+
+def _unescape_match(match: 're.Match[str]') -> str:
+    esc = match.group(1)
+    if esc[0] == 'u':
+        return chr(int(esc[2:-1] if esc[1] == '{' else esc[1:], 16))
+    if esc[0] == 'x' and len(esc) == 3:
+        return chr(int(esc[1:], 16))
+    return _SIMPLE_ESCAPES.get(esc, esc)
+
+
+def decode_string(raw: bytes) -> str:
+    """Decode a quoted string token (quotes included) into its value."""
+    text = raw[1:-1].decode('utf-8')
+    if '\\' in text:
+        text = _ESCAPE.sub(_unescape_match, text)
+    return text
+
+
+def encode_string(value: str) -> str:
+    """Quote a value as a single-quoted TypeScript string literal."""
+    escaped = (value.replace('\\', '\\\\')
+                    .replace("'", "\\'")
+                    .replace('\n', '\\n')
+                    .replace('\r', '\\r'))
+    return f"'{escaped}'"
+
+
+class TsObject(dict):
+    """An object literal: its members plus where they sit in the source.
+
+    `spans[key]` is `(key_start, value_start, value_end)`; `start`/`end`
+    cover the braces themselves.
+    """
+    __slots__ = ('start', 'end', 'spans')
+
+    def __init__(self, start: int):
+        super().__init__()
+        self.start = start
+        self.end = start
+        self.spans: Dict[str, Tuple[int, int, int]] = {}
+
+
+@dataclass
+class Anchor:
+    prompt: str
+    categories: List[str]
+    examples: Optional[Dict[str, str]]
+    start: int
+    end: int
+    spans: Dict[str, Tuple[int, int, int]] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class WordContent:
+    word: str
+    cluster: str
+    definition: str
+    exercise: Optional[dict]
+    anchor: Optional[Anchor]
+    start: int
+    end: int
+    spans: Dict[str, Tuple[int, int, int]] = field(default_factory=dict, repr=False)
+
+    @property
+    def categories(self) -> List[str]:
+        return self.anchor.categories if self.anchor else []
+
+    @property
+    def examples(self) -> Dict[str, str]:
+        return (self.anchor.examples or {}) if self.anchor else {}
+
+    @classmethod
+    def from_object(cls, obj: TsObject) -> 'WordContent':
+        anchor = obj.get('anchor')
+        if isinstance(anchor, TsObject):
+            anchor = Anchor(
+                prompt=anchor.get('prompt', ''),
+                categories=list(anchor.get('categories') or []),
+                examples=dict(anchor['examples']) if anchor.get('examples') is not None else None,
+                start=anchor.start,
+                end=anchor.end,
+                spans=anchor.spans,
+            )
+        else:
+            anchor = None
+        return cls(
+            word=obj['word'],
+            cluster=obj.get('cluster', ''),
+            definition=obj.get('definition', ''),
+            exercise=obj.get('exercise'),
+            anchor=anchor,
+            start=obj.start,
+            end=obj.end,
+            spans=obj.spans,
+        )
+
+
+class _Parser:
+    """Recursive-descent parser over the token stream.
+
+    Objects that carry a string `word` key are appended to `found` as soon as
+    they close, so callers can drain records element by element instead of
+    waiting for the whole declaration.
+    """
+
+    # Token kinds are 'str', 'num', 'ident', EOF, or the punctuation
+    # character itself, so punctuation checks are a single comparison.
+    _KINDS = {_STR: 'str', _NUM: 'num', _IDENT: 'ident', _EOF_GROUP: _EOF}
+
+    def __init__(self, data: bytes, offset: int = 0):
+        self.data = data
+        self.found: List[TsObject] = []
+        self.end = offset
+        self._match = _TOKEN.match
+        self.advance()
+
+    def advance(self) -> None:
+        self.prev_end = self.end
+        match = self._match(self.data, self.end)
+        group = match.lastindex
+        self.start, self.end = match.span(group)
+        if group == _PUNCT:
+            self.kind = chr(self.data[self.start])
+        else:
+            self.kind = self._KINDS[group]
+
+    def text(self) -> bytes:
+        return self.data[self.start:self.end]
+
+    def is_punct(self, char: str) -> bool:
+        return self.kind == char
+
+    def expect(self, char: str) -> None:
+        if self.kind != char:
+            self.error(f"expected {char!r}")
+        self.advance()
+
+    def error(self, message: str):
+        found = 'end of file' if self.kind == _EOF else repr(self.text().decode('utf-8', 'replace'))
+        raise ParseError(f"{message}, found {found}", self.data, self.start)
+
+    def value(self):
+        kind = self.kind
+        if kind == 'str':
+            value = decode_string(self.text())
+            self.advance()
+            return value
+        if kind == 'num':
+            raw = self.text()
+            self.advance()
+            return float(raw) if b'.' in raw else int(raw)
+        if kind == 'ident':
+            raw = self.text()
+            self.advance()
+            if raw in _LITERALS:
+                return _LITERALS[raw]
+            # Bare references such as INTELLECTUAL or Enum.MEMBER keep their name.
+            name = raw.decode()
+            while self.is_punct('.'):
+                self.advance()
+                if self.kind != 'ident':
+                    self.error("expected identifier after '.'")
+                name += '.' + self.text().decode()
+                self.advance()
+            return name
+        if self.is_punct('{'):
+            return self.object()
+        if self.is_punct('['):
+            return self.array()
+        self.error("expected a value")
+
+    def object(self) -> TsObject:
+        obj = TsObject(self.start)
+        self.advance()
+        while not self.is_punct('}'):
+            key_start = self.start
+            member = _STRING_MEMBER.match(self.data, key_start)
+            if member is not None:
+                ident, quoted, value, comma = member.groups()
+                key = ident.decode() if ident is not None else decode_string(quoted)
+                obj[key] = decode_string(value)
+                obj.spans[key] = (key_start, member.start(3), member.end(3))
+                self.end = member.end()
+                self.advance()
+                self.prev_end = member.end(3)
+                if comma is None:
+                    break
+                continue
+            if self.kind == 'str':
+                key = decode_string(self.text())
+            elif self.kind in ('ident', 'num'):
+                key = self.text().decode()
+            else:
+                self.error("expected a property name")
+            self.advance()
+            self.expect(':')
+            value_start = self.start
+            obj[key] = self.value()
+            obj.spans[key] = (key_start, value_start, self.prev_end)
+            if not self.is_punct(','):
+                break
+            self.advance()
+        obj.end = self.end
+        self.expect('}')
+        if isinstance(obj.get('word'), str):
+            self.found.append(obj)
+        return obj
+
+    def array(self) -> list:
+        items = []
+        self.advance()
+        while not self.is_punct(']'):
+            items.append(self.value())
+            if not self.is_punct(','):
+                break
+            self.advance()
+        self.expect(']')
+        return items
+
+    def skip_balanced(self) -> None:
+        depth = 0
+        while self.kind != _EOF:
+            if self.kind in ('{', '[', '('):
+                depth += 1
+            elif self.kind in ('}', ']', ')'):
+                depth -= 1
+            self.advance()
+            if depth == 0:
+                return
+
+
+def _iter_top_level(parser: _Parser) -> Iterator[object]:
+    """Yield each element of top-level array declarations (and every other
+    top-level value) as soon as it is parsed."""
+    while parser.kind != _EOF:
+        if parser.is_punct('='):
+            parser.advance()
+            if parser.is_punct('['):
+                parser.advance()
+                while not parser.is_punct(']'):
+                    yield parser.value()
+                    if not parser.is_punct(','):
+                        break
+                    parser.advance()
+                parser.expect(']')
+            else:
+                yield parser.value()
+        elif parser.kind in ('{', '[', '('):
+            # Interface bodies, type parameters and destructuring patterns.
+            parser.skip_balanced()
+        else:
+            parser.advance()
+
+
+def iter_word_objects(data: bytes) -> Iterator[TsObject]:
+    """Yield every object literal with a `word:` key, in source order.
+
+    Elements of top-level array declarations are yielded as soon as each one
+    is parsed, so memory stays proportional to a single element.
+    """
+    parser = _Parser(data)
+    found = parser.found
+    for _ in _iter_top_level(parser):
+        yield from found
+        found.clear()
+
+
+def iter_cluster_words(data: bytes) -> Iterator[Tuple[Optional[TsObject], TsObject]]:
+    """Yield (cluster, word object) for every `word:` object, in source order.
+
+    `cluster` is the top-level element whose `words` array holds the word,
+    as in vocabulary.ts, or None for words that are top-level elements
+    themselves, as in wordContent.ts.
+    """
+    parser = _Parser(data)
+    found = parser.found
+    for element in _iter_top_level(parser):
+        if found:
+            cluster = None
+            if isinstance(element, TsObject) and isinstance(element.get('words'), list):
+                cluster = element
+            for obj in found:
+                yield (None if obj is element else cluster), obj
+            found.clear()
+
+
+def iter_word_objects_between(data: bytes, start: int, end: int) -> Iterator[TsObject]:
+    """Yield the `word:` objects of consecutive array elements in data[start:end].
+
+    `start` must be the opening brace of an element of a top-level array.
+    Parsing stops after the first element that ends at or past `end`, so
+    callers re-parsing a slice of a larger file check that the last object
+    ends exactly at `end` before trusting the result.
+    """
+    parser = _Parser(data, start)
+    found = parser.found
+    while True:
+        if not parser.is_punct('{'):
+            parser.error("expected '{'")
+        parser.value()
+        yield from found
+        found.clear()
+        if parser.prev_end >= end or not parser.is_punct(','):
+            return
+        parser.advance()
+
+
+def iter_word_content(data: bytes) -> Iterator[WordContent]:
+    """Yield a WordContent record for every entry in wordContent.ts source."""
+    for obj in iter_word_objects(data):
+        yield WordContent.from_object(obj)
+
+
+def read_source(path: str = WORD_CONTENT_PATH) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_word_content(path: str = WORD_CONTENT_PATH) -> List[WordContent]:
+    """Parse a wordContent.ts-style file into WordContent records."""
+    return list(iter_word_content(read_source(path)))
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else WORD_CONTENT_PATH
+    entries = load_word_content(path)
+    with_anchor = sum(1 for e in entries if e.anchor)
+    with_examples = sum(1 for e in entries if e.examples)
+    print(f"Parsed {len(entries)} entries from {path}")
+    print(f"  - {with_anchor} with anchor categories")
+    print(f"  - {with_examples} with authored examples")